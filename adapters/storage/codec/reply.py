@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import json
+
 from navigator.core.entity.markup import Markup
 from typing import Any, Dict, Optional
 
@@ -21,5 +24,27 @@ class ReplyCodec:
             return Markup(kind=kind, data=payload)
         return None
 
+    @staticmethod
+    def digest(rm: Markup) -> str:
+        """Return a stable content hash identifying ``rm``."""
+
+        canonical = json.dumps(
+            [rm.kind, rm.data],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def refer(key: str) -> Dict[str, str]:
+        return {"ref": key}
+
+    @staticmethod
+    def referent(data: Any) -> Optional[str]:
+        ref = data.get("ref") if isinstance(data, dict) else None
+        return ref if isinstance(ref, str) else None
+
 
 __all__ = ["ReplyCodec"]
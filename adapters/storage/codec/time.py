@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
 from typing import Any
@@ -10,9 +10,10 @@ from typing import Any
 @dataclass(slots=True)
 class TimeCodec:
     telemetry: Telemetry | None = None
+    _channel: TelemetryChannel | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._channel: TelemetryChannel | None = (
+        self._channel = (
             self.telemetry.channel(__name__) if self.telemetry else None
         )
 
@@ -1,15 +1,27 @@
 """FSM-backed storage adapters."""
 
-from .chronicle import Chronicle
-from .keys import FSM_HISTORY_FIELD, FSM_LAST_ID_FIELD, FSM_NAMESPACE_KEY
+from .chronicle import Chronicle, ChronicleConfig
+from .chronicle_compression import HistoryCompressor
+from .chronicle_lazy import LazyHistory
+from .chronicle_markup import MarkupTable
+from .keys import FSM_HISTORY_FIELD, FSM_LAST_ID_FIELD, FSM_MARKUP_FIELD, FSM_NAMESPACE_KEY
 from .latest import Latest
+from .snapshot import StateSnapshot
 from .status import Status
+from .unit import NamespaceUnit
 
 __all__ = [
     "Chronicle",
+    "ChronicleConfig",
+    "HistoryCompressor",
+    "LazyHistory",
+    "MarkupTable",
     "Latest",
     "Status",
+    "NamespaceUnit",
+    "StateSnapshot",
     "FSM_NAMESPACE_KEY",
     "FSM_HISTORY_FIELD",
     "FSM_LAST_ID_FIELD",
+    "FSM_MARKUP_FIELD",
 ]
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from typing import Any, List, Sequence
 
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, HistoryDelta, replay
 from navigator.core.telemetry import Telemetry
 
+from .chronicle_compression import HistoryCompressor
+from .chronicle_lazy import LazyHistory
+from .chronicle_markup import MarkupTable
 from .chronicle_serializer import HistorySerializer
 from .chronicle_storage import ChronicleNamespace, ChronicleStorage
 from .chronicle_telemetry import ChronicleTelemetry
 from .context import StateContext
+from .unit import NamespaceUnit
+
+
+@dataclass(frozen=True, slots=True)
+class ChronicleConfig:
+    """Capture storage knobs and collaborators of :class:`Chronicle`."""
+
+    unit: NamespaceUnit | None = None
+    serializer: HistorySerializer | None = None
+    compressor: HistoryCompressor | None = None
+    intern: bool = False
 
 
 class Chronicle:
-    """Coordinate chronicle storage, serialisation and telemetry reporting."""
+    """Coordinate chronicle storage, serialisation and telemetry reporting.
+
+    ``recall`` returns a :class:`LazyHistory`, so only the entries a use case
+    touches are decoded and untouched records are archived as stored. With
+    ``intern`` enabled message markups are kept once in a :class:`MarkupTable`
+    next to the history and referenced by key from each record.
+    """
 
     def __init__(
         self,
@@ -20,29 +41,104 @@ class Chronicle:
         telemetry: Telemetry | None = None,
         *,
         storage: ChronicleStorage | None = None,
-        serializer: HistorySerializer | None = None,
         emitter: ChronicleTelemetry | None = None,
+        config: ChronicleConfig | None = None,
     ) -> None:
-        self._storage = storage or ChronicleStorage(state)
+        config = config or ChronicleConfig()
         self._telemetry = emitter or ChronicleTelemetry(telemetry)
-        self._serializer = serializer or HistorySerializer(telemetry)
+        self._storage = storage or ChronicleStorage(
+            state,
+            unit=config.unit,
+            compressor=config.compressor,
+            emitter=self._telemetry,
+        )
+        self._serializer = config.serializer or HistorySerializer(telemetry)
+        self._intern = config.intern
 
-    async def recall(self) -> List[Entry]:
+    async def recall(self) -> LazyHistory:
         namespace = await self._storage.read()
         raw = namespace.history()
         self._telemetry.loaded(len(raw))
-        return [
-            self._serializer.load(record, self._telemetry)
-            for record in raw
-            if isinstance(record, dict)
-        ]
-
-    async def archive(self, history: List[Entry]) -> None:
-        payload = [self._serializer.dump(entry) for entry in history]
+        serializer, _ = self._bind(namespace)
+        return LazyHistory.load(
+            (record for record in raw if serializer.accepts(record)),
+            lambda record: serializer.load(record, self._telemetry),
+        )
+
+    async def archive(self, history: Sequence[Entry]) -> None:
         namespace = await self._storage.read()
+        serializer, markups = self._bind(namespace)
+        payload = self._encode(history, serializer, markups)
         namespace.update_history(payload)
+        if markups is not None:
+            markups.recount(self._references(serializer, payload))
+            self._store_markups(namespace, markups)
         await self._storage.write(namespace)
         self._telemetry.saved(len(payload))
 
+    async def amend(self, delta: HistoryDelta) -> None:
+        namespace = await self._storage.read()
+        stored = namespace.history()
+        if len(stored) != delta.origin:
+            await self.archive(delta.history)
+            return
+        serializer, markups = self._bind(namespace)
+        pushed: List[Any] = []
+
+        def encode(entry: Entry) -> Any:
+            record = serializer.dump(entry)
+            pushed.append(record)
+            return record
+
+        payload = replay(delta, stored, encode)
+        namespace.update_history(payload)
+        if markups is not None:
+            kept = {id(record) for record in payload}
+            dropped = [record for record in (*stored, *pushed) if id(record) not in kept]
+            markups.retain(self._references(serializer, pushed))
+            markups.release(self._references(serializer, dropped))
+            self._store_markups(namespace, markups)
+        await self._storage.write(namespace)
+        self._telemetry.saved(len(payload))
+
+    def _bind(
+        self, namespace: ChronicleNamespace
+    ) -> tuple[HistorySerializer, MarkupTable | None]:
+        known = namespace.markups()
+        if not (self._intern or known):
+            return self._serializer, None
+        markups = MarkupTable(known)
+        return self._serializer.interning(markups, share=self._intern), markups
+
+    @staticmethod
+    def _encode(
+        history: Sequence[Entry],
+        serializer: HistorySerializer,
+        markups: MarkupTable | None,
+    ) -> List[Any]:
+        if not isinstance(history, LazyHistory):
+            return [serializer.dump(entry) for entry in history]
+        if markups is None:
+            return history.records(serializer.dump)
+        return history.records(
+            serializer.dump,
+            lambda record: all(key in markups for key in serializer.references(record)),
+        )
+
+    @staticmethod
+    def _references(serializer: HistorySerializer, records: Sequence[Any]) -> List[str]:
+        return [key for record in records for key in serializer.references(record)]
+
+    @staticmethod
+    def _store_markups(namespace: ChronicleNamespace, markups: MarkupTable) -> None:
+        markups.sweep()
+        namespace.update_markups(markups.dump())
 
-__all__ = ["Chronicle", "ChronicleNamespace", "ChronicleStorage", "ChronicleTelemetry", "HistorySerializer"]
+__all__ = [
+    "Chronicle",
+    "ChronicleConfig",
+    "ChronicleNamespace",
+    "ChronicleStorage",
+    "ChronicleTelemetry",
+    "HistorySerializer",
+]
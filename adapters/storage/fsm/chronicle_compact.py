@@ -0,0 +1,198 @@
+"""Compact positional encoding for chronicle history entries."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Final, List, Mapping, Optional
+
+from navigator.core.entity.history import Entry, Message
+from navigator.core.entity.markup import Markup
+from navigator.core.entity.media import MediaItem, MediaType
+from navigator.core.telemetry import Telemetry
+from navigator.core.value.content import Preview
+
+from .chronicle_serializer import HistorySerializer
+from .chronicle_telemetry import ChronicleTelemetry
+
+COMPACT_VERSION: Final[int] = 1
+
+# Message slots: id, ts, text, media, group, markup, preview, extra, extras, inline, automated,
+# fingerprint.
+# Required slots come first so trailing defaults can be dropped from the record.
+_REQUIRED_SLOTS: Final[int] = 2
+_MESSAGE_DEFAULTS: Final[tuple[Any, ...]] = (
+    None, None, None, None, None, None, None, None, True, None,
+)
+
+
+def _trim(record: List[Any], defaults: tuple[Any, ...], required: int) -> List[Any]:
+    size = len(record)
+    while size > required and record[size - 1] == defaults[size - 1 - required]:
+        size -= 1
+    return record[:size]
+
+
+def _slot(record: List[Any], index: int, default: Any = None) -> Any:
+    return record[index] if index < len(record) else default
+
+
+class CompactHistorySerializer(HistorySerializer):
+    """Store entries as versioned positional lists with epoch timestamps.
+
+    Records produced by :class:`HistorySerializer` remain readable, so
+    switching codecs does not require migrating existing FSM payloads.
+    """
+
+    def accepts(self, record: Any) -> bool:
+        return isinstance(record, (dict, list))
+
+    def references(self, record: Any) -> List[str]:
+        if not isinstance(record, list):
+            return super().references(record)
+        items = _slot(record, 4)
+        if not isinstance(items, list):
+            return []
+        return [
+            _slot(item, 5)
+            for item in items
+            if isinstance(item, list) and isinstance(_slot(item, 5), str)
+        ]
+
+    def dump(self, entry: Entry) -> List[Any]:
+        record: List[Any] = [COMPACT_VERSION, entry.state, entry.view, int(bool(entry.root))]
+        record.append([self._pack_message(message) for message in entry.messages])
+        return record
+
+    def load(self, data: Any, telemetry: ChronicleTelemetry) -> Entry:
+        if isinstance(data, Mapping):
+            return super().load(data, telemetry)
+        if not isinstance(data, list) or not data or data[0] != COMPACT_VERSION:
+            telemetry.error("history_entry_unknown_format", raw=str(data)[:64])
+            raise ValueError(f"History entry has unsupported layout: {str(data)[:64]!r}")
+        items = _slot(data, 4)
+        messages = [
+            self._unpack_message(record, telemetry)
+            for record in items or []
+            if isinstance(record, list)
+        ]
+        return Entry(
+            state=_slot(data, 1),
+            view=_slot(data, 2),
+            messages=messages,
+            root=bool(_slot(data, 3, 0)),
+        )
+
+    def _pack_message(self, message: Message) -> List[Any]:
+        record: List[Any] = [
+            message.id,
+            round(message.ts.timestamp() * 1000),
+            message.text,
+            self._pack_media(message.media),
+            [self._pack_media(item) for item in message.group] if message.group else None,
+            self._pack_reply(message.markup),
+            self._pack_preview(message.preview),
+            message.extra,
+            list(message.extras) or None,
+            message.inline,
+            message.automated,
+            message.fingerprint,
+        ]
+        return _trim(record, _MESSAGE_DEFAULTS, _REQUIRED_SLOTS)
+
+    def _unpack_message(self, record: List[Any], telemetry: ChronicleTelemetry) -> Message:
+        if len(record) < 2:
+            telemetry.error("history_message_missing_id")
+            raise ValueError("History message payload missing required 'id'")
+        ident = self._parse_identifier(record[0], telemetry)
+        stamp = record[1]
+        if not isinstance(stamp, int):
+            telemetry.error("history_message_invalid_ts", raw=str(stamp)[:64])
+            raise ValueError(f"History message payload has invalid 'ts': {stamp!r}")
+        return Message(
+            id=ident,
+            text=_slot(record, 2),
+            media=self._unpack_media(_slot(record, 3)),
+            group=self._unpack_group(_slot(record, 4)),
+            markup=self._unpack_reply(_slot(record, 5)),
+            preview=self._unpack_preview(_slot(record, 6)),
+            extra=_slot(record, 7),
+            extras=self._parse_extras(_slot(record, 8), telemetry),
+            inline=_slot(record, 9),
+            automated=bool(_slot(record, 10, True)),
+            ts=datetime.fromtimestamp(stamp / 1000, tz=timezone.utc),
+            fingerprint=_slot(record, 11),
+        )
+
+    def _pack_reply(self, markup: Optional[Markup]) -> Any:
+        if not markup:
+            return None
+        if self._share and self._markups is not None:
+            return self._markups.intern(markup)
+        return [markup.kind, markup.data]
+
+    def _unpack_reply(self, data: Any) -> Optional[Markup]:
+        if isinstance(data, str):
+            return self._markups.lookup(data) if self._markups is not None else None
+        if isinstance(data, list) and len(data) == 2 and isinstance(data[1], dict):
+            return Markup(kind=data[0], data=data[1])
+        return None
+
+    @staticmethod
+    def _pack_media(item: Optional[MediaItem]) -> Optional[List[Any]]:
+        if not item:
+            return None
+        record: List[Any] = [item.type.value, item.path]
+        if item.caption is not None:
+            record.append(item.caption)
+        return record
+
+    @staticmethod
+    def _unpack_media(data: Any) -> Optional[MediaItem]:
+        if not isinstance(data, list) or len(data) < 2:
+            return None
+        kind, identifier = data[0], data[1]
+        if not (isinstance(kind, str) and isinstance(identifier, str) and identifier):
+            return None
+        return MediaItem(type=MediaType(kind), path=identifier, caption=_slot(data, 2))
+
+    @classmethod
+    def _unpack_group(cls, data: Any) -> Optional[List[MediaItem]]:
+        if not isinstance(data, list):
+            return None
+        items = [cls._unpack_media(raw) for raw in data]
+        return [item for item in items if item is not None] or None
+
+    @staticmethod
+    def _pack_preview(preview: Optional[Preview]) -> Optional[List[Any]]:
+        if not preview:
+            return None
+        record: List[Any] = [
+            preview.url,
+            int(preview.small),
+            int(preview.large),
+            int(preview.above),
+            preview.disabled,
+        ]
+        return _trim(record, (None, 0, 0, 0, None), 0)
+
+    @staticmethod
+    def _unpack_preview(data: Any) -> Optional[Preview]:
+        if not isinstance(data, list):
+            return None
+        return Preview(
+            url=_slot(data, 0),
+            small=bool(_slot(data, 1, 0)),
+            large=bool(_slot(data, 2, 0)),
+            above=bool(_slot(data, 3, 0)),
+            disabled=_slot(data, 4),
+        )
+
+
+def create_serializer(codec: str, telemetry: Telemetry | None) -> HistorySerializer:
+    """Return the chronicle serializer matching the configured ``codec``."""
+
+    if codec == "compact":
+        return CompactHistorySerializer(telemetry)
+    return HistorySerializer(telemetry)
+
+
+__all__ = ["COMPACT_VERSION", "CompactHistorySerializer", "create_serializer"]
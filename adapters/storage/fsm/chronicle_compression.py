@@ -0,0 +1,95 @@
+"""Transparent zlib compression for stored chronicle payloads."""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import zlib
+from dataclasses import dataclass
+from typing import Any, Final, List, Mapping
+
+COMPRESSION_CODEC: Final[str] = "zlib"
+
+
+@dataclass(frozen=True, slots=True)
+class PackedHistory:
+    """Describe the stored form of a history payload."""
+
+    value: Any
+    raw: int
+    stored: int
+
+    @property
+    def compressed(self) -> bool:
+        return isinstance(self.value, dict)
+
+
+class HistoryCompressor:
+    """Compress history records into a marked zlib blob above ``threshold`` bytes.
+
+    Stored values are either the plain record list or a mapping
+    ``{"codec": "zlib", "data": <base64>}``, so payloads written before the
+    setting was enabled (or after it was disabled) keep loading. The last
+    packed or unpacked blob is remembered to avoid decompressing it again
+    when the same payload is read back within the update.
+    """
+
+    def __init__(self, threshold: int = 4096, *, enabled: bool = True, level: int = 6) -> None:
+        self._threshold = max(0, int(threshold))
+        self._enabled = enabled
+        self._level = level
+        self._blob: str | None = None
+        self._records: List[Any] = []
+
+    def pack(self, records: List[Any]) -> PackedHistory | None:
+        """Return the stored form of ``records`` or ``None`` when kept as is."""
+
+        if not self._enabled:
+            return None
+        try:
+            raw = json.dumps(records, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+        if len(raw) < self._threshold:
+            return PackedHistory(value=records, raw=len(raw), stored=len(raw))
+        blob = base64.b64encode(zlib.compress(raw, self._level)).decode("ascii")
+        if len(blob) >= len(raw):
+            return PackedHistory(value=records, raw=len(raw), stored=len(raw))
+        self._remember(blob, records)
+        return PackedHistory(
+            value={"codec": COMPRESSION_CODEC, "data": blob},
+            raw=len(raw),
+            stored=len(blob),
+        )
+
+    def unpack(self, value: Any) -> List[Any]:
+        """Return the record list stored in ``value``."""
+
+        if isinstance(value, list):
+            return value
+        if not self.marked(value):
+            return []
+        blob = value["data"]
+        if blob != self._blob:
+            try:
+                raw = zlib.decompress(base64.b64decode(blob))
+                records = json.loads(raw.decode("utf-8"))
+            except (binascii.Error, zlib.error, ValueError) as exc:
+                raise ValueError(f"Compressed history payload is corrupted: {exc}") from exc
+            self._remember(blob, records if isinstance(records, list) else [])
+        return list(self._records)
+
+    @staticmethod
+    def marked(value: Any) -> bool:
+        return (
+            isinstance(value, Mapping)
+            and value.get("codec") == COMPRESSION_CODEC
+            and isinstance(value.get("data"), str)
+        )
+
+    def _remember(self, blob: str, records: List[Any]) -> None:
+        self._blob = blob
+        self._records = list(records)
+
+
+__all__ = ["COMPRESSION_CODEC", "HistoryCompressor", "PackedHistory"]
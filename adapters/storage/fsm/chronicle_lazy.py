@@ -0,0 +1,124 @@
+"""Lazily decoded history sequences backed by stored chronicle records."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
+from typing import Any, Generic, List, TypeVar, overload
+
+from navigator.core.entity.history import Entry
+
+T = TypeVar("T")
+
+
+class _Slot(Generic[T]):
+    """Hold one stored record together with its decoded entry once requested."""
+
+    __slots__ = ("raw", "entry", "decode")
+
+    def __init__(
+        self,
+        raw: T | None,
+        entry: Entry | None = None,
+        decode: Callable[[T], Entry] | None = None,
+    ) -> None:
+        self.raw = raw
+        self.entry = entry
+        self.decode = decode
+
+    def resolve(self) -> Entry:
+        if self.entry is None:
+            self.entry = self.decode(self.raw)  # type: ignore[misc, arg-type]
+        return self.entry
+
+
+class LazyHistory(MutableSequence[Entry]):
+    """Expose stored records as history entries decoded on first access.
+
+    Slices, copies and concatenations share slots with the source sequence,
+    so an entry is decoded at most once per recall and keeps its identity
+    across derived snapshots. Entries that were never replaced keep their
+    original record, which :meth:`records` re-emits without encoding.
+    Decode failures propagate from the access that first touches the entry.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, slots: List[_Slot[Any]] | None = None) -> None:
+        self._slots: List[_Slot[Any]] = slots if slots is not None else []
+
+    @classmethod
+    def load(cls, records: Iterable[T], decode: Callable[[T], Entry]) -> LazyHistory:
+        """Return a sequence decoding ``records`` with ``decode`` on access."""
+
+        return cls([_Slot(record, decode=decode) for record in records])
+
+    def records(
+        self,
+        encode: Callable[[Entry], Any],
+        reuse: Callable[[Any], bool] | None = None,
+    ) -> List[Any]:
+        """Return stored records, encoding only entries that were replaced.
+
+        ``reuse`` may reject a stored record, which is then decoded and
+        encoded again instead of being re-emitted as is.
+        """
+
+        return [
+            slot.raw
+            if slot.raw is not None and (reuse is None or reuse(slot.raw))
+            else encode(slot.resolve())
+            for slot in self._slots
+        ]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @overload
+    def __getitem__(self, index: int) -> Entry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyHistory: ...
+
+    def __getitem__(self, index: int | slice) -> Entry | LazyHistory:
+        if isinstance(index, slice):
+            return LazyHistory(self._slots[index])
+        return self._slots[index].resolve()
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            self._slots[index] = [_Slot(None, entry) for entry in value]
+            return
+        self._slots[index] = _Slot(None, value)
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._slots[index]
+
+    def insert(self, index: int, value: Entry) -> None:
+        self._slots.insert(index, _Slot(None, value))
+
+    def __add__(self, other: Iterable[Entry]) -> LazyHistory:
+        return LazyHistory([*self._slots, *_slots(other)])
+
+    def __radd__(self, other: Iterable[Entry]) -> LazyHistory:
+        return LazyHistory([*_slots(other), *self._slots])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            former is latter or former == latter for former, latter in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        loaded = sum(slot.entry is not None for slot in self._slots)
+        return f"LazyHistory(len={len(self._slots)}, loaded={loaded})"
+
+
+def _slots(entries: Iterable[Entry]) -> List[_Slot[Any]]:
+    if isinstance(entries, LazyHistory):
+        return entries._slots
+    return [_Slot(None, entry) for entry in entries]
+
+
+__all__ = ["LazyHistory"]
@@ -0,0 +1,72 @@
+"""Interning table sharing identical markups across chronicle records."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from navigator.core.entity.markup import Markup
+
+from ..codec import ReplyCodec
+
+
+class MarkupTable:
+    """Store each distinct markup once under its content hash.
+
+    Message records reference markups by key and every key tracks how many
+    stored records point at it. :meth:`sweep` drops keys whose count fell to
+    zero, e.g. after entries were trimmed from the history head.
+    """
+
+    def __init__(self, payload: Any = None) -> None:
+        self._items: Dict[str, Dict[str, Any]] = {}
+        if isinstance(payload, Mapping):
+            for key, item in payload.items():
+                if isinstance(key, str) and isinstance(item, Mapping):
+                    self._items[key] = dict(item)
+
+    def intern(self, markup: Markup) -> str:
+        key = ReplyCodec.digest(markup)
+        if key not in self._items:
+            self._items[key] = {**(ReplyCodec.pack(markup) or {}), "refs": 0}
+        return key
+
+    def lookup(self, key: str) -> Optional[Markup]:
+        return ReplyCodec.unpack(self._items.get(key))
+
+    def retain(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            item = self._items.get(key)
+            if item is not None:
+                item["refs"] = self._count(item) + 1
+
+    def release(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            item = self._items.get(key)
+            if item is not None:
+                item["refs"] = self._count(item) - 1
+
+    def recount(self, keys: Iterable[str]) -> None:
+        for item in self._items.values():
+            item["refs"] = 0
+        self.retain(keys)
+
+    def sweep(self) -> None:
+        self._items = {
+            key: item for key, item in self._items.items() if self._count(item) > 0
+        }
+
+    def dump(self) -> Dict[str, Dict[str, Any]]:
+        return {key: dict(item) for key, item in self._items.items()}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _count(item: Mapping[str, Any]) -> int:
+        refs = item.get("refs")
+        return refs if isinstance(refs, int) else 0
+
+
+__all__ = ["MarkupTable"]
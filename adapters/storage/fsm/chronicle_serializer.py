@@ -1,22 +1,58 @@
 """Serialisation helpers used by chronicle storage."""
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import copy
+from typing import Any, Dict, List, Mapping, Optional, TypeAlias
 
 from navigator.core.entity.history import Entry, Message
+from navigator.core.entity.markup import Markup
 from navigator.core.telemetry import Telemetry
 
 from ..codec import GroupCodec, MediaCodec, PreviewCodec, ReplyCodec, TimeCodec
+from .chronicle_markup import MarkupTable
 from .chronicle_telemetry import ChronicleTelemetry
 
 
+HistoryRecord: TypeAlias = Dict[str, Any] | List[Any]
+
+
 class HistorySerializer:
     """Serialise and deserialise history entries for chronicle storage."""
 
     def __init__(self, telemetry: Telemetry | None) -> None:
         self._time = TimeCodec(telemetry)
+        self._markups: MarkupTable | None = None
+        self._share = False
+
+    def interning(self, markups: MarkupTable, *, share: bool = True) -> HistorySerializer:
+        """Return a serializer resolving markup references through ``markups``.
+
+        With ``share`` enabled dumped messages reference interned markups
+        instead of embedding them.
+        """
+
+        bound = copy.copy(self)
+        bound._markups = markups
+        bound._share = share
+        return bound
+
+    def accepts(self, record: Any) -> bool:
+        return isinstance(record, dict)
 
-    def dump(self, entry: Entry) -> Dict[str, Any]:
+    def references(self, record: Any) -> List[str]:
+        """Return markup keys referenced by the stored ``record``."""
+
+        items = record.get("messages") if isinstance(record, dict) else None
+        if not isinstance(items, list):
+            return []
+        keys = (
+            ReplyCodec.referent(item.get("markup"))
+            for item in items
+            if isinstance(item, dict)
+        )
+        return [key for key in keys if key is not None]
+
+    def dump(self, entry: Entry) -> HistoryRecord:
         return {
             "state": entry.state,
             "view": entry.view,
@@ -24,7 +60,10 @@ class HistorySerializer:
             "messages": [self._dump_message(message) for message in entry.messages],
         }
 
-    def load(self, data: Dict[str, Any], telemetry: ChronicleTelemetry) -> Entry:
+    def load(self, data: Any, telemetry: ChronicleTelemetry) -> Entry:
+        if not isinstance(data, Mapping):
+            telemetry.error("history_entry_unknown_format", raw=str(data)[:64])
+            raise ValueError(f"History entry has unsupported layout: {str(data)[:64]!r}")
         items = data.get("messages")
         rootmark = bool(data.get("root", False))
         if isinstance(items, list):
@@ -52,13 +91,14 @@ class HistorySerializer:
             "text": message.text,
             "media": MediaCodec.pack(message.media),
             "group": GroupCodec.pack(message.group),
-            "markup": ReplyCodec.pack(message.markup),
+            "markup": self._pack_markup(message.markup),
             "preview": PreviewCodec.pack(message.preview),
             "extra": message.extra,
             "extras": list(message.extras),
             "inline": message.inline,
             "automated": message.automated,
             "ts": TimeCodec.pack(message.ts),
+            "fingerprint": message.fingerprint,
         }
 
     def _load_message(self, record: Dict[str, Any], telemetry: ChronicleTelemetry) -> Message:
@@ -77,15 +117,27 @@ class HistorySerializer:
             text=record.get("text"),
             media=MediaCodec.unpack(record.get("media")),
             group=GroupCodec.unpack(record.get("group")),
-            markup=ReplyCodec.unpack(record.get("markup")),
+            markup=self._unpack_markup(record.get("markup")),
             preview=PreviewCodec.unpack(record.get("preview")),
             extra=record.get("extra"),
             extras=extras,
             inline=record.get("inline"),
             automated=bool(automated),
             ts=self._time.unpack(record.get("ts")),
+            fingerprint=record.get("fingerprint"),
         )
 
+    def _pack_markup(self, markup: Optional[Markup]) -> Optional[Dict[str, Any]]:
+        if markup and self._share and self._markups is not None:
+            return ReplyCodec.refer(self._markups.intern(markup))
+        return ReplyCodec.pack(markup)
+
+    def _unpack_markup(self, data: Any) -> Optional[Markup]:
+        key = ReplyCodec.referent(data)
+        if key is None:
+            return ReplyCodec.unpack(data)
+        return self._markups.lookup(key) if self._markups is not None else None
+
     def _require(
             self,
             record: Dict[str, Any],
@@ -121,4 +173,4 @@ class HistorySerializer:
         return extras
 
 
-__all__ = ["HistorySerializer"]
+__all__ = ["HistoryRecord", "HistorySerializer"]
@@ -3,24 +3,47 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping
 
+from .chronicle_compression import HistoryCompressor
+from .chronicle_serializer import HistoryRecord
+from .chronicle_telemetry import ChronicleTelemetry
 from .context import StateContext
-from .keys import FSM_HISTORY_FIELD, FSM_NAMESPACE_KEY
+from .keys import FSM_HISTORY_FIELD, FSM_MARKUP_FIELD
+from .unit import NamespaceUnit
 
 
 class ChronicleStorage:
     """Persist FSM chronicle namespaces in the underlying state context."""
 
-    def __init__(self, state: StateContext) -> None:
-        self._state = state
+    def __init__(
+        self,
+        state: StateContext,
+        *,
+        unit: NamespaceUnit | None = None,
+        compressor: HistoryCompressor | None = None,
+        emitter: ChronicleTelemetry | None = None,
+    ) -> None:
+        self._unit = unit or NamespaceUnit(state)
+        self._compressor = compressor or HistoryCompressor(enabled=False)
+        self._telemetry = emitter or ChronicleTelemetry(None)
 
     async def read(self) -> "ChronicleNamespace":
-        data = await self._state.get_data()
-        namespace = data.get(FSM_NAMESPACE_KEY)
-        payload = namespace if isinstance(namespace, dict) else {}
+        payload = await self._unit.read()
+        stored = payload.get(FSM_HISTORY_FIELD)
+        if self._compressor.marked(stored):
+            try:
+                payload[FSM_HISTORY_FIELD] = self._compressor.unpack(stored)
+            except ValueError:
+                self._telemetry.error("history_payload_corrupted")
+                raise
         return ChronicleNamespace(payload)
 
     async def write(self, namespace: "ChronicleNamespace") -> None:
-        await self._state.update_data({FSM_NAMESPACE_KEY: namespace.dump()})
+        payload = namespace.dump()
+        packed = self._compressor.pack(namespace.history())
+        if packed is not None and packed.compressed:
+            payload[FSM_HISTORY_FIELD] = packed.value
+            self._telemetry.compressed(packed.raw, packed.stored)
+        await self._unit.write(payload)
 
 
 class ChronicleNamespace:
@@ -29,13 +52,23 @@ class ChronicleNamespace:
     def __init__(self, payload: Mapping[str, Any]) -> None:
         self._payload: MutableMapping[str, Any] = dict(payload)
 
-    def history(self) -> List[Mapping[str, Any]]:
+    def history(self) -> List[HistoryRecord]:
         raw = self._payload.get(FSM_HISTORY_FIELD, [])
         return raw if isinstance(raw, list) else []
 
-    def update_history(self, history: Iterable[Mapping[str, Any]]) -> None:
+    def update_history(self, history: Iterable[HistoryRecord]) -> None:
         self._payload[FSM_HISTORY_FIELD] = list(history)
 
+    def markups(self) -> Mapping[str, Any]:
+        raw = self._payload.get(FSM_MARKUP_FIELD, {})
+        return raw if isinstance(raw, Mapping) else {}
+
+    def update_markups(self, markups: Mapping[str, Any]) -> None:
+        if markups:
+            self._payload[FSM_MARKUP_FIELD] = dict(markups)
+        else:
+            self._payload.pop(FSM_MARKUP_FIELD, None)
+
     def dump(self) -> Dict[str, Any]:
         return dict(self._payload)
 
@@ -25,6 +25,14 @@ class ChronicleTelemetry:
     def saved(self, length: int) -> None:
         self.emit(logging.DEBUG, LogCode.HISTORY_SAVE, history={"len": length})
 
+    def compressed(self, raw: int, stored: int) -> None:
+        self.emit(
+            logging.DEBUG,
+            LogCode.HISTORY_SAVE,
+            note="history_compressed",
+            size={"raw": raw, "stored": stored},
+        )
+
     def error(self, note: str, **fields: Any) -> None:
         self.emit(logging.ERROR, LogCode.HISTORY_LOAD, note=note, **fields)
 
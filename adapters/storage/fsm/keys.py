@@ -5,5 +5,15 @@ from typing import Final
 FSM_NAMESPACE_KEY: Final[str] = "_nav"
 FSM_HISTORY_FIELD: Final[str] = "history"
 FSM_LAST_ID_FIELD: Final[str] = "last_id"
+FSM_MARKUP_FIELD: Final[str] = "markups"
+FSM_GENERATION_FIELD: Final[str] = "generation"
+FSM_REDIS_FIELD: Final[str] = "redis"
 
-__all__ = ["FSM_NAMESPACE_KEY", "FSM_HISTORY_FIELD", "FSM_LAST_ID_FIELD"]
+__all__ = [
+    "FSM_NAMESPACE_KEY",
+    "FSM_HISTORY_FIELD",
+    "FSM_LAST_ID_FIELD",
+    "FSM_MARKUP_FIELD",
+    "FSM_GENERATION_FIELD",
+    "FSM_REDIS_FIELD",
+]
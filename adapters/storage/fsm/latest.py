@@ -5,13 +5,20 @@ from navigator.core.port.last import LatestRepository
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
 from typing import Optional
 
-from .keys import FSM_LAST_ID_FIELD, FSM_NAMESPACE_KEY
+from .keys import FSM_LAST_ID_FIELD
 from .context import StateContext
+from .unit import NamespaceUnit
 
 
 class Latest(LatestRepository):
-    def __init__(self, state: StateContext, telemetry: Telemetry | None = None):
-        self._state = state
+    def __init__(
+        self,
+        state: StateContext,
+        telemetry: Telemetry | None = None,
+        *,
+        unit: NamespaceUnit | None = None,
+    ):
+        self._unit = unit or NamespaceUnit(state)
         self._channel: TelemetryChannel | None = (
             telemetry.channel(__name__) if telemetry else None
         )
@@ -21,17 +28,15 @@ class Latest(LatestRepository):
             self._channel.emit(level, code, **fields)
 
     async def peek(self) -> Optional[int]:
-        data = await self._state.get_data()
-        namespace = data.get(FSM_NAMESPACE_KEY) or {}
-        marker = namespace.get(FSM_LAST_ID_FIELD) if isinstance(namespace, dict) else None
+        namespace = await self._unit.read()
+        marker = namespace.get(FSM_LAST_ID_FIELD)
         self._emit(logging.DEBUG, LogCode.LAST_GET, message={"id": marker})
         return marker
 
     async def mark(self, marker: Optional[int]) -> None:
-        data = await self._state.get_data()
-        namespace = dict(data.get(FSM_NAMESPACE_KEY) or {})
+        namespace = await self._unit.read()
         namespace[FSM_LAST_ID_FIELD] = marker
-        await self._state.update_data({FSM_NAMESPACE_KEY: namespace})
+        await self._unit.write(namespace)
         code = LogCode.LAST_DELETE if marker is None else LogCode.LAST_SET
         self._emit(logging.DEBUG, code, message={"id": marker})
 
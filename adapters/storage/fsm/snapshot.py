@@ -0,0 +1,61 @@
+"""Read-through snapshot of FSM data shared by the storage repositories."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .context import StateContext
+
+
+class StateSnapshot:
+    """Fetch FSM data once and serve repeated reads from memory.
+
+    Reads are cached only while the snapshot is pinned, i.e. while a guarded
+    operation is open. The cached payload is then only replaced by writes
+    issued through the snapshot itself or dropped via :meth:`invalidate`, so
+    handler code writing ``FSMContext`` directly must do so outside a guard.
+    Unpinned reads always go to the state context and never serve stale data.
+    """
+
+    def __init__(self, state: StateContext) -> None:
+        self._state = state
+        self._data: Dict[str, Any] | None = None
+        self._pins = 0
+
+    async def get_state(self) -> str | None:
+        return await self._state.get_state()
+
+    async def set_state(self, state: str | None) -> None:
+        await self._state.set_state(state)
+
+    async def get_data(self) -> Dict[str, Any]:
+        if not self._pins:
+            return dict(await self._state.get_data())
+        if self._data is None:
+            self._data = dict(await self._state.get_data())
+        return dict(self._data)
+
+    async def update_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        merged = await self._state.update_data(data)
+        self._data = dict(merged) if isinstance(merged, dict) else None
+        return merged
+
+    def invalidate(self) -> None:
+        self._data = None
+
+    def pin(self) -> None:
+        """Start serving reads from memory, dropping any earlier payload."""
+
+        if not self._pins:
+            self._data = None
+        self._pins += 1
+
+    def unpin(self) -> None:
+        """Stop caching once the matching :meth:`pin` is released."""
+
+        if self._pins:
+            self._pins -= 1
+        if not self._pins:
+            self._data = None
+
+
+__all__ = ["StateSnapshot"]
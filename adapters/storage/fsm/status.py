@@ -7,11 +7,19 @@ from typing import Any, Dict, Optional
 
 from .keys import FSM_NAMESPACE_KEY
 from .context import StateContext
+from .unit import NamespaceUnit
 
 
 class Status(StateRepository):
-    def __init__(self, state: StateContext, telemetry: Telemetry | None = None):
+    def __init__(
+        self,
+        state: StateContext,
+        telemetry: Telemetry | None = None,
+        *,
+        unit: NamespaceUnit | None = None,
+    ) -> None:
         self._state = state
+        self._unit = unit
         self._channel: TelemetryChannel | None = (
             telemetry.channel(__name__) if telemetry else None
         )
@@ -21,12 +29,16 @@ class Status(StateRepository):
             self._channel.emit(level, code, **fields)
 
     async def status(self) -> Optional[str]:
-        current = await self._state.get_state()
+        staged = self._unit.assigned() if self._unit is not None else None
+        current = staged[0] if staged is not None else await self._state.get_state()
         self._emit(logging.DEBUG, LogCode.STATE_GET, state={"current": current})
         return current
 
     async def assign(self, state: Optional[str]) -> None:
-        await self._state.set_state(state)
+        if self._unit is not None:
+            await self._unit.assign(state)
+        else:
+            await self._state.set_state(state)
         self._emit(logging.DEBUG, LogCode.STATE_SET, state={"target": state})
 
     async def payload(self) -> Dict[str, Any]:
@@ -0,0 +1,142 @@
+"""Unit of work merging ``_nav`` namespace writes into a single FSM update."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, List, Mapping
+
+from navigator.core.error import HistoryConflict
+
+from .context import StateContext
+from .keys import FSM_GENERATION_FIELD, FSM_NAMESPACE_KEY
+from .snapshot import StateSnapshot
+
+
+def _generation(namespace: Mapping[str, Any]) -> int:
+    value = namespace.get(FSM_GENERATION_FIELD)
+    return value if isinstance(value, int) else 0
+
+
+class NamespaceUnit:
+    """Stage namespace mutations and flush them with one ``update_data`` call.
+
+    Outside of an open unit every write goes straight to the state context, so
+    repositories used without a guard keep their write-through behaviour. When
+    backed by a :class:`StateSnapshot`, the snapshot caches reads only between
+    the outermost ``begin`` and its ``commit`` or ``rollback``.
+
+    Every write bumps the namespace generation. With ``verify`` enabled the
+    flush is a compare-and-set: it re-reads the stored generation and raises
+    :class:`HistoryConflict` instead of writing when another update committed
+    since the unit first read the namespace. :meth:`settle` runs the same
+    check, plus any ``fence`` registered by stores kept outside the
+    namespace, ahead of the flush. State assignments are staged with the
+    namespace so they only land when the unit commits.
+    """
+
+    def __init__(self, state: StateContext, *, verify: bool = False) -> None:
+        self._state = state
+        self._verify = verify
+        self._depth = 0
+        self._staged: Dict[str, Any] | None = None
+        self._base: int | None = None
+        self._assigned: tuple[str | None] | None = None
+        self._fences: List[Callable[[], Awaitable[None]]] = []
+
+    def begin(self) -> None:
+        if self._depth == 0:
+            self._base = None
+            if isinstance(self._state, StateSnapshot):
+                self._state.pin()
+        self._depth += 1
+
+    async def commit(self) -> None:
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                await self._flush()
+            finally:
+                self._release()
+
+    def rollback(self) -> None:
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self._staged = None
+            self._assigned = None
+            self._release()
+
+    async def settle(self) -> None:
+        if not self._verify or self._depth == 0:
+            return
+        if isinstance(self._state, StateSnapshot):
+            self._state.invalidate()
+        current = _generation(await self._load())
+        if self._base is None:
+            self._base = current
+        elif current != self._base:
+            raise HistoryConflict(self._base, current)
+        for check in self._fences:
+            await check()
+
+    def fence(self, check: Callable[[], Awaitable[None]]) -> None:
+        """Register ``check`` to run on :meth:`settle` of the open unit."""
+
+        if self._depth and check not in self._fences:
+            self._fences.append(check)
+
+    def assigned(self) -> tuple[str | None] | None:
+        """Return the state staged by :meth:`assign`, wrapped to allow ``None``."""
+
+        return self._assigned
+
+    async def assign(self, state: str | None) -> None:
+        if self._depth == 0:
+            await self._state.set_state(state)
+            return
+        await self.write(await self.read())
+        self._assigned = (state,)
+
+    async def read(self) -> Dict[str, Any]:
+        if self._staged is not None:
+            return dict(self._staged)
+        namespace = await self._load()
+        if self._depth and self._base is None:
+            self._base = _generation(namespace)
+        return namespace
+
+    async def write(self, namespace: Mapping[str, Any]) -> None:
+        payload = {**namespace, FSM_GENERATION_FIELD: _generation(namespace) + 1}
+        if self._depth == 0:
+            await self._state.update_data({FSM_NAMESPACE_KEY: payload})
+            return
+        self._staged = payload
+
+    async def _flush(self) -> None:
+        staged, self._staged = self._staged, None
+        assigned, self._assigned = self._assigned, None
+        if staged is None:
+            return
+        if self._verify and self._base is not None:
+            if isinstance(self._state, StateSnapshot):
+                self._state.invalidate()
+            current = _generation(await self._load())
+            if current != self._base:
+                raise HistoryConflict(self._base, current)
+        await self._state.update_data({FSM_NAMESPACE_KEY: staged})
+        if assigned is not None:
+            await self._state.set_state(assigned[0])
+
+    def _release(self) -> None:
+        self._fences = []
+        if isinstance(self._state, StateSnapshot):
+            self._state.unpin()
+
+    async def _load(self) -> Dict[str, Any]:
+        data = await self._state.get_data()
+        namespace = data.get(FSM_NAMESPACE_KEY)
+        return dict(namespace) if isinstance(namespace, dict) else {}
+
+
+__all__ = ["NamespaceUnit"]
@@ -0,0 +1,16 @@
+"""Redis-native storage adapters."""
+
+from .client import connect
+from .history import RedisChronicle, RedisHistoryConfig
+from .keys import scope_key
+from .keyspace import RedisKeyspace
+from .latest import RedisLatest
+
+__all__ = [
+    "RedisChronicle",
+    "RedisHistoryConfig",
+    "RedisKeyspace",
+    "RedisLatest",
+    "connect",
+    "scope_key",
+]
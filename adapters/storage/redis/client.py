@@ -0,0 +1,26 @@
+"""Process-wide Redis clients shared by storage adapters."""
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+try:
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover - optional dependency
+
+    class WatchError(Exception):  # type: ignore[no-redef]
+        """Placeholder raised never when the redis package is missing."""
+
+
+@cache
+def connect(url: str) -> Any:
+    """Return a pooled client for ``url`` reused across updates."""
+
+    try:
+        from redis.asyncio import Redis
+    except ImportError as error:  # pragma: no cover - optional dependency
+        raise RuntimeError("redis package not installed") from error
+    return Redis.from_url(url)
+
+
+__all__ = ["WatchError", "connect"]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from navigator.core.entity.history import Entry, HistoryDelta, replay
+from navigator.core.error import HistoryConflict, LeaseLost
+from navigator.core.port.locks import Lease, lease
+from navigator.core.telemetry import Telemetry
+
+from ..fsm.chronicle_lazy import LazyHistory
+from ..fsm.chronicle_serializer import HistorySerializer
+from ..fsm.chronicle_telemetry import ChronicleTelemetry
+from .client import WatchError
+from .keys import REDIS_HISTORY_SUFFIX, REDIS_VERSION_SUFFIX
+from .keyspace import RedisKeyspace
+
+
+def _version(raw: Any) -> int:
+    try:
+        return int(raw or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _holds(held: Lease, raw: Any) -> None:
+    value = raw.decode() if isinstance(raw, bytes) else raw
+    if not isinstance(value, str) or not value.startswith(f"{held.fence}:"):
+        raise LeaseLost(held.key)
+
+
+def _index(stored: Sequence[str], blob: str) -> int | None:
+    for index, candidate in enumerate(stored):
+        if candidate == blob:
+            return index
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class RedisHistoryConfig:
+    """Capture write semantics of :class:`RedisChronicle`."""
+
+    verify: bool = False
+    ttl: float = 0
+
+
+class RedisChronicle:
+    """Store history entries as a Redis list with one element per entry.
+
+    ``archive`` compares the new snapshot with the last recalled one and only
+    sends the difference: entries dropped from the head or the tail are
+    removed with ``LTRIM`` and new tail entries are added with ``RPUSH``, so
+    appends, pops and tail rewrites cost the same regardless of history length.
+    ``amend`` applies structured deltas directly without diffing. The diff
+    compares stored JSON: the list elements seen at ``recall`` are kept as
+    they are, so entries the snapshot carries over are neither decoded nor
+    encoded again, and only replaced entries are serialised.
+
+    Each write increments a version key next to the list and ``WATCH``es it.
+    When the version moved since ``recall`` the snapshot is no longer a diff
+    of the stored list: with ``verify`` enabled the write raises
+    :class:`HistoryConflict`, otherwise the list is rewritten in full so a
+    late writer never interleaves trims with a stale view. In ``verify`` mode
+    the version is also checked through the keyspace fence, before the
+    update performs its first Telegram call. Under a fenced scope lock the
+    write also ``WATCH``es the lock key and raises :class:`LeaseLost` unless
+    it still carries the holder's fence. Keys expire after
+    ``ttl`` seconds without writes, and the keyspace drops them once the FSM
+    data of the scope has been cleared.
+    """
+
+    def __init__(
+        self,
+        keyspace: RedisKeyspace,
+        telemetry: Telemetry | None = None,
+        *,
+        serializer: HistorySerializer | None = None,
+        config: RedisHistoryConfig | None = None,
+    ) -> None:
+        config = config or RedisHistoryConfig()
+        self._keyspace = keyspace
+        self._redis = keyspace.redis
+        self._key = keyspace.key(REDIS_HISTORY_SUFFIX)
+        self._version_key = keyspace.key(REDIS_VERSION_SUFFIX)
+        self._verify = config.verify
+        self._ttl = int(config.ttl * 1000)
+        self._generation: int | None = None
+        self._telemetry = ChronicleTelemetry(telemetry)
+        self._serializer = serializer or HistorySerializer(telemetry)
+        self._known: Sequence[Entry] | None = None
+        self._stored: list[str] | None = None
+
+    async def recall(self) -> LazyHistory:
+        history = await self._fetch()
+        self._telemetry.loaded(len(history))
+        return history
+
+    async def archive(self, history: Sequence[Entry]) -> None:
+        if self._known is None:
+            await self._fetch()
+        snapshot = history[:]
+        stored = self._stored
+        blobs = self._blobs(snapshot)
+        await self._commit(lambda pipe: self._plan(pipe, stored, blobs), blobs)
+        self._known = snapshot
+        self._stored = blobs
+        self._telemetry.saved(len(snapshot))
+
+    async def amend(self, delta: HistoryDelta) -> None:
+        stored = self._stored
+        if self._known is None or stored is None or len(self._known) != delta.origin:
+            await self.archive(delta.history)
+            return
+        blobs = replay(delta, stored, self._encode)
+        await self._commit(lambda pipe: self._patch(pipe, delta, blobs), blobs)
+        self._known = delta.history[:]
+        self._stored = blobs
+        self._telemetry.saved(len(delta.history))
+
+    async def _fetch(self) -> LazyHistory:
+        await self._keyspace.ensure()
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.get(self._version_key)
+        pipe.lrange(self._key, 0, -1)
+        version, raw = await pipe.execute()
+        self._generation = _version(version)
+        blobs = [item.decode() if isinstance(item, bytes) else str(item) for item in raw]
+        kept = [blob for blob in blobs if self._serializer.accepts(json.loads(blob))]
+        history = LazyHistory.load(kept, self._load)
+        self._known = history[:]
+        self._stored = kept if len(kept) == len(blobs) else None
+        if self._verify:
+            self._keyspace.fence(self._settle)
+        return history
+
+    async def _settle(self) -> None:
+        if self._generation is None:
+            return
+        current = _version(await self._redis.get(self._version_key))
+        if current != self._generation:
+            raise HistoryConflict(self._generation, current)
+
+    async def _commit(self, plan: Callable[[Any], None], blobs: Sequence[str]) -> None:
+        held = lease()
+        watched = (self._version_key,) if held is None else (self._version_key, held.key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                await pipe.watch(*watched)
+                if held is not None:
+                    _holds(held, await pipe.get(held.key))
+                current = _version(await pipe.get(self._version_key))
+                stale = current != self._generation
+                if stale and self._verify:
+                    raise HistoryConflict(self._generation, current)
+                pipe.multi()
+                if stale:
+                    self._replace(pipe, blobs)
+                else:
+                    plan(pipe)
+                if self._ttl > 0:
+                    pipe.pexpire(self._key, self._ttl)
+                    pipe.pexpire(self._version_key, self._ttl)
+                pipe.incr(self._version_key)
+                try:
+                    results = await pipe.execute()
+                except WatchError as exc:
+                    if held is not None:
+                        _holds(held, await self._redis.get(held.key))
+                    if self._verify:
+                        raise HistoryConflict(self._generation, None) from exc
+                    self._generation = None
+                    continue
+                break
+        self._generation = _version(results[-1])
+
+    def _patch(self, pipe: Any, delta: HistoryDelta, blobs: Sequence[str]) -> None:
+        if delta.pop:
+            pipe.ltrim(self._key, 0, -(delta.pop + 1))
+        if delta.push:
+            pipe.rpush(self._key, *blobs[len(blobs) - len(delta.push):])
+        if delta.shed:
+            if delta.pinned:
+                pipe.lset(self._key, delta.shed, blobs[0])
+            pipe.ltrim(self._key, delta.shed, -1)
+
+    def _replace(self, pipe: Any, blobs: Sequence[str]) -> None:
+        pipe.delete(self._key)
+        if blobs:
+            pipe.rpush(self._key, *blobs)
+
+    def _plan(self, pipe: Any, stored: Sequence[str] | None, blobs: Sequence[str]) -> None:
+        if not blobs:
+            pipe.delete(self._key)
+            return
+        head = _index(stored, blobs[0]) if stored is not None else None
+        if stored is None or head is None:
+            self._replace(pipe, blobs)
+            return
+        kept = 0
+        limit = min(len(blobs), len(stored) - head)
+        while kept < limit and stored[head + kept] == blobs[kept]:
+            kept += 1
+        if head > 0 or head + kept < len(stored):
+            pipe.ltrim(self._key, head, head + kept - 1)
+        if kept < len(blobs):
+            pipe.rpush(self._key, *blobs[kept:])
+
+    def _blobs(self, history: Sequence[Entry]) -> list[str]:
+        if isinstance(history, LazyHistory):
+            return history.records(self._encode, reuse=lambda raw: isinstance(raw, str))
+        return [self._encode(entry) for entry in history]
+
+    def _load(self, blob: str) -> Entry:
+        return self._decode(json.loads(blob))
+
+    def _decode(self, record: Any) -> Entry:
+        return self._serializer.load(record, self._telemetry)
+
+    def _encode(self, entry: Entry) -> str:
+        return json.dumps(self._serializer.dump(entry), separators=(",", ":"))
+
+
+__all__ = ["RedisChronicle", "RedisHistoryConfig"]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Final
+
+from ..fsm.context import StateContext
+
+REDIS_KEY_PREFIX: Final[str] = "nav"
+REDIS_HISTORY_SUFFIX: Final[str] = "history"
+REDIS_LAST_ID_SUFFIX: Final[str] = "last_id"
+REDIS_VERSION_SUFFIX: Final[str] = "version"
+
+
+def scope_key(state: StateContext) -> str:
+    """Derive the Redis key base from the FSM storage key of ``state``."""
+
+    key = getattr(state, "key", None)
+    if key is None:
+        raise RuntimeError("Redis history storage requires a keyed state context")
+    parts = (
+        getattr(key, "bot_id", None),
+        getattr(key, "chat_id", None),
+        getattr(key, "user_id", None),
+        getattr(key, "thread_id", None),
+        getattr(key, "business_connection_id", None),
+        getattr(key, "destiny", None),
+    )
+    return ":".join([REDIS_KEY_PREFIX, *("" if part is None else str(part) for part in parts)])
+
+
+__all__ = [
+    "REDIS_HISTORY_SUFFIX",
+    "REDIS_KEY_PREFIX",
+    "REDIS_LAST_ID_SUFFIX",
+    "REDIS_VERSION_SUFFIX",
+    "scope_key",
+]
@@ -0,0 +1,50 @@
+"""Redis keys of one navigator scope bound to the lifetime of its FSM data."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+
+from ..fsm.keys import FSM_REDIS_FIELD
+from ..fsm.unit import NamespaceUnit
+from .keys import REDIS_HISTORY_SUFFIX, REDIS_LAST_ID_SUFFIX, REDIS_VERSION_SUFFIX
+
+
+class RedisKeyspace:
+    """Hold the Redis client and key base shared by Redis-native repositories.
+
+    Redis-native repositories keep their data outside the FSM payload, so
+    ``FSMContext.clear()`` would leave history and markers behind. With a
+    ``unit`` the keyspace stores a flag in the ``_nav`` namespace; when the
+    flag is missing :meth:`ensure` deletes the scope's keys before first use
+    and writes the flag back. The check runs once per instance. :meth:`fence`
+    lets repositories join the unit's pre-side-effect staleness check.
+    """
+
+    def __init__(self, redis: Any, base: str, unit: NamespaceUnit | None = None) -> None:
+        self.redis = redis
+        self._base = base
+        self._unit = unit
+        self._checked = unit is None
+
+    def key(self, suffix: str) -> str:
+        return f"{self._base}:{suffix}"
+
+    async def ensure(self) -> None:
+        if self._checked or self._unit is None:
+            return
+        namespace = await self._unit.read()
+        if not namespace.get(FSM_REDIS_FIELD):
+            await self.redis.delete(
+                *(
+                    self.key(suffix)
+                    for suffix in (REDIS_HISTORY_SUFFIX, REDIS_VERSION_SUFFIX, REDIS_LAST_ID_SUFFIX)
+                )
+            )
+            await self._unit.write({**namespace, FSM_REDIS_FIELD: True})
+        self._checked = True
+
+    def fence(self, check: Callable[[], Awaitable[None]]) -> None:
+        if self._unit is not None:
+            self._unit.fence(check)
+
+
+__all__ = ["RedisKeyspace"]
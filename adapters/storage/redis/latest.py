@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+
+from navigator.core.port.last import LatestRepository
+from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
+
+from .keys import REDIS_LAST_ID_SUFFIX
+from .keyspace import RedisKeyspace
+
+
+class RedisLatest(LatestRepository):
+    """Keep the latest message marker in a dedicated Redis string."""
+
+    def __init__(
+        self,
+        keyspace: RedisKeyspace,
+        telemetry: Telemetry | None = None,
+        *,
+        ttl: float = 0,
+    ) -> None:
+        self._keyspace = keyspace
+        self._redis = keyspace.redis
+        self._key = keyspace.key(REDIS_LAST_ID_SUFFIX)
+        self._ttl = int(ttl * 1000)
+        self._channel: TelemetryChannel | None = (
+            telemetry.channel(__name__) if telemetry else None
+        )
+
+    def _emit(self, level: int, code: LogCode, /, **fields: object) -> None:
+        if self._channel:
+            self._channel.emit(level, code, **fields)
+
+    async def peek(self) -> int | None:
+        await self._keyspace.ensure()
+        raw = await self._redis.get(self._key)
+        marker = int(raw) if raw is not None else None
+        self._emit(logging.DEBUG, LogCode.LAST_GET, message={"id": marker})
+        return marker
+
+    async def mark(self, marker: int | None) -> None:
+        await self._keyspace.ensure()
+        if marker is None:
+            await self._redis.delete(self._key)
+        else:
+            await self._redis.set(self._key, int(marker), px=self._ttl or None)
+        code = LogCode.LAST_DELETE if marker is None else LogCode.LAST_SET
+        self._emit(logging.DEBUG, code, message={"id": marker})
+
+
+__all__ = ["RedisLatest"]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from collections import OrderedDict
+from functools import cache
+
 from aiogram.types import (
     ForceReply,
     InlineKeyboardMarkup,
@@ -12,7 +16,7 @@ from aiogram.types import (
 from navigator.core.entity.markup import Markup
 from navigator.core.port.markup import MarkupCodec
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
-from typing import Any, Optional, Type
+from typing import Any, Type
 
 _AIROGRAM_TYPES: dict[str, Type[Any]] = {
     "InlineKeyboardMarkup": InlineKeyboardMarkup,
@@ -22,13 +26,64 @@ _AIROGRAM_TYPES: dict[str, Type[Any]] = {
 }
 
 
+def canonical(stored: Markup) -> str | None:
+    """Return the canonical JSON of ``stored`` or ``None`` when it is not JSON."""
+
+    try:
+        return json.dumps(
+            [stored.kind, stored.data],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class MarkupCache:
+    """Bounded LRU of decoded keyboards.
+
+    Entries are keyed by the canonical JSON of the stored markup, so equal
+    keyboards share one aiogram instance. Hits hand out that shared
+    instance; it is only ever passed to Bot API calls and must be treated
+    as read-only.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._decoded: OrderedDict[str, Any] = OrderedDict()
+
+    def decoded(self, key: str) -> Any:
+        result = self._decoded.get(key)
+        if result is None:
+            return None
+        self._decoded.move_to_end(key)
+        return result
+
+    def keep_decoded(self, key: str, result: Any) -> None:
+        self._decoded[key] = result
+        self._decoded.move_to_end(key)
+        while len(self._decoded) > self._capacity:
+            self._decoded.popitem(last=False)
+
+
+@cache
+def shared_markup_cache(capacity: int = 256) -> MarkupCache | None:
+    """Return the process-wide markup cache, or ``None`` when ``capacity`` is zero."""
+
+    if capacity <= 0:
+        return None
+    return MarkupCache(capacity)
+
+
 class AiogramCodec(MarkupCodec):
     """Bridge aiogram keyboard objects with Navigator markup entities."""
 
-    def __init__(self, telemetry: Telemetry) -> None:
+    def __init__(self, telemetry: Telemetry, cache: MarkupCache | None = None) -> None:
         self._channel: TelemetryChannel = telemetry.channel(__name__)
+        self._cache = cache
 
-    def encode(self, markup: Any) -> Optional[Markup]:
+    def encode(self, markup: Any) -> Markup | None:
         """Translate aiogram markup objects into serialisable structures."""
 
         if not markup:
@@ -45,7 +100,7 @@ class AiogramCodec(MarkupCodec):
             data=markup.model_dump(exclude_none=True, by_alias=True),
         )
 
-    def decode(self, stored: Optional[Markup]) -> Any:
+    def decode(self, stored: Markup | None) -> Any:
         """Reconstruct aiogram markup objects from stored metadata."""
 
         if not stored:
@@ -54,6 +109,13 @@ class AiogramCodec(MarkupCodec):
         if target is None:
             self._emit(logging.DEBUG, LogCode.MARKUP_DECODE, recognized=False, kind=stored.kind)
             return None
+        memo = self._cache
+        key = canonical(stored) if memo is not None else None
+        if memo is not None and key is not None:
+            cached = memo.decoded(key)
+            if cached is not None:
+                self._emit(logging.DEBUG, LogCode.MARKUP_DECODE, recognized=True, kind=stored.kind)
+                return cached
         try:
             result = target.model_validate(stored.data)
         except Exception:
@@ -65,6 +127,8 @@ class AiogramCodec(MarkupCodec):
                 note="type_error",
             )
             return None
+        if memo is not None and key is not None:
+            memo.keep_decoded(key, result)
         self._emit(logging.DEBUG, LogCode.MARKUP_DECODE, recognized=True, kind=stored.kind)
         return result
 
@@ -74,4 +138,4 @@ class AiogramCodec(MarkupCodec):
         self._channel.emit(level, code, **fields)
 
 
-__all__ = ["AiogramCodec"]
+__all__ = ["AiogramCodec", "MarkupCache", "canonical", "shared_markup_cache"]
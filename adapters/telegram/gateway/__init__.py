@@ -7,7 +7,10 @@ from .sender import TelegramMessageSender
 from .editor import TelegramMessageEditor
 from .markup import TelegramMarkupRefiner
 from .deletion import TelegramDeletionManager
+from .flood import FloodGate, flood_gate
 from .notifier import TelegramNotifier
+from .sweeper import DeletionQueue, shared_deletion_queue
+from .throttle import RateLimiter, TokenBucket, shared_limiter
 
 __all__ = [
     "TelegramGateway",
@@ -16,5 +19,12 @@ __all__ = [
     "TelegramMarkupRefiner",
     "TelegramDeletionManager",
     "TelegramNotifier",
+    "DeletionQueue",
+    "FloodGate",
+    "RateLimiter",
+    "TokenBucket",
     "create_gateway",
+    "flood_gate",
+    "shared_deletion_queue",
+    "shared_limiter",
 ]
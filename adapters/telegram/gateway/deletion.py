@@ -6,16 +6,42 @@ from aiogram import Bot
 from navigator.core.telemetry import Telemetry
 from navigator.core.value.message import Scope
 
+from .flood import FloodGate
 from .purge import PurgeTask
+from .sweeper import DeletionQueue
+from .throttle import RateLimiter
 
 
 class TelegramDeletionManager:
     """Coordinate message purge operations for Telegram gateway."""
 
-    def __init__(self, bot: Bot, *, chunk: int, delay: float, telemetry: Telemetry) -> None:
-        self._task = PurgeTask(bot, chunk=chunk, delay=delay, telemetry=telemetry)
+    def __init__(
+        self,
+        bot: Bot,
+        *,
+        chunk: int,
+        delay: float,
+        telemetry: Telemetry,
+        gate: FloodGate | None = None,
+        queue: DeletionQueue | None = None,
+        limiter: RateLimiter | None = None,
+        parallel: int = 1,
+    ) -> None:
+        self._task = PurgeTask(
+            bot,
+            chunk=chunk,
+            delay=delay,
+            telemetry=telemetry,
+            gate=gate,
+            limiter=limiter,
+            parallel=parallel,
+        )
+        self._queue = queue
 
     async def delete(self, scope: Scope, identifiers: list[int]) -> None:
+        if self._queue is not None:
+            self._queue.submit(self._task, scope, identifiers)
+            return
         await self._task.execute(scope, identifiers)
 
 
@@ -12,12 +12,16 @@ from navigator.core.port.pathpolicy import MediaPathPolicy
 from navigator.core.port.preview import LinkPreviewCodec
 from navigator.core.telemetry import Telemetry
 
+from ..media.identity import BotMediaIdentities
 from ..serializer.screen import SignatureScreen
 from .deletion import TelegramDeletionManager
+from .flood import FloodGate
 from .gateway import TelegramGateway
 from .markup import TelegramMarkupRefiner
 from .notifier import TelegramNotifier
 from .sender import TelegramMessageSender
+from .sweeper import DeletionQueue
+from .throttle import RateLimiter
 from .editor import TelegramMessageEditor
 
 
@@ -33,7 +37,12 @@ def create_gateway(
     chunk: int = 100,
     truncate: bool = False,
     deletepause: float = 0.05,
+    parallel: int = 1,
     telemetry: Telemetry,
+    limiter: RateLimiter | None = None,
+    gate: FloodGate | None = None,
+    queue: DeletionQueue | None = None,
+    identities: BotMediaIdentities | None = None,
     sender_factory: Callable[..., TelegramMessageSender] = TelegramMessageSender,
     editor_factory: Callable[..., TelegramMessageEditor] = TelegramMessageEditor,
     markup_factory: Callable[..., TelegramMarkupRefiner] = TelegramMarkupRefiner,
@@ -72,6 +81,10 @@ def create_gateway(
         chunk=chunk,
         delay=deletepause,
         telemetry=telemetry,
+        gate=gate,
+        queue=queue,
+        limiter=limiter,
+        parallel=parallel,
     )
     notifier = notifier_factory(bot, telemetry=telemetry)
     return TelegramGateway(
@@ -80,6 +93,8 @@ def create_gateway(
         markup=markup,
         deletion=deletion,
         notifier=notifier,
+        limiter=limiter,
+        identities=identities,
     )
 
 
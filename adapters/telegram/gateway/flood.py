@@ -0,0 +1,192 @@
+"""Bot-wide flood-wait coordination shared by Telegram calls."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from navigator.adapters.storage.redis.client import connect
+
+logger = logging.getLogger(__name__)
+
+_PRUNE_THRESHOLD = 1024
+
+
+def _kind(chat: object) -> str:
+    text = str(chat)
+    if text.startswith(("@", "-100")):
+        return "channel"
+    if text.startswith("-"):
+        return "group"
+    return "private"
+
+
+@dataclass(frozen=True, slots=True)
+class FloodBuckets:
+    """Buckets a call waits on, widest first, and the one a flood wait closes."""
+
+    tiers: tuple[str, ...]
+    target: str
+
+
+def buckets(action: Callable[..., Any], labels: Mapping[str, Any]) -> FloodBuckets:
+    """Return the flood buckets of ``action`` called with ``labels``.
+
+    Every call waits on the bot-wide tier, then on its chat class
+    (``private``, ``group``, ``channel`` or ``business``; supergroups share
+    the channel class since both carry the ``-100`` id prefix), then on its
+    own chat. A ``RetryAfter`` closes the tier Telegram enforces the limit
+    on: chat-less calls and private chats hit bot-wide limits, so they
+    close the bot and private tiers; groups, channels and business chats
+    are limited per chat and only close their own bucket.
+    """
+
+    method = getattr(action, "__name__", None) or type(action).__name__
+    chat = labels.get("chat_id")
+    business = labels.get("business_connection_id")
+    if business:
+        own = f"{method}:business:{business}:{chat}"
+        return FloodBuckets(("bot", "class:business", own), own)
+    if chat is None:
+        return FloodBuckets(("bot",), "bot")
+    kind = _kind(chat)
+    tier = f"class:{kind}"
+    own = f"{method}:chat:{chat}"
+    return FloodBuckets(("bot", tier, own), tier if kind == "private" else own)
+
+
+class FloodGate:
+    """Pause every call of a bucket until its observed flood wait expires.
+
+    Deadlines live in process memory. With a Redis client they are also
+    published under ``prefix`` so sibling workers honour them, and each
+    worker looks up remote deadlines at most once per ``refresh`` seconds
+    per bucket. Expired deadlines and lookup stamps are pruned once either
+    table grows past a threshold, since per-chat buckets are open-ended.
+    """
+
+    def __init__(
+        self,
+        redis: Any | None = None,
+        *,
+        prefix: str = "nav:flood",
+        refresh: float = 1.0,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._refresh = max(float(refresh), 0.0)
+        self._deadlines: dict[str, float] = {}
+        self._checked: dict[str, float] = {}
+
+    def remaining(self, key: str) -> float:
+        """Return seconds left before ``key`` may call the API again."""
+
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return 0.0
+        left = deadline - time.monotonic()
+        if left <= 0:
+            self._deadlines.pop(key, None)
+            return 0.0
+        return left
+
+    async def wait(self, key: str) -> float:
+        """Sleep until the bucket ``key`` is open and return the time waited."""
+
+        await self._pull(key)
+        waited = 0.0
+        while True:
+            left = self.remaining(key)
+            if left <= 0:
+                return waited
+            await asyncio.sleep(left)
+            waited += left
+
+    async def admit(self, scope: FloodBuckets) -> float:
+        """Wait until every tier of ``scope`` is open and return the time waited.
+
+        Tiers are checked widest first and rechecked after any pause, since
+        a wider tier may close while a narrower one is waited out.
+        """
+
+        waited = 0.0
+        while True:
+            paused = 0.0
+            for key in scope.tiers:
+                paused += await self.wait(key)
+            waited += paused
+            if paused <= 0:
+                return waited
+
+    async def hold(self, key: str, delay: float) -> None:
+        """Close the bucket ``key`` for ``delay`` seconds."""
+
+        if delay <= 0:
+            return
+        now = time.monotonic()
+        self._prune(now)
+        deadline = now + delay
+        if deadline > self._deadlines.get(key, 0.0):
+            self._deadlines[key] = deadline
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._name(key),
+                repr(time.time() + delay),
+                px=max(int(delay * 1000), 1),
+            )
+        except Exception as error:  # pragma: no cover - network failure
+            logger.warning("Failed to publish flood wait for %s: %s", key, error)
+
+    async def _pull(self, key: str) -> None:
+        if self._redis is None:
+            return
+        now = time.monotonic()
+        if now - self._checked.get(key, float("-inf")) < self._refresh:
+            return
+        self._prune(now)
+        self._checked[key] = now
+        try:
+            raw = await self._redis.get(self._name(key))
+        except Exception as error:  # pragma: no cover - network failure
+            logger.warning("Failed to read flood wait for %s: %s", key, error)
+            return
+        if raw is None:
+            return
+        try:
+            left = float(raw) - time.time()
+        except (TypeError, ValueError):
+            return
+        if left > 0 and now + left > self._deadlines.get(key, 0.0):
+            self._deadlines[key] = now + left
+
+    def _prune(self, now: float) -> None:
+        if len(self._deadlines) > _PRUNE_THRESHOLD:
+            self._deadlines = {
+                key: deadline for key, deadline in self._deadlines.items() if deadline > now
+            }
+        if len(self._checked) > _PRUNE_THRESHOLD:
+            self._checked = {
+                key: stamp for key, stamp in self._checked.items()
+                if now - stamp < self._refresh
+            }
+
+    def _name(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+
+@lru_cache(maxsize=None)
+def flood_gate(url: str | None = None) -> FloodGate:
+    """Return the process-wide gate, shared through Redis when ``url`` is set."""
+
+    if url is None:
+        return FloodGate()
+    return FloodGate(connect(url))
+
+
+__all__ = ["FloodBuckets", "FloodGate", "buckets", "flood_gate"]
@@ -5,11 +5,13 @@ from navigator.core.port.message import MessageGateway, Result
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
+from ..media.identity import BotMediaIdentities
 from .deletion import TelegramDeletionManager
 from .editor import TelegramMessageEditor
 from .markup import TelegramMarkupRefiner
 from .notifier import TelegramNotifier
 from .sender import TelegramMessageSender
+from .throttle import RateLimiter
 
 
 class TelegramGateway(MessageGateway):
@@ -23,32 +25,54 @@ class TelegramGateway(MessageGateway):
         markup: TelegramMarkupRefiner,
         deletion: TelegramDeletionManager,
         notifier: TelegramNotifier,
+        limiter: RateLimiter | None = None,
+        identities: BotMediaIdentities | None = None,
     ) -> None:
         self._sender = sender
         self._editor = editor
         self._markup = markup
         self._deletion = deletion
         self._notifier = notifier
+        self._limiter = limiter
+        self._identities = identities
+
+    async def _pace(self, scope: Scope) -> None:
+        if self._limiter is not None:
+            await self._limiter.acquire(scope)
+
+    def _absorb(self, payload: Payload, result: Result) -> None:
+        if self._identities is not None:
+            self._identities.absorb(payload, result.meta)
 
     async def send(self, scope: Scope, payload: Payload) -> Result:
-        return await self._sender.send(scope, payload)
+        await self._pace(scope)
+        result = await self._sender.send(scope, payload)
+        self._absorb(payload, result)
+        return result
 
     async def rewrite(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await self._pace(scope)
         return await self._editor.rewrite(scope, identifier, payload)
 
     async def recast(self, scope: Scope, identifier: int, payload: Payload) -> Result:
-        return await self._editor.recast(scope, identifier, payload)
+        await self._pace(scope)
+        result = await self._editor.recast(scope, identifier, payload)
+        self._absorb(payload, result)
+        return result
 
     async def retitle(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await self._pace(scope)
         return await self._editor.retitle(scope, identifier, payload)
 
     async def remap(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await self._pace(scope)
         return await self._markup.remap(scope, identifier, payload)
 
     async def delete(self, scope: Scope, identifiers: list[int]) -> None:
         await self._deletion.delete(scope, identifiers)
 
     async def alert(self, scope: Scope, text: str) -> None:
+        await self._pace(scope)
         await self._notifier.alert(scope, text)
 
 
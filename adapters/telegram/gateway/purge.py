@@ -9,20 +9,39 @@ from navigator.core.value.ids import order as arrange
 from navigator.core.value.message import Scope
 from typing import Any, Optional
 
+from .flood import FloodGate
 from .retry import invoke
+from .throttle import RateLimiter
 from ..errors import excusable
 
 
 class PurgeTask:
     """Coordinate Telegram message purge operations."""
 
-    def __init__(self, bot, *, chunk: int, delay: float, telemetry: Telemetry) -> None:
+    def __init__(
+            self,
+            bot,
+            *,
+            chunk: int,
+            delay: float,
+            telemetry: Telemetry,
+            gate: FloodGate | None = None,
+            limiter: RateLimiter | None = None,
+            parallel: int = 1,
+    ) -> None:
         self._bot = bot
+        self._gate = gate
+        self._limiter = limiter
+        self._parallel = max(int(parallel), 1)
         size = int(chunk)
         self._chunk = max(min(size, 100), 1)
         self._delay = max(float(delay), 0.0)
         self._channel: TelemetryChannel = telemetry.channel(__name__)
 
+    @property
+    def channel(self) -> TelemetryChannel:
+        return self._channel
+
     async def execute(self, scope: Scope, identifiers: Sequence[int]) -> None:
         """Dispatch deletion requests in safe, chunked batches."""
 
@@ -96,22 +115,12 @@ class PurgeTask:
         )
         scopeview = profile(scope)
         try:
+            if self._parallel > 1:
+                await self._purge_parallel(scope, batches, purger, params)
+                return
             for index, batch in enumerate(batches, start=1):
-                try:
-                    await self._execute_batch(scope, batch, purger, params)
-                except Exception as error:
-                    if excusable(error):
-                        continue
-                    raise
-                self._channel.emit(
-                    logging.INFO,
-                    LogCode.GATEWAY_DELETE_OK,
-                    scope=scopeview,
-                    message={"deleted": len(batch)},
-                    chunk={"index": index, "total": total},
-                )
-                if self._delay:
-                    await asyncio.sleep(self._delay)
+                if await self._purge_unit(scope, batch, purger, params):
+                    self._report(scopeview, batch, index, total)
         except Exception as error:
             self._channel.emit(
                 logging.WARNING,
@@ -122,6 +131,65 @@ class PurgeTask:
             )
             raise
 
+    async def _purge_parallel(
+            self,
+            scope: Scope,
+            batches: Sequence[Sequence[int]],
+            purger: Optional[Callable[..., Awaitable[Any]]],
+            params: dict[str, Any],
+    ) -> None:
+        """Dispatch purge units concurrently under a bounded semaphore.
+
+        Without a bulk purger every identifier becomes its own unit, so
+        single-message deletions overlap as well.
+        """
+
+        units = batches if purger is not None else [[mid] for batch in batches for mid in batch]
+        total = len(units)
+        scopeview = profile(scope)
+        gate = asyncio.Semaphore(self._parallel)
+
+        async def run(index: int, unit: Sequence[int]) -> None:
+            async with gate:
+                if await self._purge_unit(scope, unit, purger, params):
+                    self._report(scopeview, unit, index, total)
+
+        outcomes = await asyncio.gather(
+            *(run(index, unit) for index, unit in enumerate(units, start=1)),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    async def _purge_unit(
+            self,
+            scope: Scope,
+            batch: Sequence[int],
+            purger: Optional[Callable[..., Awaitable[Any]]],
+            params: dict[str, Any],
+    ) -> bool:
+        """Purge one batch, reporting whether it went through without excuse."""
+
+        try:
+            await self._execute_batch(scope, batch, purger, params)
+        except Exception as error:
+            if excusable(error):
+                return False
+            raise
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return True
+
+    def _report(self, scopeview: Any, batch: Sequence[int], index: int, total: int) -> None:
+        self._channel.emit(
+            logging.INFO,
+            LogCode.GATEWAY_DELETE_OK,
+            scope=scopeview,
+            message={"deleted": len(batch)},
+            chunk={"index": index, "total": total},
+        )
+
     async def _execute_batch(
             self,
             scope: Scope,
@@ -132,11 +200,13 @@ class PurgeTask:
         """Perform a single purge batch call respecting business rules."""
 
         if purger is not None:
+            await self._pace(scope)
             await invoke(
                 purger,
                 message_ids=batch,
                 **params,
                 channel=self._channel,
+                gate=self._gate,
             )
             return
 
@@ -144,9 +214,15 @@ class PurgeTask:
             raise RuntimeError("bulk_business_delete_unsupported")
 
         for mid in batch:
+            await self._pace(scope)
             await invoke(
                 self._bot.delete_message,
                 chat_id=scope.chat,
                 message_id=mid,
                 channel=self._channel,
+                gate=self._gate,
             )
+
+    async def _pace(self, scope: Scope) -> None:
+        if self._limiter is not None:
+            await self._limiter.acquire(scope)
@@ -7,6 +7,7 @@ from aiogram.exceptions import TelegramRetryAfter
 from collections.abc import Awaitable, Callable
 from typing import ParamSpec, TypeVar
 
+from .flood import FloodGate, buckets, flood_gate
 from .patterns import EDIT_FORBIDDEN, NOT_MODIFIED
 from ....core.error import EditForbidden, MessageUnchanged
 from ....core.telemetry import LogCode, TelemetryChannel
@@ -30,8 +31,11 @@ async def invoke(
         action: Callable[P, Awaitable[T]],
         *values: P.args,
         channel: TelemetryChannel,
+        gate: FloodGate | None = None,
         **labels: P.kwargs,
 ) -> T:
+    gate = gate if gate is not None else flood_gate()
+    scope = buckets(action, labels)
     tries = 0
     quota = 6
     base = 1.5
@@ -39,6 +43,7 @@ async def invoke(
     timeout = 180.0
     waited = 0.0
     while True:
+        waited += await gate.admit(scope)
         try:
             return await action(*values, **labels)
         except TelegramRetryAfter as error:
@@ -53,8 +58,11 @@ async def invoke(
                 raise
             if delay is None and tries + 1 > quota:
                 raise
-            await asyncio.sleep(pause)
-            waited += pause
+            if delay is not None:
+                await gate.hold(scope.target, pause)
+            else:
+                await asyncio.sleep(pause)
+                waited += pause
             tries += 1
             continue
         except Exception as error:
@@ -198,10 +198,11 @@ class SingleMediaPreparation:
         caption = captionkit.caption(payload)
         caption = self._guard.caption(caption, truncate, context.reporter)
         extras = self._schema.send(scope, payload.extra, span=len(caption or ""), media=True)
-        sender = getattr(bot, f"send_{payload.media.type.value}")
+        kind = payload.media.type.value
+        sender = getattr(bot, f"send_{kind}")
         arguments: dict[str, object] = {
             **context.targets,
-            payload.media.type.value: self._policy.adapt(payload.media.path, native=True),
+            kind: self._policy.adapt(payload.media.path, native=True, kind=kind),
             "reply_markup": context.markup,
         }
         if caption is not None:
@@ -0,0 +1,97 @@
+"""Background deletion queue batching purge requests across renders."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Hashable, List
+
+from navigator.core.service.scope import profile
+from navigator.core.telemetry import LogCode
+from navigator.core.value.message import Scope
+
+from .purge import PurgeTask
+
+
+@dataclass(slots=True)
+class _Pending:
+    task: PurgeTask
+    scope: Scope
+    identifiers: List[int] = field(default_factory=list)
+
+
+class DeletionQueue:
+    """Accept deletions without waiting and purge them on per-chat workers.
+
+    Identifiers submitted for the same chat while its worker is busy are
+    merged, so bursts from separate renders collapse into as few chunked
+    ``delete_messages`` calls as possible. Failures are reported on the
+    purge task's telemetry channel. :meth:`drain` flushes everything still
+    queued; the container registers it as a shutdown hook.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._workers: Dict[Hashable, asyncio.Task[None]] = {}
+        self.merged = 0
+
+    def submit(self, task: PurgeTask, scope: Scope, identifiers: List[int]) -> None:
+        """Schedule ``identifiers`` of ``scope`` for deletion through ``task``."""
+
+        if not identifiers:
+            return
+        key = (scope.chat, scope.business)
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = _Pending(task, scope, list(identifiers))
+        else:
+            entry.task = task
+            entry.identifiers.extend(identifiers)
+            self.merged += 1
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._drain(key))
+
+    def pending(self, scope: Scope) -> int:
+        entry = self._pending.get((scope.chat, scope.business))
+        return len(entry.identifiers) if entry else 0
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    async def drain(self) -> None:
+        """Wait until every queued deletion has been dispatched."""
+
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
+
+    async def _drain(self, key: Hashable) -> None:
+        try:
+            await asyncio.sleep(0)
+            while True:
+                entry = self._pending.pop(key, None)
+                if entry is None:
+                    return
+                try:
+                    await entry.task.execute(entry.scope, entry.identifiers)
+                except Exception as error:
+                    entry.task.channel.emit(
+                        logging.WARNING,
+                        LogCode.GATEWAY_DELETE_FAIL,
+                        scope=profile(entry.scope),
+                        count=len(entry.identifiers),
+                        note="deletion_queue",
+                        error_type=type(error).__name__,
+                    )
+        finally:
+            self._workers.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def shared_deletion_queue() -> DeletionQueue:
+    """Return the process-wide queue so deletions from separate updates merge."""
+
+    return DeletionQueue()
+
+
+__all__ = ["DeletionQueue", "shared_deletion_queue"]
@@ -0,0 +1,138 @@
+"""Proactive token-bucket throttling for outgoing Telegram calls."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from navigator.core.value.message import Scope
+
+
+class TokenBucket:
+    """Meter calls at ``rate`` per second while allowing ``burst`` at once.
+
+    Callers reserve tokens synchronously and sleep off the deficit, so the
+    bucket may run negative. Reservations are granted in arrival order,
+    which keeps waiting fair without holding a lock across the sleep.
+    """
+
+    __slots__ = ("_rate", "_burst", "_tokens", "_stamp")
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = float(rate)
+        self._burst = max(float(burst), 1.0)
+        self._tokens = self._burst
+        self._stamp = time.monotonic()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Consume ``cost`` tokens and return the delay owed before using them."""
+
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+        self._tokens -= cost
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+    def refund(self, cost: float = 1.0) -> None:
+        """Return ``cost`` tokens reserved by a caller that gave up waiting."""
+
+        self._tokens = min(self._burst, self._tokens + cost)
+
+    @property
+    def idle(self) -> bool:
+        """Report whether the bucket would be full if refilled now."""
+
+        elapsed = time.monotonic() - self._stamp
+        return self._tokens + elapsed * self._rate >= self._burst
+
+
+class RateLimiter:
+    """Enforce bot-wide, per-chat and stricter per-group Telegram rates.
+
+    All rates are calls per second, as are the settings feeding them.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 30.0,
+        chat: float = 1.0,
+        group: float = 20.0 / 60.0,
+        burst: float = 3.0,
+        capacity: int = 4096,
+    ) -> None:
+        self._global = TokenBucket(rate, burst=rate)
+        self._chat = chat
+        self._group = group
+        self._burst = burst
+        self._capacity = max(int(capacity), 1)
+        self._buckets: OrderedDict[object, TokenBucket] = OrderedDict()
+
+    async def acquire(self, scope: Scope, cost: float = 1.0) -> None:
+        """Wait until ``scope`` may issue calls worth ``cost`` tokens.
+
+        The chat bucket is waited out first and the bot-wide token is only
+        reserved afterwards, so a slow group never holds global capacity
+        that other chats could use meanwhile.
+        """
+
+        bucket = self._bucket(scope)
+        if bucket is not None:
+            await self._wait(bucket, cost)
+        await self._wait(self._global, cost)
+
+    @staticmethod
+    async def _wait(bucket: TokenBucket, cost: float) -> None:
+        delay = bucket.reserve(cost)
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            bucket.refund(cost)
+            raise
+
+    def _bucket(self, scope: Scope) -> TokenBucket | None:
+        key = scope.chat
+        if key is None:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+        rate = self._group if _grouped(scope) else self._chat
+        bucket = TokenBucket(rate, burst=self._burst)
+        self._buckets[key] = bucket
+        self._evict()
+        return bucket
+
+    def _evict(self) -> None:
+        while len(self._buckets) > self._capacity:
+            key, bucket = next(iter(self._buckets.items()))
+            if not bucket.idle and len(self._buckets) <= self._capacity * 2:
+                return
+            del self._buckets[key]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _grouped(scope: Scope) -> bool:
+    if scope.category in {"group", "channel"}:
+        return True
+    return isinstance(scope.chat, int) and scope.chat < 0
+
+
+@lru_cache(maxsize=None)
+def shared_limiter(rate: float, chat: float, group: float, burst: float) -> RateLimiter:
+    """Return the process-wide limiter for the given rates."""
+
+    return RateLimiter(rate=rate, chat=chat, group=group, burst=burst)
+
+
+__all__ = ["RateLimiter", "TokenBucket", "shared_limiter"]
@@ -4,6 +4,12 @@ from __future__ import annotations
 
 from .album import TelegramAlbumAssembler, assemble
 from .composer import MediaComposer, compose
+from .identity import (
+    BotMediaIdentities,
+    MediaIdentityCache,
+    bind_identities,
+    shared_identities,
+)
 from .policy import TelegramMediaPolicy, convert
 from .settings import MediaSettingsNormalizer
 from .telemetry import AlbumTelemetry
@@ -16,10 +22,14 @@ __all__ = [
     "AlbumValidator",
     "MediaSettingsNormalizer",
     "MediaComposer",
+    "BotMediaIdentities",
+    "MediaIdentityCache",
     "TelegramAlbumAssembler",
     "convert",
     "compose",
     "assemble",
+    "bind_identities",
+    "shared_identities",
     "InputFile",
     "InputMedia",
 ]
@@ -0,0 +1,232 @@
+"""Remember Telegram file identifiers of uploaded local media."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from functools import cache
+
+from navigator.core.entity.media import MediaItem
+from navigator.core.typing.result import GroupMeta, MediaMeta, Meta
+from navigator.core.util.path import local
+from navigator.core.value.content import Payload
+
+logger = logging.getLogger(__name__)
+
+_KEY_FIELDS = 4
+
+
+def fingerprint(path: str) -> str | None:
+    """Return a key identifying the current content of ``path``.
+
+    The key combines the absolute path with modification time and size, so
+    replacing the file on disk yields a new key instead of a stale upload.
+    """
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+
+
+class MediaIdentityCache:
+    """Map local media files to ``file_id`` values of earlier uploads.
+
+    Telegram issues ``file_id`` values per bot and a photo identifier cannot
+    be sent as a document, so entries are keyed by the uploading bot, the
+    media type and the file fingerprint. Bind the cache to one bot with
+    :func:`bind_identities` before use.
+
+    Entries live in an in-memory LRU bounded by ``capacity``. When ``store``
+    names a file, entries are also persisted there as JSON and loaded on
+    first use, so restarts keep reusing uploads. New entries only mark the
+    store dirty; it is rewritten in a worker thread at most once per
+    ``delay`` seconds and on :meth:`drain`.
+    """
+
+    def __init__(
+            self,
+            capacity: int = 1024,
+            *,
+            store: str | None = None,
+            delay: float = 1.0,
+    ) -> None:
+        self._capacity = max(int(capacity), 1)
+        self._store = store or None
+        self._delay = max(float(delay), 0.0)
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._disk: dict[str, str] | None = None
+        self._dirty = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._writing: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    def lookup(self, path: object, *, kind: str, owner: str) -> str | None:
+        """Return the cached ``file_id`` for ``path`` when it is still valid."""
+
+        key = _key(path, kind, owner)
+        if key is None:
+            return None
+        token = self._memory.get(key)
+        if token is not None:
+            self._memory.move_to_end(key)
+            return token
+        token = self._persisted().get(key)
+        if token is not None:
+            self._remember(key, token)
+        return token
+
+    def record(self, path: object, token: str | None, *, kind: str, owner: str) -> None:
+        """Associate ``path`` with ``token`` returned by Telegram."""
+
+        if not token or token == path:
+            return
+        key = _key(path, kind, owner)
+        if key is None or self._memory.get(key) == token:
+            return
+        self._remember(key, token)
+        if self._store is not None:
+            self._stage(self._store, key, token)
+
+    async def flush(self) -> None:
+        """Write pending entries to the store without blocking the event loop."""
+
+        async with self._lock:
+            if not self._dirty or self._store is None:
+                return
+            self._dirty = False
+            await asyncio.to_thread(_write, self._store, dict(self._persisted()))
+
+    async def drain(self) -> None:
+        """Cancel the pending timer and flush right away, e.g. on shutdown."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, key: str, token: str) -> None:
+        self._memory[key] = token
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._capacity:
+            self._memory.popitem(last=False)
+
+    def _persisted(self) -> dict[str, str]:
+        if self._store is None:
+            return {}
+        if self._disk is None:
+            try:
+                with open(self._store, encoding="utf-8") as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                data = {}
+            self._disk = (
+                {str(k): str(v) for k, v in data.items() if str(k).count("|") >= _KEY_FIELDS}
+                if isinstance(data, dict)
+                else {}
+            )
+        return self._disk
+
+    def _stage(self, store: str, key: str, token: str) -> None:
+        disk = self._persisted()
+        prefix = key.rsplit("|", 2)[0] + "|"
+        for stale in [entry for entry in disk if entry.startswith(prefix)]:
+            del disk[stale]
+        disk[key] = token
+        self._dirty = True
+        if self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._dirty = False
+            _write(store, disk)
+            return
+        self._timer = loop.call_later(self._delay, self._fire)
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._writing = asyncio.ensure_future(self.flush())
+
+
+class BotMediaIdentities:
+    """Expose the entries of a shared :class:`MediaIdentityCache` for one bot."""
+
+    __slots__ = ("_cache", "_owner")
+
+    def __init__(self, cache: MediaIdentityCache, owner: str) -> None:
+        self._cache = cache
+        self._owner = owner
+
+    def lookup(self, path: object, kind: str) -> str | None:
+        return self._cache.lookup(path, kind=kind, owner=self._owner)
+
+    def absorb(self, payload: Payload, meta: Meta) -> None:
+        """Record identifiers reported for local files of ``payload``."""
+
+        if isinstance(meta, MediaMeta) and payload.media is not None:
+            self._record(payload.media, meta.file)
+        elif isinstance(meta, GroupMeta) and payload.group:
+            for item, cluster in zip(payload.group, meta.clusters, strict=False):
+                self._record(item, cluster.file)
+
+    def _record(self, item: MediaItem, token: str | None) -> None:
+        self._cache.record(item.path, token, kind=item.type.value, owner=self._owner)
+
+
+def bind_identities(
+    uploads: MediaIdentityCache | None,
+    bot: object,
+) -> BotMediaIdentities | None:
+    """Return ``uploads`` bound to ``bot``, or ``None`` when either is unavailable."""
+
+    owner = getattr(bot, "id", None)
+    if uploads is None or owner is None:
+        return None
+    return BotMediaIdentities(uploads, str(owner))
+
+
+def _write(store: str, entries: dict[str, str]) -> None:
+    folder = os.path.dirname(os.path.abspath(store))
+    try:
+        fd, temp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entries, handle)
+        os.replace(temp, store)
+    except OSError as error:
+        logger.warning("Failed to persist media identities to %s: %s", store, error)
+
+
+def _key(path: object, kind: str, owner: str) -> str | None:
+    if not isinstance(path, str) or not local(path):
+        return None
+    stamp = fingerprint(path)
+    if stamp is None:
+        return None
+    return f"{owner}|{kind}|{stamp}"
+
+
+@cache
+def shared_identities(capacity: int = 1024, store: str | None = None) -> MediaIdentityCache | None:
+    """Return the process-wide identity cache, or ``None`` when ``capacity`` is zero."""
+
+    if capacity <= 0:
+        return None
+    return MediaIdentityCache(capacity, store=store)
+
+
+__all__ = [
+    "BotMediaIdentities",
+    "MediaIdentityCache",
+    "bind_identities",
+    "fingerprint",
+    "shared_identities",
+]
@@ -9,6 +9,7 @@ from navigator.core.error import EditForbidden
 from navigator.core.port.pathpolicy import MediaPathPolicy
 from navigator.core.util.path import local, remote
 
+from .identity import BotMediaIdentities
 from .types import BufferedInputFile, FSInputFile, InputFile, URLInputFile
 
 _FILE_ID_RE = re.compile(r"^[A-Za-z0-9_.:\-=]{20,}$")
@@ -17,11 +18,21 @@ _FILE_ID_RE = re.compile(r"^[A-Za-z0-9_.:\-=]{20,}$")
 class TelegramMediaPolicy(MediaPathPolicy):
     """Enforce media path policies for Telegram transports."""
 
-    def __init__(self, *, strict: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        strict: bool = True,
+        identities: BotMediaIdentities | None = None,
+    ) -> None:
         self._strict = strict
+        self._identities = identities
 
-    def admissible(self, path: object, *, inline: bool) -> bool:
-        """Return ``True`` when ``path`` may be used for inline uploads."""
+    def admissible(self, path: object, *, inline: bool, kind: str | None = None) -> bool:
+        """Return ``True`` when ``path`` may be used for inline uploads.
+
+        Local files qualify only when an earlier upload of the same ``kind``
+        is known; without ``kind`` no identifier is reused.
+        """
 
         if not inline:
             return True
@@ -32,15 +43,18 @@ class TelegramMediaPolicy(MediaPathPolicy):
         if remote(path):
             return True
         if local(path):
-            return False
+            return self._known(path, kind) is not None
         return bool(_FILE_ID_RE.match(path)) if self._strict else True
 
-    def adapt(self, path: object, *, native: bool) -> object:
+    def adapt(self, path: object, *, native: bool, kind: str | None = None) -> object:
         """Return a Telegram-compatible input for ``path`` respecting flags."""
 
         if isinstance(path, BufferedInputFile | URLInputFile):
             return path
         if isinstance(path, FSInputFile):
+            known = self._known(str(path.path), kind)
+            if known is not None:
+                return known
             if not native:
                 raise EditForbidden("inline_local_path_forbidden")
             return path
@@ -48,17 +62,25 @@ class TelegramMediaPolicy(MediaPathPolicy):
             if remote(path):
                 return URLInputFile(path)
             if local(path):
+                known = self._known(path, kind)
+                if known is not None:
+                    return known
                 if not native:
                     raise EditForbidden("inline_local_path_forbidden")
                 return FSInputFile(path)
             return path
         return path
 
+    def _known(self, path: str, kind: str | None) -> str | None:
+        if self._identities is None or kind is None:
+            return None
+        return self._identities.lookup(path, kind)
+
 
 def convert(item: MediaItem, *, policy: MediaPathPolicy, native: bool) -> InputFile:
     """Return Telegram input file representation for ``item``."""
 
-    return policy.adapt(item.path, native=native)
+    return policy.adapt(item.path, native=native, kind=item.type.value)
 
 
 __all__ = ["TelegramMediaPolicy", "convert"]
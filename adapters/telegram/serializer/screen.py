@@ -3,23 +3,52 @@ from __future__ import annotations
 import inspect
 import logging
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
+from functools import cache
 from typing import Any, Dict, FrozenSet
 
+_SEEN: set[tuple[str, FrozenSet[str]]] = set()
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+@cache
+def _parameters(target: Any, bound: bool) -> FrozenSet[str] | None:
+    obj = target.__init__ if inspect.isclass(target) else target
+    try:
+        sig = inspect.signature(obj)
+    except Exception:  # pragma: no cover - defensive
+        return None
+    params = list(sig.parameters.values())
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+        return None
+    if bound and params and params[0].kind in _POSITIONAL:
+        params = params[1:]
+    return frozenset(p.name for p in params)
+
+
+def signature(target: Any) -> FrozenSet[str] | None:
+    """Return keyword names accepted by ``target`` or ``None`` when unrestricted.
+
+    Bound methods are unwrapped to their function so every bot instance and
+    update shares one cached entry per API method; the receiver parameter is
+    dropped so it never passes the screen.
+    """
+
+    func = getattr(target, "__func__", None)
+    try:
+        if func is not None:
+            return _parameters(func, True)
+        return _parameters(target, False)
+    except TypeError:  # pragma: no cover - unhashable callables
+        return _parameters.__wrapped__(target, False)
+
 
 class SignatureScreen:
     def __init__(self, telemetry: Telemetry) -> None:
-        self._seen: set[tuple[str, FrozenSet[str]]] = set()
+        self._seen = _SEEN
         self._channel: TelemetryChannel = telemetry.channel(__name__)
 
-    def _signature(self, target: Any) -> set[str] | None:
-        obj = target.__init__ if inspect.isclass(target) else target
-        try:
-            sig = inspect.signature(obj)
-        except Exception:  # pragma: no cover - defensive
-            return None
-        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()):
-            return None
-        return set(sig.parameters.keys())
+    def _signature(self, target: Any) -> FrozenSet[str] | None:
+        return signature(target)
 
     def filter(self, target: Any, extra: Dict[str, Any] | None) -> Dict[str, Any]:
         if not extra:
@@ -38,7 +67,7 @@ class SignatureScreen:
                 )
             return dict(extra)
         filtered = {k: v for k, v in extra.items() if k in allowed}
-        if set(filtered.keys()) != set(extra.keys()):
+        if len(filtered) != len(extra):
             self._channel.emit(
                 logging.DEBUG,
                 LogCode.EXTRA_FILTERED_OUT,
@@ -51,4 +80,4 @@ class SignatureScreen:
         return filtered
 
 
-__all__ = ["SignatureScreen"]
+__all__ = ["SignatureScreen", "signature"]
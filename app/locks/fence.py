@@ -0,0 +1,51 @@
+"""Message gateway claiming the optimistic guard before Telegram calls."""
+from __future__ import annotations
+
+from navigator.core.port.message import MessageGateway, Result
+from navigator.core.value.content import Payload
+from navigator.core.value.message import Scope
+
+from .guard import fence
+
+
+class FencedGateway(MessageGateway):
+    """Delegate to ``gateway`` once the active guard allows side effects.
+
+    Every call is preceded by :func:`fence`, so an optimistic attempt that
+    planned on stale history raises ``HistoryConflict`` and is retried
+    before it sent, edited or deleted a single message.
+    """
+
+    def __init__(self, gateway: MessageGateway) -> None:
+        self._gateway = gateway
+
+    async def send(self, scope: Scope, payload: Payload) -> Result:
+        await fence()
+        return await self._gateway.send(scope, payload)
+
+    async def rewrite(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await fence()
+        return await self._gateway.rewrite(scope, identifier, payload)
+
+    async def recast(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await fence()
+        return await self._gateway.recast(scope, identifier, payload)
+
+    async def retitle(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await fence()
+        return await self._gateway.retitle(scope, identifier, payload)
+
+    async def remap(self, scope: Scope, identifier: int, payload: Payload) -> Result:
+        await fence()
+        return await self._gateway.remap(scope, identifier, payload)
+
+    async def delete(self, scope: Scope, identifiers: list[int]) -> None:
+        await fence()
+        await self._gateway.delete(scope, identifiers)
+
+    async def alert(self, scope: Scope, text: str) -> None:
+        await fence()
+        await self._gateway.alert(scope, text)
+
+
+__all__ = ["FencedGateway"]
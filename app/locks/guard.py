@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from navigator.core.port.locks import Lock, LockProvider
-from typing import Protocol
+import asyncio
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from navigator.core.error import HistoryConflict, LeaseLost
+from navigator.core.port.locks import Lock, LockProvider, bind, unbind
+from navigator.core.port.unit import WorkUnit
+from navigator.app.locks.mailbox import Intent, ScopeMailbox
+from typing import Awaitable, Callable, Protocol, TypeVar
+
+T = TypeVar("T")
 
 
 class ScopeForm(Protocol):
-    inline: object | None
-    chat: object | None
-    business: object | None
+    @property
+    def inline(self) -> object | None: ...
+
+    @property
+    def chat(self) -> object | None: ...
+
+    @property
+    def business(self) -> object | None: ...
 
 
 def _key(scope: ScopeForm) -> tuple[object | None, object | None]:
@@ -18,28 +31,216 @@ def _key(scope: ScopeForm) -> tuple[object | None, object | None]:
     )
 
 
+async def _release(lock: Lock) -> None:
+    releaser = getattr(lock, "untether", None)
+    if callable(releaser):
+        await releaser()
+    else:
+        lock.release()
+
+
+def _lost(lock: Lock) -> LeaseLost | None:
+    if not getattr(lock, "lost", False):
+        return None
+    lease = getattr(lock, "lease", None)
+    return LeaseLost(getattr(lease, "key", None))
+
+
+def _surface(lock: Lock, exc_type: type[BaseException] | None, exc: BaseException | None) -> None:
+    """Turn the cancellation issued by a lost lease into :class:`LeaseLost`."""
+
+    if exc_type is None or not issubclass(exc_type, asyncio.CancelledError):
+        return
+    error = _lost(lock)
+    if error is None:
+        return
+    task = asyncio.current_task()
+    if task is not None:
+        task.uncancel()
+    raise error from exc
+
+
 @dataclass
 class _Guard:
     lock: Lock
+    unit: WorkUnit | None = None
+    token: Token[Lock | None] | None = None
 
     async def __aenter__(self) -> None:  # pragma: no cover - thin wrapper
         await self.lock.acquire()
+        self.token = bind(self.lock)
+        if self.unit is not None:
+            self.unit.begin()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:  # pragma: no cover - thin wrapper
+        try:
+            lost = _lost(self.lock)
+            if self.unit is not None:
+                if exc_type is None and lost is None:
+                    await self.unit.commit()
+                else:
+                    self.unit.rollback()
+            if exc_type is None and lost is not None:
+                raise lost
+        finally:
+            if self.token is not None:
+                unbind(self.token)
+                self.token = None
+            await _release(self.lock)
+        _surface(self.lock, exc_type, exc)
+
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - thin wrapper
-        releaser = getattr(self.lock, "untether", None)
-        if callable(releaser):
-            await releaser()
-        else:
-            self.lock.release()
+@dataclass
+class _OptimisticGuard:
+    """Run the body unlocked and take the scope lock at its first side effect.
+
+    :meth:`claim` acquires the lock and settles the unit before the body
+    touches Telegram, so an attempt planned on stale reads fails before it
+    sends, edits or deletes anything. Once claimed, the lock is held until
+    the unit commits; a claim after its lease was lost raises
+    :class:`LeaseLost`.
+    """
+
+    lock: Lock
+    unit: WorkUnit
+    held: bool = False
+    failure: HistoryConflict | None = None
+    gate: asyncio.Lock = field(default_factory=asyncio.Lock)
+    token: Token[_OptimisticGuard | None] | None = None
+    hold: Token[Lock | None] | None = None
+
+    async def __aenter__(self) -> None:  # pragma: no cover - thin wrapper
+        self.unit.begin()
+        self.token = _ACTIVE.set(self)
+        self.hold = bind(self.lock)
+
+    async def claim(self) -> None:
+        async with self.gate:
+            if not self.held:
+                await self.lock.acquire()
+                self.held = True
+                try:
+                    await self.unit.settle()
+                except HistoryConflict as error:
+                    self.failure = error
+        if self.failure is not None:
+            raise self.failure
+        lost = _lost(self.lock)
+        if lost is not None:
+            raise lost
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:  # pragma: no cover - thin wrapper
+        if self.token is not None:
+            _ACTIVE.reset(self.token)
+        try:
+            if exc_type is not None:
+                self.unit.rollback()
+                return
+            if not self.held:
+                await self.lock.acquire()
+                self.held = True
+            lost = _lost(self.lock)
+            if lost is not None:
+                self.unit.rollback()
+                raise lost
+            await self.unit.commit()
+        finally:
+            if self.hold is not None:
+                unbind(self.hold)
+                self.hold = None
+            if self.held:
+                self.held = False
+                await _release(self.lock)
+            _surface(self.lock, exc_type, exc)
+
+
+_ACTIVE: ContextVar[_OptimisticGuard | None] = ContextVar("navigator_guard", default=None)
+
+
+async def fence() -> None:
+    """Claim the active optimistic guard ahead of an irreversible side effect."""
+
+    guard = _ACTIVE.get()
+    if guard is not None:
+        await guard.claim()
 
 
 class Guardian:
-    def __init__(self, provider: LockProvider) -> None:
+    """Serialise operations per scope.
+
+    Entering the guard directly holds the scope lock for the whole body. In
+    optimistic mode :meth:`run` instead runs the body without the lock until
+    its first side effect (see :func:`fence`), commits the unit of work with
+    a generation check and re-plans an operation that lost the race. With a
+    ``mailbox`` operations submitted through :meth:`run` execute one at a
+    time per scope and bursts are coalesced according to their ``intent``.
+    """
+
+    def __init__(
+        self,
+        provider: LockProvider,
+        unit: WorkUnit | None = None,
+        *,
+        optimistic: bool = False,
+        attempts: int = 3,
+        mailbox: ScopeMailbox | None = None,
+    ) -> None:
         self._provider = provider
+        self._unit = unit
+        self._mailbox = mailbox
+        self._optimistic = optimistic
+        self._attempts = max(1, attempts)
 
     def __call__(self, scope: ScopeForm) -> _Guard:
-        latch = self._provider.latch(_key(scope))
-        return _Guard(lock=latch)
+        return _Guard(lock=self._provider.latch(_key(scope)), unit=self._unit)
+
+    def _enter(self, scope: ScopeForm) -> _Guard | _OptimisticGuard:
+        if self._optimistic and self._unit is not None:
+            return _OptimisticGuard(lock=self._provider.latch(_key(scope)), unit=self._unit)
+        return self(scope)
+
+    async def run(
+        self,
+        scope: ScopeForm,
+        action: Callable[[], Awaitable[None]],
+        *,
+        intent: Intent | None = None,
+    ) -> None:
+        """Run ``action`` guarded, repeating it when its commit conflicts."""
+
+        if self._mailbox is None:
+            await self._attempt(scope, action)
+            return
+        intent = intent or Intent(kind="run")
+        rebuild = intent.rebuild
+        if rebuild is not None:
+            intent = Intent(
+                kind=intent.kind,
+                count=intent.count,
+                rebuild=lambda count: lambda: self._attempt(scope, rebuild(count)),
+            )
+        await self._mailbox.submit(_key(scope), intent, lambda: self._attempt(scope, action))
+
+    async def _attempt(self, scope: ScopeForm, action: Callable[[], Awaitable[T]]) -> T:
+        attempt = 1
+        while True:
+            try:
+                async with self._enter(scope):
+                    return await action()
+            except HistoryConflict:
+                if attempt >= self._attempts:
+                    raise
+                attempt += 1
 
 
-__all__ = ["Guardian"]
+__all__ = ["Guardian", "fence"]
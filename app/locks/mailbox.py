@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Awaitable, Callable, Deque, Dict, Hashable, List
+
+Action = Callable[[], Awaitable[None]]
+
+_SUPERSEDED = frozenset({"add", "replace"})
+_COUNTED = frozenset({"pop"})
+_DRAINING: ContextVar[Hashable | None] = ContextVar("navigator_mailbox_draining", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class Intent:
+    """Describe how a queued operation may merge with its predecessor.
+
+    ``add`` and ``replace`` supersede a pending request of the same kind,
+    while ``pop`` requests add up their ``count`` and run once through
+    ``rebuild``. Any other kind is executed as submitted.
+    """
+
+    kind: str
+    count: int = 1
+    rebuild: Callable[[int], Action] | None = None
+
+
+async def _invoke(action: Action) -> None:
+    await action()
+
+
+@dataclass(slots=True)
+class _Job:
+    intent: Intent
+    action: Action
+    context: Context
+    waiters: List[asyncio.Future[None]] = field(default_factory=list)
+
+
+class ScopeMailbox:
+    """Run operations per scope on a single worker task, coalescing bursts.
+
+    Each job runs in a copy of the context it was submitted from, so context
+    variables of the caller stay visible although a shared worker runs it.
+    """
+
+    def __init__(self) -> None:
+        self._queues: Dict[Hashable, Deque[_Job]] = {}
+        self._workers: Dict[Hashable, asyncio.Task[None]] = {}
+        self.coalesced = 0
+
+    async def submit(self, key: Hashable, intent: Intent, action: Action) -> None:
+        """Queue ``action`` for ``key`` and wait until it ran or was superseded."""
+
+        if _DRAINING.get() == key:
+            await action()
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        context = copy_context()
+        context.run(_DRAINING.set, key)
+        queue = self._queues.setdefault(key, deque())
+        if not self._merge(queue, intent, action, context, waiter):
+            queue.append(_Job(intent=intent, action=action, context=context, waiters=[waiter]))
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._drain(key))
+        await asyncio.shield(waiter)
+
+    def pending(self, key: Hashable) -> int:
+        return len(self._queues.get(key, ()))
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def _merge(
+        self,
+        queue: Deque[_Job],
+        intent: Intent,
+        action: Action,
+        context: Context,
+        waiter: asyncio.Future[None],
+    ) -> bool:
+        if not queue or queue[-1].intent.kind != intent.kind:
+            return False
+        last = queue[-1]
+        if intent.kind in _SUPERSEDED:
+            self._settle(last.waiters)
+            queue[-1] = _Job(intent=intent, action=action, context=context, waiters=[waiter])
+        elif intent.kind in _COUNTED and intent.rebuild is not None:
+            total = last.intent.count + intent.count
+            merged = Intent(kind=intent.kind, count=total, rebuild=intent.rebuild)
+            last.intent = merged
+            last.action = intent.rebuild(total)
+            last.context = context
+            last.waiters.append(waiter)
+        else:
+            return False
+        self.coalesced += 1
+        return True
+
+    async def _drain(self, key: Hashable) -> None:
+        queue = self._queues[key]
+        loop = asyncio.get_running_loop()
+        try:
+            while queue:
+                job = queue.popleft()
+                try:
+                    await loop.create_task(_invoke(job.action), context=job.context)
+                except Exception as exc:
+                    self._settle(job.waiters, exc)
+                except BaseException as exc:
+                    self._settle(job.waiters, exc)
+                    while queue:
+                        self._settle(queue.popleft().waiters, exc)
+                    raise
+                else:
+                    self._settle(job.waiters)
+        finally:
+            self._workers.pop(key, None)
+            if not queue:
+                self._queues.pop(key, None)
+
+    @staticmethod
+    def _settle(waiters: List[asyncio.Future[None]], error: BaseException | None = None) -> None:
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            elif isinstance(error, asyncio.CancelledError):
+                waiter.cancel()
+            else:
+                waiter.set_exception(error)
+
+
+@lru_cache(maxsize=1)
+def shared_mailbox() -> ScopeMailbox:
+    """Return the process-wide mailbox so bursts from separate updates meet."""
+
+    return ScopeMailbox()
+
+
+__all__ = ["Intent", "ScopeMailbox", "shared_mailbox"]
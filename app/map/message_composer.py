@@ -6,6 +6,7 @@ from typing import Any, Iterable, Optional
 
 from ...core.entity.history import Entry, Message
 from ...core.entity.media import MediaItem
+from ...core.service.rendering.fingerprint import fingerprint
 from ...core.util.entities import EntitySanitizer
 from ...core.value.content import Payload
 from .extra import ExtraSanitizer
@@ -49,6 +50,7 @@ class MessageComposer:
             inline=inline,
             automated=True,
             ts=self._timestamp,
+            fingerprint=fingerprint(payload),
         )
 
     def _resolve_extra(
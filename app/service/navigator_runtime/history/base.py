@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any, Awaitable, Callable
 
 from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import Intent
 
 from ..reporter import NavigatorReporter
 
@@ -26,11 +27,12 @@ class _HistoryOperation:
         self,
         method: str,
         action: Callable[[], Awaitable[None]],
+        *,
+        intent: Intent | None = None,
         **fields: object,
     ) -> None:
         self._reporter.emit(method, **fields)
-        async with self._guard(self._scope):
-            await action()
+        await self._guard.run(self._scope, action, intent=intent or Intent(kind=method))
 
 
 __all__ = ["_HistoryOperation"]
@@ -1,9 +1,10 @@
 """History operation implementations coordinated by the runtime."""
 from __future__ import annotations
 
-from typing import SupportsInt
+from typing import Awaitable, Callable, SupportsInt
 
 from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import Intent
 from navigator.core.contracts.back import NavigatorBackContext
 
 from ..bundler import PayloadBundleSource, PayloadBundler
@@ -102,7 +103,11 @@ class HistoryRebaseOperation(_HistoryOperation):
 
 
 class HistoryBackOperation(_HistoryOperation):
-    """Drive backtracking with guard and telemetry instrumentation."""
+    """Drive backtracking with guard and telemetry instrumentation.
+
+    Back requests are queued but never coalesced: each step re-renders the
+    previous screen onto the messages of the one it leaves.
+    """
 
     def __init__(
         self,
@@ -140,10 +145,14 @@ class HistoryTrimOperation(_HistoryOperation):
 
     async def __call__(self, count: int = 1) -> None:
 
-        async def action() -> None:
-            await self._trimmer.execute(count)
+        def rebuild(total: int) -> Callable[[], Awaitable[None]]:
+            async def action() -> None:
+                await self._trimmer.execute(total)
+
+            return action
 
-        await self._run("pop", action, count=count)
+        intent = Intent(kind="pop", count=count, rebuild=rebuild)
+        await self._run("pop", rebuild(count), intent=intent, count=count)
 
 
 __all__ = [
@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Any, Protocol
 
 from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import Intent
 from navigator.core.error import StateNotFound
 from navigator.core.value.message import Scope
 
@@ -78,15 +79,16 @@ class StateOperationExecutor:
         self._alerts = alerts
 
     async def assign(self, status: str, context: dict[str, Any]) -> None:
-        async with self._guard(self._scope):
+        async def action() -> None:
             try:
                 await self._setter.execute(self._scope, status, context)
             except StateNotFound:
                 await self._alerts.missing()
 
+        await self._guard.run(self._scope, action, intent=Intent(kind="set"))
+
     async def alert(self) -> None:
-        async with self._guard(self._scope):
-            await self._alerts.notify()
+        await self._guard.run(self._scope, self._alerts.notify, intent=Intent(kind="alert"))
 
 
 class NavigatorStateService:
@@ -1,6 +1,8 @@
 """Tail-related helpers used by the navigator runtime."""
 from __future__ import annotations
 
+from navigator.core.value.message import Scope
+
 from .tail_components import (
     TailEditRequest,
     TailGateway,
@@ -29,22 +31,27 @@ class NavigatorTail:
 
     async def get(self) -> TailView | None:
         self._telemetry.record_get()
-        async with self._locker.acquire() as scope:
-            identifier = await self._gateway.peek()
+
+        async def peek(scope: Scope) -> int | None:
+            return await self._gateway.peek()
+
+        identifier = await self._locker.run(peek)
         if identifier is None:
             return None
-        return self._view_factory.create(scope=scope, identifier=identifier)
+        return self._view_factory.create(scope=self._locker.scope, identifier=identifier)
 
     async def delete(self) -> None:
         self._telemetry.record_delete()
-        async with self._locker.acquire() as scope:
-            await self._gateway.delete(scope)
+        await self._locker.run(self._gateway.delete)
 
     async def edit(self, request: TailEditRequest) -> int | None:
         description = request.describe()
         self._telemetry.record_edit(description)
-        async with self._locker.acquire() as scope:
+
+        async def edit(scope: Scope) -> int | None:
             return await self._gateway.edit(scope, request)
 
+        return await self._locker.run(edit)
+
 
 __all__ = ["NavigatorTail"]
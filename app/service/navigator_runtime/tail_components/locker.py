@@ -1,15 +1,22 @@
 """Guard helpers protecting navigator tail operations."""
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Awaitable, Callable, TypeVar
 
 from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import Intent
 from navigator.core.value.message import Scope
 
+T = TypeVar("T")
+
 
 class TailLocker:
-    """Provide a scoped guard context for navigator tail operations."""
+    """Run navigator tail operations through the scope guard.
+
+    Operations are submitted like history operations, so they queue behind
+    pending jobs of the scope and are retried when an optimistic attempt
+    conflicts.
+    """
 
     def __init__(self, guard: Guardian, scope: Scope) -> None:
         self._guard = guard
@@ -19,10 +26,15 @@ class TailLocker:
     def scope(self) -> Scope:
         return self._scope
 
-    @asynccontextmanager
-    async def acquire(self) -> AsyncIterator[Scope]:
-        async with self._guard(self._scope):
-            yield self._scope
+    async def run(self, operation: Callable[[Scope], Awaitable[T]]) -> T:
+        outcome: list[T] = []
+
+        async def action() -> None:
+            outcome.clear()
+            outcome.append(await operation(self._scope))
+
+        await self._guard.run(self._scope, action, intent=Intent(kind="tail"))
+        return outcome[0]
 
 
 __all__ = ["TailLocker"]
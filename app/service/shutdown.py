@@ -0,0 +1,81 @@
+"""Process-wide hooks awaited when the bot shuts down."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Protocol, TypeVar, overload
+
+Hook = Callable[[], Awaitable[None]]
+
+
+class Drainable(Protocol):
+    async def drain(self) -> None: ...
+
+
+D = TypeVar("D", bound=Drainable)
+
+
+class ShutdownHooks:
+    """Collect cleanup coroutines registered while containers are assembled.
+
+    Hooks are kept once each, however many updates resolve the resource
+    that registered them. :meth:`run` awaits all of them and re-raises the
+    first failure afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._hooks: list[Hook] = []
+
+    def register(self, hook: Hook) -> None:
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    async def run(self) -> None:
+        outcomes = await asyncio.gather(
+            *(hook() for hook in self._hooks),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+
+@lru_cache(maxsize=1)
+def shutdown_hooks() -> ShutdownHooks:
+    """Return the process-wide hook registry."""
+
+    return ShutdownHooks()
+
+
+@overload
+def drained(resource: D, hooks: ShutdownHooks) -> D: ...
+
+
+@overload
+def drained(resource: None, hooks: ShutdownHooks) -> None: ...
+
+
+def drained(resource: D | None, hooks: ShutdownHooks) -> D | None:
+    """Register ``resource.drain`` with ``hooks`` and return ``resource``.
+
+    ``None`` passes through untouched, so disabled optional resources need
+    no special casing.
+    """
+
+    if resource is not None:
+        hooks.register(resource.drain)
+    return resource
+
+
+async def shutdown() -> None:
+    """Await every registered hook, e.g. from a dispatcher shutdown handler."""
+
+    await shutdown_hooks().run()
+
+
+__all__ = ["Drainable", "ShutdownHooks", "drained", "shutdown", "shutdown_hooks"]
@@ -1,12 +1,15 @@
 """Store-related helpers split across dedicated modules."""
 
+from ....core.entity.history import replay
 from .persistence import (
     HistoryArchiver,
     HistoryPersistencePipeline,
     HistoryPersistencePipelineFactory,
     HistoryTrimmer,
     LatestMarkerUpdater,
+    amend,
     persist,
+    prune,
 )
 from .preservation import preserve
 
@@ -16,6 +19,9 @@ __all__ = [
     "HistoryPersistencePipelineFactory",
     "HistoryTrimmer",
     "LatestMarkerUpdater",
+    "amend",
     "preserve",
     "persist",
+    "prune",
+    "replay",
 ]
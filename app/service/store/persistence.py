@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from ....core.entity.history import Entry
-from ....core.port.history import HistoryRepository
+from ....core.entity.history import Entry, HistoryDelta
+from ....core.port.history import HistoryRepository, IncrementalHistoryRepository
 from ....core.port.last import LatestRepository
 from ....core.telemetry import LogCode, Telemetry, TelemetryChannel
 
@@ -22,6 +22,25 @@ def _latest_marker(history: Sequence[Entry]) -> int | None:
     return messages[0].id
 
 
+async def amend(archive: HistoryRepository, delta: HistoryDelta) -> None:
+    """Apply ``delta`` incrementally or fall back to a full snapshot rewrite."""
+
+    if isinstance(archive, IncrementalHistoryRepository):
+        await archive.amend(delta)
+    else:
+        await archive.archive(delta.history[:])
+
+
+def prune(delta: HistoryDelta, history: Sequence[Entry]) -> HistoryDelta:
+    """Return ``delta`` extended with the head pruning that produced ``history``."""
+
+    removed = len(delta.history) - len(history)
+    if removed <= 0:
+        return delta
+    pinned = bool(history) and history[0] is delta.history[0]
+    return replace(delta, history=history, shed=delta.shed + removed, pinned=pinned)
+
+
 class HistoryTelemetryReporter:
     """Emit telemetry envelopes describing persistence operations."""
 
@@ -72,7 +91,7 @@ class HistoryTrimmer:
 
     def __init__(
         self,
-        policy: Callable[[list[Entry], int], list[Entry]],
+        policy: Callable[[Sequence[Entry], int], Sequence[Entry]],
         limit: int,
         reporter: HistoryTelemetryReporter,
     ) -> None:
@@ -80,14 +99,13 @@ class HistoryTrimmer:
         self._limit = limit
         self._reporter = reporter
 
-    def apply(self, history: Sequence[Entry], *, operation: str) -> list[Entry]:
+    def apply(self, history: Sequence[Entry], *, operation: str) -> Sequence[Entry]:
         """Return trimmed history while emitting telemetry when truncation occurs."""
 
-        snapshot = list(history)
-        trimmed = self._policy(snapshot, self._limit)
+        trimmed = self._policy(history, self._limit)
         self._reporter.trimmed(
             operation=operation,
-            before=len(snapshot),
+            before=len(history),
             after=len(trimmed),
         )
         return trimmed
@@ -107,10 +125,16 @@ class HistoryArchiver:
     async def save(self, history: Sequence[Entry], *, operation: str) -> None:
         """Archive ``history`` while reporting telemetry."""
 
-        snapshot = list(history)
+        snapshot = history[:]
         await self._archive.archive(snapshot)
         self._reporter.saved(operation=operation, size=len(snapshot))
 
+    async def amend(self, delta: HistoryDelta, *, operation: str) -> None:
+        """Archive the change described by ``delta`` while reporting telemetry."""
+
+        await amend(self._archive, delta)
+        self._reporter.saved(operation=operation, size=len(delta.history))
+
 
 class LatestMarkerUpdater:
     """Refresh the latest message marker after persisting history."""
@@ -140,7 +164,7 @@ class HistoryPersistencePipeline:
         self,
         archive: HistoryRepository,
         ledger: LatestRepository,
-        prune_history: Callable[[list[Entry], int], list[Entry]],
+        prune_history: Callable[[Sequence[Entry], int], Sequence[Entry]],
         limit: int,
         telemetry: Telemetry | None = None,
     ) -> None:
@@ -156,6 +180,13 @@ class HistoryPersistencePipeline:
         await self._archiver.save(trimmed, operation=operation)
         await self._marker.update(trimmed, operation=operation)
 
+    async def amend(self, delta: HistoryDelta, *, operation: str) -> None:
+        """Persist the change described by ``delta`` through pipeline components."""
+
+        trimmed = self._trimmer.apply(delta.history, operation=operation)
+        await self._archiver.amend(prune(delta, trimmed), operation=operation)
+        await self._marker.update(trimmed, operation=operation)
+
 
 @dataclass(frozen=True)
 class HistoryPersistencePipelineFactory:
@@ -163,7 +194,7 @@ class HistoryPersistencePipelineFactory:
 
     archive: HistoryRepository
     ledger: LatestRepository
-    prune_history: Callable[[list[Entry], int], list[Entry]]
+    prune_history: Callable[[Sequence[Entry], int], Sequence[Entry]]
     limit: int
     telemetry: Telemetry | None = None
 
@@ -182,7 +213,7 @@ class HistoryPersistencePipelineFactory:
 async def persist(
     archive: HistoryRepository,
     ledger: LatestRepository,
-    prune_history: Callable[[list[Entry], int], list[Entry]],
+    prune_history: Callable[[Sequence[Entry], int], Sequence[Entry]],
     limit: int,
     history: Sequence[Entry],
     *,
@@ -207,5 +238,6 @@ __all__ = [
     "HistoryPersistencePipeline",
     "HistoryTrimmer",
     "LatestMarkerUpdater",
+    "amend",
     "persist",
 ]
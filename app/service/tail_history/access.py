@@ -1,7 +1,7 @@
 """Access layer composing storage primitives for tail history."""
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import MutableSequence, Sequence
 
 from navigator.core.entity.history import Entry
 from navigator.core.port.history import HistoryRepository
@@ -25,10 +25,10 @@ class TailHistoryAccess:
     async def peek(self) -> int | None:
         return await self._store.peek()
 
-    async def load(self) -> list[Entry]:
+    async def load(self) -> MutableSequence[Entry]:
         return await self._store.load()
 
-    async def save(self, history: Sequence[Entry]) -> list[Entry]:
+    async def save(self, history: Sequence[Entry]) -> Sequence[Entry]:
         return await self._store.archive(history)
 
     async def mark(self, marker: int | None) -> None:
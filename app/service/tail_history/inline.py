@@ -28,7 +28,7 @@ class TailInlineHistory:
         scope: Scope,
         *,
         op: str,
-    ) -> list[Entry]:
+    ) -> Sequence[Entry]:
         stored, marker = await self._trimmer.trim(history)
         self._journal.record_history_save(stored, op=op)
         self._journal.record_marker_mark(marker, op=op, scope=scope)
@@ -1,6 +1,8 @@
 """Telemetry-aware readers for tail history repositories."""
 from __future__ import annotations
 
+from collections.abc import MutableSequence
+
 from navigator.core.entity.history import Entry
 from navigator.core.value.message import Scope
 
@@ -25,7 +27,7 @@ class TailHistoryReader:
         self._journal.record_marker_peek(marker)
         return marker
 
-    async def load(self, scope: Scope | None = None) -> list[Entry]:
+    async def load(self, scope: Scope | None = None) -> MutableSequence[Entry]:
         snapshot = await self._access.load()
         self._journal.record_history_load(snapshot, scope)
         return snapshot
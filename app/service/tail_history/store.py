@@ -1,7 +1,7 @@
 """Storage primitives for tail history flows."""
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import MutableSequence, Sequence
 
 from navigator.core.entity.history import Entry
 from navigator.core.port.history import HistoryRepository
@@ -20,15 +20,15 @@ class TailHistoryStore:
 
         return await self._latest.peek()
 
-    async def load(self) -> list[Entry]:
+    async def load(self) -> MutableSequence[Entry]:
         """Load the persisted history snapshot."""
 
-        return list(await self._ledger.recall())
+        return await self._ledger.recall()
 
-    async def archive(self, history: Sequence[Entry]) -> list[Entry]:
+    async def archive(self, history: Sequence[Entry]) -> Sequence[Entry]:
         """Archive ``history`` and return the stored snapshot."""
 
-        snapshot = list(history)
+        snapshot = history[:]
         await self._ledger.archive(snapshot)
         return snapshot
 
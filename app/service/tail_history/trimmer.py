@@ -21,8 +21,8 @@ class TailInlineTrimmer:
         self._store = store
         self._marker = marker
 
-    async def trim(self, history: Sequence[Entry]) -> tuple[list[Entry], int | None]:
-        trimmed = list(history[:-1])
+    async def trim(self, history: Sequence[Entry]) -> tuple[Sequence[Entry], int | None]:
+        trimmed = history[:-1]
         stored = await self._store.archive(trimmed)
         marker = self._marker.latest(trimmed)
         await self._store.mark(marker)
@@ -22,7 +22,7 @@ class TailHistoryWriter:
         self._access = access
         self._journal = journal
 
-    async def save(self, history: Sequence[Entry], *, op: str) -> list[Entry]:
+    async def save(self, history: Sequence[Entry], *, op: str) -> Sequence[Entry]:
         snapshot = await self._access.save(history)
         self._journal.record_history_save(snapshot, op=op)
         return snapshot
@@ -6,7 +6,15 @@ from .dynamic import (
     DynamicViewRestorer,
     create_dynamic_view_restorer,
 )
-from .forge import ForgeInvoker, ForgeResolver, ForgeSuppliesExtractor, forge_supplies
+from .forge import (
+    ForgeCache,
+    ForgeInvoker,
+    ForgeResolver,
+    ForgeSuppliesExtractor,
+    forge_cache,
+    forge_supplies,
+    invalidate_forge,
+)
 from .restorer import ViewRestorer
 from .static import StaticPayloadFactory
 
@@ -15,10 +23,13 @@ __all__ = [
     "DynamicRestorationFactory",
     "DynamicViewRestorer",
     "create_dynamic_view_restorer",
+    "ForgeCache",
     "ForgeInvoker",
     "ForgeResolver",
     "ForgeSuppliesExtractor",
     "StaticPayloadFactory",
     "ViewRestorer",
+    "forge_cache",
     "forge_supplies",
+    "invalidate_forge",
 ]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Tuple
 
+from navigator.core.telemetry import LogCode, TelemetryChannel
 from navigator.core.value.message import Scope
 
 from ..executor import EditExecutor
@@ -11,22 +14,82 @@ from .mutation_plan import AlbumMutation
 
 
 class AlbumMutationExecutor:
-    """Execute album mutations with shared edit executor."""
+    """Execute album mutations with shared edit executor.
 
-    def __init__(self, executor: EditExecutor) -> None:
+    With ``fanout`` above one, mutations of distinct album items run
+    concurrently while mutations of the same message keep their planned
+    order. Every item is attempted; failures are reported per item and the
+    first one in plan order is re-raised once all edits have settled.
+    """
+
+    def __init__(
+        self,
+        executor: EditExecutor,
+        *,
+        fanout: int = 1,
+        channel: TelemetryChannel | None = None,
+    ) -> None:
         self._executor = executor
+        self._fanout = max(int(fanout), 1)
+        self._channel = channel
 
     async def apply(self, scope: Scope, mutations: Iterable[AlbumMutation]) -> bool:
+        planned = list(mutations)
+        if self._fanout <= 1 or len(planned) <= 1:
+            return await self._serial(scope, planned)
+        return await self._concurrent(scope, planned)
+
+    async def _serial(self, scope: Scope, mutations: List[AlbumMutation]) -> bool:
         mutated = False
         for mutation in mutations:
-            execution = await self._executor.execute(
-                scope,
-                mutation.decision,
-                mutation.payload,
-                mutation.reference,
-            )
-            mutated = mutated or bool(execution)
+            mutated = await self._execute(scope, mutation) or mutated
         return mutated
 
+    async def _concurrent(self, scope: Scope, mutations: List[AlbumMutation]) -> bool:
+        lanes: Dict[int, List[Tuple[int, AlbumMutation]]] = {}
+        for index, mutation in enumerate(mutations):
+            lanes.setdefault(int(mutation.reference.id), []).append((index, mutation))
+        gate = asyncio.Semaphore(self._fanout)
+        failures: List[Tuple[int, BaseException]] = []
+
+        async def run(lane: List[Tuple[int, AlbumMutation]]) -> bool:
+            mutated = False
+            async with gate:
+                for index, mutation in lane:
+                    try:
+                        mutated = await self._execute(scope, mutation) or mutated
+                    except Exception as error:
+                        failures.append((index, error))
+                        self._report(index, mutation, error)
+                        break
+            return mutated
+
+        outcomes = await asyncio.gather(*(run(lane) for lane in lanes.values()))
+        if failures:
+            failures.sort(key=lambda failure: failure[0])
+            raise failures[0][1]
+        return any(outcomes)
+
+    async def _execute(self, scope: Scope, mutation: AlbumMutation) -> bool:
+        execution = await self._executor.execute(
+            scope,
+            mutation.decision,
+            mutation.payload,
+            mutation.reference,
+        )
+        return bool(execution)
+
+    def _report(self, index: int, mutation: AlbumMutation, error: BaseException) -> None:
+        if self._channel is None:
+            return
+        self._channel.emit(
+            logging.WARNING,
+            LogCode.ALBUM_MUTATION_FAIL,
+            item=index,
+            message=mutation.reference.id,
+            decision=mutation.decision.name,
+            note=type(error).__name__,
+        )
+
 
 __all__ = ["AlbumMutationExecutor"]
@@ -29,10 +29,15 @@ class AlbumService:
         telemetry: Telemetry,
         planner: AlbumRefreshPlanner | None = None,
         mutations: AlbumMutationExecutor | None = None,
+        fanout: int = 1,
     ) -> None:
         self._planner = planner or AlbumRefreshPlanner(limits=limits, thumbguard=thumbguard)
-        self._mutations = mutations or AlbumMutationExecutor(executor)
         self._channel: TelemetryChannel = telemetry.channel(__name__)
+        self._mutations = mutations or AlbumMutationExecutor(
+            executor,
+            fanout=fanout,
+            channel=self._channel,
+        )
 
     async def refresh(
         self,
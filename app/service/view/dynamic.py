@@ -12,6 +12,7 @@ from ....core.error import InlineUnsupported
 from ....core.port.factory import ViewLedger
 from ....core.telemetry import LogCode, TelemetryChannel
 from ....core.value.content import Payload
+from ....core.value.message import Scope
 
 from .forge import ForgeInvoker, ForgeResolver
 
@@ -56,6 +57,7 @@ class DynamicViewRestorer:
         context: Mapping[str, Any],
         *,
         inline: bool,
+        scope: Scope | None = None,
     ) -> Optional[List[Payload]]:
         if not entry.view:
             return None
@@ -64,7 +66,7 @@ class DynamicViewRestorer:
         forge = self._resolver.resolve(entry.view)
         if forge is None:
             return None
-        content = await self._invoker.invoke(entry.view, forge, context)
+        content = await self._invoker.invoke(entry.view, forge, context, scope=scope)
         return self._normaliser.normalize(content, inline=inline)
 
 
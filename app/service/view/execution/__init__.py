@@ -1,15 +1,19 @@
 """Edit execution public API."""
 
-from .cleanup import EditCleanup
+from .cleanup import DeletionBatch, EditCleanup
 from .components import EditComponents, build_edit_components
 from .models import Execution
 from .operation import EditOperation
+from .ordering import SendOrder, turnstile
 
 __all__ = [
+    "DeletionBatch",
     "EditCleanup",
     "EditComponents",
     "EditOperation",
     "Execution",
+    "SendOrder",
     "build_edit_components",
+    "turnstile",
 ]
 
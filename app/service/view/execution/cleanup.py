@@ -2,10 +2,54 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List
+
 from navigator.core.port.message import MessageGateway
 from navigator.core.value.message import Scope
 
 
+class DeletionBatch:
+    """Collect deletions requested during one render for a single flush.
+
+    Identifiers are merged per scope without duplicates, so trims and
+    fallback resends of the same render end up in one gateway call issued
+    after every send and edit has completed.
+    """
+
+    def __init__(self) -> None:
+        self._targets: Dict[Scope, List[int]] = {}
+
+    def add(self, scope: Scope, identifiers: List[int]) -> None:
+        bucket = self._targets.setdefault(scope, [])
+        known = set(bucket)
+        for identifier in identifiers:
+            if identifier not in known:
+                known.add(identifier)
+                bucket.append(identifier)
+
+    def drain(self) -> List[tuple[Scope, List[int]]]:
+        targets = [(scope, ids) for scope, ids in self._targets.items() if ids]
+        self._targets = {}
+        return targets
+
+
+_BATCH: ContextVar[DeletionBatch | None] = ContextVar("navigator_deletion_batch", default=None)
+
+
+async def discard(gateway: MessageGateway, scope: Scope, identifiers: List[int]) -> None:
+    """Delete ``identifiers`` now or defer them to the active render batch."""
+
+    if not identifiers:
+        return
+    batch = _BATCH.get()
+    if batch is not None:
+        batch.add(scope, identifiers)
+        return
+    await gateway.delete(scope, identifiers)
+
+
 class EditCleanup:
     """Encapsulate deletion routines executed after edit operations."""
 
@@ -13,9 +57,30 @@ class EditCleanup:
         self._gateway = gateway
 
     async def delete(self, scope: Scope, identifiers: list[int]) -> None:
-        if identifiers:
-            await self._gateway.delete(scope, identifiers)
+        await discard(self._gateway, scope, identifiers)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[DeletionBatch]:
+        """Defer deletions issued inside the block and flush them merged on exit."""
 
+        if _BATCH.get() is not None:
+            yield _BATCH.get()  # type: ignore[misc]
+            return
+        batch = DeletionBatch()
+        token = _BATCH.set(batch)
+        try:
+            yield batch
+        except BaseException:
+            _BATCH.reset(token)
+            with suppress(Exception):
+                await self._flush(batch)
+            raise
+        _BATCH.reset(token)
+        await self._flush(batch)
+
+    async def _flush(self, batch: DeletionBatch) -> None:
+        for scope, identifiers in batch.drain():
+            await self._gateway.delete(scope, identifiers)
 
-__all__ = ["EditCleanup"]
 
+__all__ = ["DeletionBatch", "EditCleanup", "discard"]
@@ -9,7 +9,9 @@ from navigator.core.port.message import MessageGateway
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
+from .cleanup import discard
 from .models import Execution
+from .ordering import turn
 
 
 def _targets(message: Message | None) -> list[int]:
@@ -34,9 +36,10 @@ class FallbackStrategy:
         payload: Payload,
         stem: Message | None,
     ) -> Execution:
+        await turn()
         result = await self.gateway.send(scope, payload)
         if stem:
-            await self.gateway.delete(scope, _targets(stem))
+            await discard(self.gateway, scope, _targets(stem))
         return Execution(result=result, stem=stem)
 
 
@@ -0,0 +1,64 @@
+"""Keep sends of concurrently reconciled messages in plan order."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class SendOrder:
+    """Admit sends of concurrent reconciliation tasks one position at a time.
+
+    Every position is settled once its task finishes. A task about to send
+    waits until all earlier positions settled, handing its ``gate`` slot back
+    meanwhile so the tasks it waits for can progress.
+    """
+
+    def __init__(self, size: int, gate: asyncio.Semaphore) -> None:
+        self._settled: list[asyncio.Event] = [asyncio.Event() for _ in range(size)]
+        self._gate = gate
+
+    def settle(self, position: int) -> None:
+        self._settled[position].set()
+
+    async def wait(self, position: int, *, held: bool = False) -> None:
+        pending = [event for event in self._settled[:position] if not event.is_set()]
+        if not pending:
+            return
+        if held:
+            self._gate.release()
+        try:
+            for event in pending:
+                await event.wait()
+        finally:
+            if held:
+                await self._gate.acquire()
+
+
+_TURN: ContextVar[tuple[SendOrder, int] | None] = ContextVar("navigator_send_turn", default=None)
+
+
+@contextmanager
+def turnstile(order: SendOrder, position: int) -> Iterator[None]:
+    """Make sends issued inside the block wait for ``position``'s turn."""
+
+    token = _TURN.set((order, position))
+    try:
+        yield
+    finally:
+        _TURN.reset(token)
+
+
+async def turn() -> None:
+    """Wait until earlier positions of the active reconciliation settled."""
+
+    current = _TURN.get()
+    if current is None:
+        return
+    order, position = current
+    await order.wait(position, held=True)
+
+
+__all__ = ["SendOrder", "turn", "turnstile"]
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from typing import AsyncContextManager
+
 from navigator.core.entity.history import Entry, Message
 from navigator.core.service.rendering import decision
 from navigator.core.typing.result import Meta
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
-from .execution import EditComponents, Execution, build_edit_components
+from .execution import DeletionBatch, EditComponents, Execution, build_edit_components
 
 
 class EditExecutor:
@@ -31,6 +33,11 @@ class EditExecutor:
     async def delete(self, scope: Scope, identifiers: list[int]) -> None:
         await self._components.cleanup.delete(scope, identifiers)
 
+    def batch(self) -> AsyncContextManager[DeletionBatch]:
+        """Return a context deferring deletions until the render completes."""
+
+        return self._components.cleanup.batch()
+
     def refine(
         self,
         execution: Execution,
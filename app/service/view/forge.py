@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable, Iterable, Mapping
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from ....core.port.factory import ViewLedger
 from ....core.telemetry import LogCode, TelemetryChannel
 from ....core.value.content import Payload
+from ....core.value.message import Scope
 
 _Forge = Callable[..., Awaitable[Optional[Payload | List[Payload]]]]
 _SUPPLIES_ATTR = "__navigator_supplies__"
+_CACHE_ATTR = "__navigator_cache__"
+_CacheKey = tuple[Scope | None, Hashable]
 
 
 def forge_supplies(*names: str) -> Callable[[_Forge], _Forge]:
@@ -26,6 +33,131 @@ def forge_supplies(*names: str) -> Callable[[_Forge], _Forge]:
     return decorator
 
 
+@dataclass(frozen=True, slots=True)
+class ForgeCachePolicy:
+    """Describe how long and how many outputs of one forge are kept."""
+
+    ttl: float
+    size: int = 128
+    scoped: bool = True
+
+
+def forge_cache(ttl: float, *, size: int = 128, scoped: bool = True) -> Callable[[_Forge], _Forge]:
+    """Cache ``forge`` output for ``ttl`` seconds per supplies and scope.
+
+    Entries are keyed on the view key, the values of the declared
+    :func:`forge_supplies` and, unless ``scoped`` is false, the scope the
+    view is restored for. At most ``size`` outputs are kept per forge.
+    """
+
+    policy = ForgeCachePolicy(ttl=float(ttl), size=max(int(size), 1), scoped=scoped)
+
+    def decorator(forge: _Forge) -> _Forge:
+        setattr(forge, _CACHE_ATTR, policy)
+        return forge
+
+    return decorator
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable snapshot of ``value`` or raise ``TypeError``."""
+
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if not isinstance(value, Hashable):
+        raise TypeError(f"unhashable supply: {type(value).__name__}")
+    hash(value)
+    return value
+
+
+class ForgeCache:
+    """Keep forge outputs per view key until their policy TTL expires."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._stores: Dict[str, OrderedDict[_CacheKey, Tuple[float, Any]]] = {}
+
+    def key(
+        self,
+        policy: ForgeCachePolicy,
+        supplies: Mapping[str, Any],
+        scope: Scope | None,
+    ) -> _CacheKey | None:
+        """Return the cache key for a call or ``None`` when it cannot be cached."""
+
+        if policy.scoped and scope is None:
+            return None
+        try:
+            return (scope if policy.scoped else None, _freeze(supplies))
+        except TypeError:
+            return None
+
+    def lookup(self, view: str, key: _CacheKey) -> Optional[Payload | List[Payload]]:
+        store = self._stores.get(view)
+        if not store or key not in store:
+            return None
+        expires, content = store[key]
+        if expires <= self._clock():
+            del store[key]
+            return None
+        store.move_to_end(key)
+        return list(content) if isinstance(content, list) else content
+
+    def store(
+        self,
+        view: str,
+        policy: ForgeCachePolicy,
+        key: _CacheKey,
+        content: Payload | List[Payload],
+    ) -> None:
+        store = self._stores.setdefault(view, OrderedDict())
+        snapshot = list(content) if isinstance(content, list) else content
+        store[key] = (self._clock() + policy.ttl, snapshot)
+        store.move_to_end(key)
+        while len(store) > policy.size:
+            store.popitem(last=False)
+
+    def invalidate(self, view: str | None = None, *, scope: Scope | None = None) -> int:
+        """Drop cached outputs of ``view`` and/or ``scope``; return how many."""
+
+        views = [view] if view is not None else list(self._stores)
+        dropped = 0
+        for name in views:
+            store = self._stores.get(name)
+            if not store:
+                continue
+            if scope is None:
+                dropped += len(store)
+                del self._stores[name]
+                continue
+            for key in [key for key in store if key[0] == scope]:
+                del store[key]
+                dropped += 1
+        return dropped
+
+
+@lru_cache(maxsize=1)
+def shared_forge_cache() -> ForgeCache:
+    """Return the process-wide forge cache shared across updates."""
+
+    return ForgeCache()
+
+
+def invalidate_forge(view: str | None = None, *, scope: Scope | None = None) -> int:
+    """Invalidate cached forge output, e.g. after the backing data changed."""
+
+    return shared_forge_cache().invalidate(view, scope=scope)
+
+
+def _declared_cache(forge: _Forge) -> ForgeCachePolicy | None:
+    policy = getattr(forge, _CACHE_ATTR, None)
+    return policy if isinstance(policy, ForgeCachePolicy) else None
+
+
 def _normalize_supplies(names: Iterable[str]) -> Tuple[str, ...]:
     """Return stable, de-duplicated supply names."""
 
@@ -92,19 +224,34 @@ class ForgeInvoker:
         self,
         channel: TelemetryChannel,
         extractor: ForgeSuppliesExtractor | None = None,
+        cache: ForgeCache | None = None,
     ) -> None:
         self._channel = channel
         self._extractor = extractor or ForgeSuppliesExtractor()
+        self._cache = cache if cache is not None else shared_forge_cache()
 
     async def invoke(
         self,
         key: str,
         forge: _Forge,
         context: Mapping[str, Any],
+        *,
+        scope: Scope | None = None,
     ) -> Optional[Payload | List[Payload]]:
         try:
             supplies = self._extractor.extract(forge, context)
-            return await forge(**supplies)
+            policy = _declared_cache(forge)
+            if policy is None:
+                return await forge(**supplies)
+            marker = self._cache.key(policy, supplies, scope)
+            if marker is not None:
+                cached = self._cache.lookup(key, marker)
+                if cached is not None:
+                    return cached
+            content = await forge(**supplies)
+            if marker is not None and content:
+                self._cache.store(key, policy, marker, content)
+            return content
         except Exception as exc:  # pragma: no cover - defensive
             self._channel.emit(
                 logging.WARNING,
@@ -118,9 +265,14 @@ class ForgeInvoker:
 
 
 __all__ = [
+    "ForgeCache",
+    "ForgeCachePolicy",
     "ForgeInvoker",
     "ForgeResolver",
     "ForgeSuppliesExtractor",
     "_Forge",
+    "forge_cache",
     "forge_supplies",
+    "invalidate_forge",
+    "shared_forge_cache",
 ]
@@ -17,7 +17,7 @@ class InlineGuard:
             return False
         if media.type in (MediaType.VOICE, MediaType.VIDEO_NOTE):
             return False
-        return self._policy.admissible(media.path, inline=True)
+        return self._policy.admissible(media.path, inline=True, kind=media.type.value)
 
 
 def _first(payload: Payload):
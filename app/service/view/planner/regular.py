@@ -32,25 +32,26 @@ class RegularRenderPlanner:
         ledger: list[Message],
         state: RenderState,
     ) -> bool:
-        origin, head_changed = await self._head.align(scope, ledger, fresh, state)
-        mutated = head_changed
-
-        mutated = (
-            mutated
-            or await self._synchronizer.reconcile(
-                scope,
-                fresh,
-                ledger,
-                state,
-                start=origin,
-                inline_mode=False,
+        async with self._tails.batch():
+            origin, head_changed = await self._head.align(scope, ledger, fresh, state)
+            mutated = head_changed
+
+            mutated = (
+                mutated
+                or await self._synchronizer.reconcile(
+                    scope,
+                    fresh,
+                    ledger,
+                    state,
+                    start=origin,
+                    inline_mode=False,
+                )
             )
-        )
 
-        stored = len(ledger)
-        incoming = len(fresh)
-        mutated = mutated or await self._tails.trim(scope, ledger, incoming)
-        mutated = mutated or await self._tails.append(scope, fresh, stored, state)
+            stored = len(ledger)
+            incoming = len(fresh)
+            mutated = mutated or await self._tails.trim(scope, ledger, incoming)
+            mutated = mutated or await self._tails.append(scope, fresh, stored, state)
         return mutated
 
 
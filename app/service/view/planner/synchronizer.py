@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from navigator.core.entity.history import Message
 from navigator.core.service.rendering import decision
 from navigator.core.service.rendering.config import RenderingConfig
+from navigator.core.typing.result import Meta
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
-from ..executor import EditExecutor
+from ..execution import SendOrder, turnstile
+from ..executor import EditExecutor, Execution
 from ..inline import InlineHandler, InlineOutcome
 
 from .models import RenderState
 
+_EDITS = frozenset(
+    {
+        decision.Decision.EDIT_TEXT,
+        decision.Decision.EDIT_MEDIA,
+        decision.Decision.EDIT_MEDIA_CAPTION,
+        decision.Decision.EDIT_MARKUP,
+    }
+)
+
 
 class RenderSynchronizer:
     """Synchronize stored ledger messages with desired payloads."""
@@ -22,10 +35,12 @@ class RenderSynchronizer:
         executor: EditExecutor,
         inline: InlineHandler,
         rendering: RenderingConfig,
+        fanout: int = 1,
     ) -> None:
         self._executor = executor
         self._inline = inline
         self._rendering = rendering
+        self._fanout = max(int(fanout), 1)
 
     async def reconcile(
         self,
@@ -37,8 +52,10 @@ class RenderSynchronizer:
         start: int,
         inline_mode: bool,
     ) -> bool:
-        mutated = False
         limit = min(len(ledger), len(fresh))
+        if self._fanout > 1 and not inline_mode and limit - start > 1:
+            return await self._concurrent(scope, fresh, ledger, state, start=start, limit=limit)
+        mutated = False
         for index in range(start, limit):
             previous = ledger[index]
             current = fresh[index]
@@ -57,6 +74,69 @@ class RenderSynchronizer:
 
         return mutated
 
+    async def _concurrent(
+        self,
+        scope: Scope,
+        fresh: list[Payload],
+        ledger: list[Message],
+        state: RenderState,
+        *,
+        start: int,
+        limit: int,
+    ) -> bool:
+        """Edit distinct stored messages concurrently, recording results in order.
+
+        Only edit verdicts share the fan-out. Resend verdicts, and fallback
+        resends of failed edits, wait until every earlier position settled,
+        so new messages reach the chat in plan order.
+        """
+
+        indices = range(start, limit)
+        verdicts = [
+            decision.decide(ledger[index], fresh[index], self._rendering) for index in indices
+        ]
+        gate = asyncio.Semaphore(self._fanout)
+        order = SendOrder(len(verdicts), gate)
+
+        async def reconcile(
+            position: int,
+            index: int,
+            verdict: decision.Decision,
+        ) -> tuple[Execution, Meta] | None:
+            try:
+                if verdict is decision.Decision.NO_CHANGE:
+                    return None
+                if verdict not in _EDITS:
+                    await order.wait(position)
+                    return await self._edit(scope, verdict, fresh[index], ledger[index])
+                with turnstile(order, position):
+                    async with gate:
+                        return await self._edit(scope, verdict, fresh[index], ledger[index])
+            finally:
+                order.settle(position)
+
+        outcomes = await asyncio.gather(
+            *(
+                reconcile(position, index, verdict)
+                for position, (index, verdict) in enumerate(zip(indices, verdicts, strict=True))
+            ),
+            return_exceptions=True,
+        )
+        results: list[tuple[Execution, Meta] | None] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+
+        mutated = False
+        for index, result in zip(indices, results, strict=True):
+            if result is None:
+                state.retain(ledger[index])
+                continue
+            state.collect(*result)
+            mutated = True
+        return mutated
+
     async def _mediate(
         self,
         scope: Scope,
@@ -83,13 +163,24 @@ class RenderSynchronizer:
         previous: Message,
         state: RenderState,
     ) -> bool:
-        execution = await self._executor.execute(scope, verdict, payload, previous)
-        if execution is None:
+        outcome = await self._edit(scope, verdict, payload, previous)
+        if outcome is None:
             return False
-        meta = self._executor.refine(execution, verdict, payload)
-        state.collect(execution, meta)
+        state.collect(*outcome)
         return True
 
+    async def _edit(
+        self,
+        scope: Scope,
+        verdict: decision.Decision,
+        payload: Payload,
+        previous: Message,
+    ) -> tuple[Execution, Meta] | None:
+        execution = await self._executor.execute(scope, verdict, payload, previous)
+        if execution is None:
+            return None
+        return execution, self._executor.refine(execution, verdict, payload)
+
     def _record(self, outcome: InlineOutcome, state: RenderState) -> bool:
         meta = self._executor.refine(outcome.execution, outcome.decision, outcome.payload)
         state.collect(outcome.execution, meta)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from typing import AsyncContextManager
+
 from navigator.core.entity.history import Message
 from navigator.core.service.rendering import decision
 from navigator.core.service.rendering.config import RenderingConfig
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
+from ..execution import DeletionBatch
 from ..executor import EditExecutor
 
 from .models import RenderState
@@ -20,6 +23,11 @@ class TailOperations:
         self._executor = executor
         self._rendering = rendering
 
+    def batch(self) -> AsyncContextManager[DeletionBatch]:
+        """Return a context merging deletions issued during one render."""
+
+        return self._executor.batch()
+
     async def trim(self, scope: Scope, ledger: list[Message], incoming: int) -> bool:
         if len(ledger) <= incoming:
             return False
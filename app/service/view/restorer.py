@@ -8,13 +8,22 @@ from ....core.entity.history import Entry
 from ....core.port.factory import ViewLedger
 from ....core.telemetry import Telemetry, TelemetryChannel
 from ....core.value.content import Payload
+from ....core.value.message import Scope
 
 from .dynamic import (
     DynamicPayloadNormaliser,
     DynamicViewRestorer,
     create_dynamic_view_restorer,
 )
-from .forge import ForgeInvoker, ForgeResolver, ForgeSuppliesExtractor, forge_supplies
+from .forge import (
+    ForgeCache,
+    ForgeInvoker,
+    ForgeResolver,
+    ForgeSuppliesExtractor,
+    forge_cache,
+    forge_supplies,
+    invalidate_forge,
+)
 from .static import StaticPayloadFactory
 
 
@@ -39,10 +48,11 @@ class ViewRestorer:
         context: Dict[str, Any],
         *,
         inline: bool,
+        scope: Scope | None = None,
     ) -> List[Payload]:
         """Return payloads for ``entry`` while respecting inline rules."""
 
-        dynamic = await self._dynamic.restore(entry, context, inline=inline)
+        dynamic = await self._dynamic.restore(entry, context, inline=inline, scope=scope)
         if dynamic is not None:
             return dynamic
         return self._static.build_many(entry.messages)
@@ -51,10 +61,13 @@ class ViewRestorer:
 __all__ = [
     "DynamicViewRestorer",
     "DynamicPayloadNormaliser",
+    "ForgeCache",
     "ForgeInvoker",
     "ForgeResolver",
     "ForgeSuppliesExtractor",
     "StaticPayloadFactory",
     "ViewRestorer",
+    "forge_cache",
     "forge_supplies",
+    "invalidate_forge",
 ]
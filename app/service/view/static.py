@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import List, Sequence
 
 from ....core.entity.history import Message
+from ....core.service.rendering.fingerprint import seed
 from ....core.value.content import Payload
 
 
@@ -23,7 +24,7 @@ class StaticPayloadFactory:
             if isinstance(caption, str) and caption:
                 text = caption
 
-        return Payload(
+        payload = Payload(
             text=text,
             media=media,
             group=message.group,
@@ -31,6 +32,7 @@ class StaticPayloadFactory:
             preview=message.preview,
             extra=message.extra,
         )
+        return seed(payload, message.fingerprint)
 
 
 __all__ = ["StaticPayloadFactory"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, MutableSequence, Optional
 
 from ...core.entity.history import Entry
 from ...core.telemetry import LogCode, TelemetryChannel
@@ -78,7 +78,7 @@ class AppendPreparationResult:
     """Collect data required for later append pipeline stages."""
 
     adjusted: List[Payload]
-    records: List[Entry]
+    records: MutableSequence[Entry]
     trail: Entry | None
 
 
@@ -142,8 +142,8 @@ class AppendPersistence:
             view,
             root,
         )
-        timeline = self._assembler.extend_timeline(prepared.records, entry, root)
-        await self._writer.persist(timeline)
+        delta = self._assembler.extend_delta(prepared.records, entry, root)
+        await self._writer.amend(delta)
 
 
 class AppendWorkflow:
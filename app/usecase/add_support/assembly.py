@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from navigator.app.map.entry import EntryMapper, Outcome
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, HistoryDelta
 from navigator.core.value.content import Payload
 
 from ..render_contract import RenderOutcome
@@ -40,11 +40,17 @@ class AppendEntryAssembler:
         )
 
     @staticmethod
-    def extend_timeline(records: List[Entry], entry: Entry, root: bool) -> List[Entry]:
+    def extend_timeline(records: Sequence[Entry], entry: Entry, root: bool) -> List[Entry]:
         if root:
             return [entry]
         return [*records, entry]
 
+    @staticmethod
+    def extend_delta(records: Sequence[Entry], entry: Entry, root: bool) -> HistoryDelta:
+        if root:
+            return HistoryDelta.rewrite(records, [entry])
+        return HistoryDelta.append(records, entry)
+
 
 __all__ = ["AppendEntryAssembler"]
 
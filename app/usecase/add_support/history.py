@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Sequence
+from typing import MutableSequence, Optional, Sequence
 
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, HistoryDelta
 from navigator.core.port.history import HistoryRepository
 from navigator.core.port.state import StateRepository
 from navigator.core.value.message import Scope
@@ -27,7 +27,7 @@ class HistorySnapshotAccess:
         self._archive = archive
         self._observer: AppendHistoryObserver = observer or NullAppendHistoryObserver()
 
-    async def snapshot(self, scope: Scope) -> List[Entry]:
+    async def snapshot(self, scope: Scope) -> MutableSequence[Entry]:
         records = await self._archive.recall()
         self._observer.history_loaded(scope, len(records))
         return records
@@ -71,6 +71,10 @@ class AppendHistoryWriter:
         pipeline = self._resolve_pipeline()
         await pipeline.persist(list(timeline), operation="add")
 
+    async def amend(self, delta: HistoryDelta) -> None:
+        pipeline = self._resolve_pipeline()
+        await pipeline.amend(delta, operation="add")
+
 
 __all__ = [
     "AppendHistoryWriter",
@@ -56,7 +56,7 @@ class RewindPerformer:
         inline = bool(scope.inline)
         memory = await self._state.payload()
         restored = await self._renderer.revive(
-            target, context.as_mapping(), memory, inline=inline
+            target, context.as_mapping(), memory, inline=inline, scope=scope
         )
         resolved = [normalize(payload) for payload in restored]
         render = await self._renderer.render(scope, resolved, origin, inline=inline)
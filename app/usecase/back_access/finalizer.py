@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Sequence
 
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, HistoryDelta
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
 
 from .mutator import RewindMutator
@@ -13,7 +13,6 @@ from .writer import (
     RewindLatestMarker,
     RewindStateWriter,
 )
-from .utils import trim
 
 
 class RewindFinalizer:
@@ -40,18 +39,13 @@ class RewindFinalizer:
         await self._state.assign(target.state)
         marker = target.messages[0].id if target.messages else None
         await self._latest.mark(int(marker) if marker is not None else None)
-        await self._archiver.archive(trim(history))
+        await self._archiver.amend(HistoryDelta.truncate(history, len(history) - 1))
 
     async def apply(self, history: Sequence[Entry], target: Entry, render: object) -> None:
         """Persist rebuilt entries and update state markers."""
 
-        snapshot = list(trim(history))
         rebuilt = self._mutator.rebuild(target, render)
-        if snapshot:
-            snapshot[-1] = rebuilt
-        else:  # pragma: no cover - defensive guard
-            snapshot.append(rebuilt)
-        await self._archiver.archive(snapshot)
+        await self._archiver.amend(HistoryDelta.replace_tail(history, 2, rebuilt))
         await self._state.assign(target.state)
         identifier = self._mutator.primary_identifier(render)
         await self._latest.mark(identifier)
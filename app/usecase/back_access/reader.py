@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections.abc import MutableSequence, Sequence
 from typing import Any
 
 from navigator.core.entity.history import Entry
@@ -26,7 +26,7 @@ class RewindHistorySnapshotter:
             f"{__name__}.history.snapshot"
         )
 
-    async def load(self, scope: Scope) -> list[Entry]:
+    async def load(self, scope: Scope) -> MutableSequence[Entry]:
         """Return the current history snapshot."""
 
         history = await self._ledger.recall()
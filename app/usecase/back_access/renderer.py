@@ -27,9 +27,10 @@ class RewindRenderer:
         memory: dict[str, Any],
         *,
         inline: bool,
+        scope: Scope | None = None,
     ) -> list[Any]:
         merged = {**memory, **context}
-        revived = await self._restorer.revive(target, merged, inline=inline)
+        revived = await self._restorer.revive(target, merged, inline=inline, scope=scope)
         return [*revived]
 
     async def render(
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from navigator.core.entity.history import Entry
+from navigator.app.service.store import amend
+from navigator.core.entity.history import Entry, HistoryDelta
 from navigator.core.port.history import HistoryRepository
 from navigator.core.port.last import LatestRepository
 from navigator.core.port.state import StateRepository
@@ -21,14 +22,21 @@ class RewindHistoryArchiver:
         self._ledger = ledger
         self._instrumentation = instrumentation
 
-    async def archive(self, history: Sequence[Entry]) -> list[Entry]:
+    async def archive(self, history: Sequence[Entry]) -> Sequence[Entry]:
         """Persist ``history`` snapshot and return stored copy."""
 
-        snapshot = list(history)
+        snapshot = history[:]
         await self._ledger.archive(snapshot)
         self._instrumentation.history_saved(len(snapshot))
         return snapshot
 
+    async def amend(self, delta: HistoryDelta) -> Sequence[Entry]:
+        """Persist the change described by ``delta`` and return the stored copy."""
+
+        await amend(self._ledger, delta)
+        self._instrumentation.history_saved(len(delta.history))
+        return delta.history
+
 
 class RewindStateWriter:
     """Persist FSM state updates produced by rewind."""
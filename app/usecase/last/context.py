@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import MutableSequence
 from dataclasses import dataclass
 from typing import Optional
 
@@ -20,7 +21,7 @@ class TailSnapshot:
     """Capture history snapshot relevant for tail operations."""
 
     marker: int | None
-    history: list[Entry]
+    history: MutableSequence[Entry]
     index: Optional[int]
 
     @property
@@ -54,13 +55,13 @@ class TailSnapshot:
         bundle.extend(int(extra) for extra in (head.extras or []))
         return bundle
 
-    def clone(self) -> list[Entry]:
-        """Return a shallow copy of the underlying history list."""
+    def clone(self) -> MutableSequence[Entry]:
+        """Return a shallow copy of the underlying history sequence."""
 
-        return list(self.history)
+        return self.history[:]
 
     @classmethod
-    def build(cls, marker: int | None, history: list[Entry]) -> TailSnapshot:
+    def build(cls, marker: int | None, history: MutableSequence[Entry]) -> TailSnapshot:
         """Construct a snapshot by locating ``marker`` inside ``history``."""
 
         index: Optional[int] = None
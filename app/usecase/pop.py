@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from ...core.entity.history import Entry
+from ...core.entity.history import Entry, HistoryDelta
 from ...core.port.history import HistoryRepository
 from ...core.port.last import LatestRepository
+from ..service.store import amend
 from .pop_instrumentation import PopInstrumentation
 
 
@@ -40,8 +41,8 @@ class Trimmer:
         if deletions <= 0:
             return
 
-        trimmed = history[:-deletions]
-        await self._persist(trimmed, deletions)
+        delta = HistoryDelta.truncate(history, len(history) - deletions)
+        await self._persist(delta, deletions)
 
     async def _recall_history(self) -> Sequence[Entry]:
         """Return the current history snapshot with telemetry bookkeeping."""
@@ -57,10 +58,11 @@ class Trimmer:
             return 0
         return min(requested, history_len - 1)
 
-    async def _persist(self, trimmed: Sequence[Entry], deletions: int) -> None:
-        """Persist ``trimmed`` entries and refresh telemetry markers."""
+    async def _persist(self, delta: HistoryDelta, deletions: int) -> None:
+        """Persist the truncation ``delta`` and refresh telemetry markers."""
 
-        await self._ledger.archive(list(trimmed))
+        await amend(self._ledger, delta)
+        trimmed = delta.history
         self._instrumentation.history_saved(len(trimmed))
 
         marker = self._latest_marker(trimmed)
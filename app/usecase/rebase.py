@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import List
+from typing import MutableSequence, Sequence
 
-from ...core.entity.history import Entry
+from ...core.entity.history import Entry, HistoryDelta
 from ...core.port.history import HistoryRepository
 from ...core.port.last import LatestRepository
+from ..service.store import amend
 from .rebase_instrumentation import RebaseInstrumentation
 
 
@@ -39,10 +40,10 @@ class Shifter:
             await self._mark_latest(marker, len(history))
             return
 
-        rebuilt = self._patch_entry(history, last, marker)
-        await self._persist(rebuilt, marker)
+        delta = self._patch_entry(history, last, marker)
+        await self._persist(delta, marker)
 
-    async def _load_history(self) -> List[Entry]:
+    async def _load_history(self) -> MutableSequence[Entry]:
         """Return history snapshots while emitting telemetry."""
 
         history = await self._ledger.recall()
@@ -57,18 +58,17 @@ class Shifter:
         self._instrumentation.marker_updated(identifier)
         self._instrumentation.completed(identifier, history_len)
 
-    def _patch_entry(self, history: List[Entry], last: Entry, marker: int) -> List[Entry]:
-        """Return rebuilt history with ``last`` message id replaced."""
+    def _patch_entry(self, history: Sequence[Entry], last: Entry, marker: int) -> HistoryDelta:
+        """Return the change replacing ``last`` with its message id patched."""
 
         first = last.messages[0]
         patched = replace(first, id=int(marker))
         trailer = replace(last, messages=[patched, *last.messages[1:]])
-        rebuilt: List[Entry] = [*history[:-1], trailer]
-        return rebuilt
+        return HistoryDelta.replace_tail(history, 1, trailer)
 
-    async def _persist(self, rebuilt: List[Entry], marker: int) -> None:
-        """Persist rebuilt history snapshot and update marker telemetry."""
+    async def _persist(self, delta: HistoryDelta, marker: int) -> None:
+        """Persist the rebuilt tail and update marker telemetry."""
 
-        await self._ledger.archive(rebuilt)
-        self._instrumentation.history_saved(len(rebuilt))
-        await self._mark_latest(marker, len(rebuilt))
+        await amend(self._ledger, delta)
+        self._instrumentation.history_saved(len(delta.history))
+        await self._mark_latest(marker, len(delta.history))
@@ -46,5 +46,5 @@ class Swapper:
         status = await self._history.status()
 
         entry = self._prepare.entry(trail, adjusted, render, status)
-        timeline = self._prepare.timeline(records, entry)
-        await self._writer.persist(timeline)
+        delta = self._prepare.delta(records, entry)
+        await self._writer.amend(delta)
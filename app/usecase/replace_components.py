@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Sequence, Protocol
+from typing import List, MutableSequence, Optional, Sequence, Protocol
 
 from navigator.app.map.entry import EntryMapper, Outcome
 from navigator.app.service.store import HistoryPersistencePipeline
 from navigator.app.service.view.planner import ViewPlanner
 from navigator.app.service.view.policy import adapt
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, HistoryDelta
 from navigator.core.port.history import HistoryRepository
 from navigator.core.port.last import LatestRepository
 from navigator.core.port.state import StateRepository
@@ -74,7 +74,7 @@ class ReplaceHistoryAccess:
         self._state = state
         self._observer: ReplaceHistoryObserver = observer or NullReplaceHistoryObserver()
 
-    async def snapshot(self) -> List[Entry]:
+    async def snapshot(self) -> MutableSequence[Entry]:
         """Load the current history snapshot with telemetry reporting."""
 
         records = await self._archive.recall()
@@ -140,13 +140,19 @@ class ReplacePreparation:
         )
 
     @staticmethod
-    def timeline(records: List[Entry], entry: Entry) -> List[Entry]:
+    def timeline(records: Sequence[Entry], entry: Entry) -> List[Entry]:
         """Return a new timeline with ``entry`` replacing the latest snapshot."""
 
         if not records:
             return [entry]
         return [*records[:-1], entry]
 
+    @staticmethod
+    def delta(records: Sequence[Entry], entry: Entry) -> HistoryDelta:
+        """Return the change replacing the latest snapshot with ``entry``."""
+
+        return HistoryDelta.replace_tail(records, 1, entry)
+
 
 class ReplaceHistoryWriter:
     """Persist replace outcomes using the history persistence pipeline."""
@@ -173,6 +179,11 @@ class ReplaceHistoryWriter:
 
         await self._pipeline.persist(timeline, operation="replace")
 
+    async def amend(self, delta: HistoryDelta) -> None:
+        """Persist the tail replacement described by ``delta``."""
+
+        await self._pipeline.amend(delta, operation="replace")
+
 
 __all__ = [
     "ReplaceHistoryAccess",
@@ -60,7 +60,9 @@ class Setter:
         plan = await self._planner.build(scope, goal)
         await self._reconciler.truncate(plan)
         await self._state.assign(plan.target)
-        resolved = await self._reviver.revive(plan.target, context, inline=plan.inline)
+        resolved = await self._reviver.revive(
+            plan.target, context, inline=plan.inline, scope=scope
+        )
         render = await self._render(scope, resolved, plan.tail, plan.inline)
         if render and render.changed:
             await self._reconciler.apply(scope, render)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from navigator.core.entity.history import Entry
@@ -16,7 +16,7 @@ from navigator.core.value.message import Scope
 class RestorationPlan:
     """Capture the state required to reconcile a requested goal."""
 
-    history: list[Entry]
+    history: Sequence[Entry]
     target: Entry
     tail: Entry
     cursor: int
@@ -52,10 +52,9 @@ class HistoryRestorationPlanner:
         )
 
     @staticmethod
-    def _locate(history: Iterable[Entry], goal: str) -> int:
-        candidates = list(history)
-        for index in range(len(candidates) - 1, -1, -1):
-            if candidates[index].state == goal:
+    def _locate(history: Sequence[Entry], goal: str) -> int:
+        for index in range(len(history) - 1, -1, -1):
+            if history[index].state == goal:
                 return index
         raise StateNotFound(goal)
 
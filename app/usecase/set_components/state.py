@@ -9,6 +9,7 @@ from navigator.core.entity.history import Entry
 from navigator.core.port.state import StateRepository
 from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
 from navigator.core.value.content import Payload, normalize
+from navigator.core.value.message import Scope
 
 
 class StateSynchronizer:
@@ -45,10 +46,11 @@ class PayloadReviver:
         context: dict[str, Any],
         *,
         inline: bool,
+        scope: Scope | None = None,
     ) -> list[Payload]:
         memory = await self._synchronizer.snapshot()
         merged = {**memory, **context}
-        restored = await self._restorer.revive(entry, merged, inline=inline)
+        restored = await self._restorer.revive(entry, merged, inline=inline, scope=scope)
         return [normalize(payload) for payload in restored]
 
 
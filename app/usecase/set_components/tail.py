@@ -24,8 +24,8 @@ class HistoryTailWriter:
         if not current:
             return
         tail = current[-1]
-        patched = self._patch(tail, render)
-        await self._ledger.archive([*current[:-1], patched])
+        current[-1] = self._patch(tail, render)
+        await self._ledger.archive(current)
 
     @staticmethod
     def _patch(entry: Entry, render: RenderOutcome) -> Entry:
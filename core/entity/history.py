@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 
 from .markup import Markup
 from .media import MediaItem
@@ -10,6 +11,8 @@ from .media import MediaItem
 if TYPE_CHECKING:
     pass
 
+T = TypeVar("T")
+
 
 @dataclass(frozen=True, slots=True)
 class Message:
@@ -24,6 +27,7 @@ class Message:
     inline: str | None = None
     automated: bool = True
     ts: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    fingerprint: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,3 +36,70 @@ class Entry:
     view: str | None
     messages: list[Message]
     root: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryDelta:
+    """Describe a history change relative to the snapshot it was derived from.
+
+    Stored entries are changed by dropping ``pop`` entries from the tail,
+    appending ``push`` and finally dropping ``shed`` entries from the head,
+    skipping the first entry when ``pinned``. ``history`` carries the
+    resulting snapshot for backends that can only rewrite it in full; it is
+    derived from the base by slicing and concatenation so lazily decoded
+    sequences stay lazy.
+    """
+
+    history: Sequence[Entry]
+    pop: int = 0
+    push: list[Entry] = field(default_factory=list)
+    shed: int = 0
+    pinned: bool = False
+
+    @classmethod
+    def append(cls, base: Sequence[Entry], *entries: Entry) -> HistoryDelta:
+        return cls(history=_extend(base, entries), push=list(entries))
+
+    @classmethod
+    def truncate(cls, base: Sequence[Entry], length: int) -> HistoryDelta:
+        length = max(0, min(length, len(base)))
+        return cls(history=base[:length], pop=len(base) - length)
+
+    @classmethod
+    def replace_tail(cls, base: Sequence[Entry], count: int, *entries: Entry) -> HistoryDelta:
+        count = max(0, min(count, len(base)))
+        kept = base[: len(base) - count]
+        return cls(history=_extend(kept, entries), pop=count, push=list(entries))
+
+    @classmethod
+    def rewrite(cls, base: Sequence[Entry], history: Sequence[Entry]) -> HistoryDelta:
+        return cls(history=list(history), pop=len(base), push=list(history))
+
+    @property
+    def origin(self) -> int:
+        """Return the length of the snapshot this delta applies to."""
+
+        return len(self.history) + self.shed - len(self.push) + self.pop
+
+
+@runtime_checkable
+class _Concatenable(Protocol):
+    def __add__(self, other: list[Entry], /) -> Sequence[Entry]: ...
+
+
+def _extend(base: Sequence[Entry], entries: Sequence[Entry]) -> Sequence[Entry]:
+    if isinstance(base, tuple) or not isinstance(base, _Concatenable):
+        return [*base, *entries]
+    return base + list(entries)
+
+
+def replay(delta: HistoryDelta, stored: Sequence[T], encode: Callable[[Entry], T]) -> list[T]:
+    """Return ``stored`` records with ``delta`` applied, encoding pushed entries."""
+
+    records = list(stored[: max(0, len(stored) - delta.pop)])
+    records.extend(encode(entry) for entry in delta.push)
+    if not delta.shed:
+        return records
+    if delta.pinned and records:
+        return [records[0], *records[1 + delta.shed:]]
+    return records[delta.shed:]
@@ -9,6 +9,31 @@ class HistoryEmpty(NavigatorError):
     """Signal that history is too short for the requested operation."""
 
 
+class HistoryConflict(NavigatorError):
+    """Report a history write based on a generation that is no longer current."""
+
+    def __init__(self, expected: int | None = None, actual: int | None = None):
+        super().__init__(f"history_conflict:{expected}:{actual}")
+        self.expected = expected
+        self.actual = actual
+
+
+class LockTimeout(NavigatorError):
+    """Report a scope lock that could not be acquired in time."""
+
+    def __init__(self, name: str | None = None):
+        super().__init__("lock_timeout" if name is None else f"lock_timeout:{name}")
+        self.name = name
+
+
+class LeaseLost(NavigatorError):
+    """Report a write attempted after the scope lock lease was lost."""
+
+    def __init__(self, name: str | None = None):
+        super().__init__("lease_lost" if name is None else f"lease_lost:{name}")
+        self.name = name
+
+
 class StateNotFound(NavigatorError):
     """Report that a requested state could not be located."""
 
@@ -77,6 +102,9 @@ class MetadataGroupMediumMissing(MetadataError):
 __all__ = [
     "NavigatorError",
     "HistoryEmpty",
+    "HistoryConflict",
+    "LockTimeout",
+    "LeaseLost",
     "EditForbidden",
     "MessageUnchanged",
     "InlineUnsupported",
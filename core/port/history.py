@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import typing
-from typing import Protocol, List
+from collections.abc import MutableSequence, Sequence
+from typing import Protocol
 
-from ..entity.history import Entry
+from ..entity.history import Entry, HistoryDelta
 
 
 @typing.runtime_checkable
 class HistoryRepository(Protocol):
     """Storage for navigation history."""
 
-    async def recall(self) -> List[Entry]:
-        """Return full history ordered from first to last."""
+    async def recall(self) -> MutableSequence[Entry]:
+        """Return full history ordered from first to last.
 
-    async def archive(self, history: List[Entry]) -> None:
+        Implementations may decode entries lazily; slicing and ``+`` keep
+        the result lazy while ``list()`` materialises every entry. A record
+        that cannot be decoded then raises ``ValueError`` on first access to
+        that entry rather than from ``recall`` itself.
+        """
+
+    async def archive(self, history: Sequence[Entry]) -> None:
         """Persist full history snapshot."""
 
 
-__all__ = ["HistoryRepository"]
+@typing.runtime_checkable
+class IncrementalHistoryRepository(HistoryRepository, Protocol):
+    """History storage able to apply structured deltas without full rewrites."""
+
+    async def amend(self, delta: HistoryDelta) -> None:
+        """Apply ``delta`` to the stored history."""
+
+
+__all__ = ["HistoryRepository", "IncrementalHistoryRepository"]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import typing
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from typing import Protocol
 
 
@@ -25,4 +27,38 @@ class LockProvider(Protocol):
         ...
 
 
-__all__ = ["Lock", "LockProvider"]
+@dataclass(frozen=True, slots=True)
+class Lease:
+    """Identify a distributed lock hold by its key and fencing token.
+
+    Locks that support fencing expose it as a ``lease`` attribute, which
+    stays set after acquisition even once the lease expired or was released,
+    so writers can reject a holder whose key no longer carries its fence.
+    """
+
+    key: str
+    fence: int
+
+
+_HOLD: ContextVar[Lock | None] = ContextVar("navigator_lock_hold", default=None)
+
+
+def bind(lock: Lock) -> Token[Lock | None]:
+    """Make ``lock`` the hold that writes of the current context run under."""
+
+    return _HOLD.set(lock)
+
+
+def unbind(token: Token[Lock | None]) -> None:
+    _HOLD.reset(token)
+
+
+def lease() -> Lease | None:
+    """Return the fenced lease held by the current context, if any."""
+
+    lock = _HOLD.get()
+    current = getattr(lock, "lease", None)
+    return current if isinstance(current, Lease) else None
+
+
+__all__ = ["Lease", "Lock", "LockProvider", "bind", "lease", "unbind"]
@@ -6,10 +6,10 @@ from typing import Protocol
 
 @typing.runtime_checkable
 class MediaPathPolicy(Protocol):
-    def admissible(self, path: object, *, inline: bool) -> bool:
+    def admissible(self, path: object, *, inline: bool, kind: str | None = None) -> bool:
         ...
 
-    def adapt(self, path: object, *, native: bool) -> object:
+    def adapt(self, path: object, *, native: bool, kind: str | None = None) -> object:
         ...
 
 
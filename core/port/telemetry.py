@@ -22,6 +22,7 @@ class LogCode(Enum):
     # Albums
     ALBUM_PARTIAL_OK = "album_partial_ok"
     ALBUM_PARTIAL_FALLBACK = "album_partial_fallback"
+    ALBUM_MUTATION_FAIL = "album_mutation_fail"
 
     # History / Last / State
     HISTORY_LOAD = "history_load"
@@ -54,6 +55,12 @@ class LogCode(Enum):
     TELEGRAM_RETRY = "telegram_retry"
     TELEGRAM_UNHANDLED_ERROR = "telegram_unhandled_error"
 
+    # Locks
+    LOCK_ACQUIRE = "lock_acquire"
+    LOCK_CONTENDED = "lock_contended"
+    LOCK_RELEASE = "lock_release"
+    LOCK_TIMEOUT = "lock_timeout"
+
     # Extras / Serializer
     EXTRA_FILTERED_OUT = "extra_filtered_out"
     EXTRA_UNKNOWN_DROPPED = "extra_unknown_dropped"
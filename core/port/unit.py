@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import typing
+from typing import Protocol
+
+
+@typing.runtime_checkable
+class WorkUnit(Protocol):
+    """Batch storage mutations issued while a scope is guarded."""
+
+    def begin(self) -> None:
+        """Start buffering mutations until the matching ``commit``."""
+
+    async def settle(self) -> None:
+        """Fail with ``HistoryConflict`` when reads of the open unit went stale."""
+
+    async def commit(self) -> None:
+        """Flush buffered mutations once the outermost scope completes."""
+
+    def rollback(self) -> None:
+        """Close the matching ``begin`` without flushing buffered mutations."""
+
+
+__all__ = ["WorkUnit"]
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from typing import List
+from collections.abc import Sequence
 
 from ...entity.history import Entry
 
-HistoryList = List[Entry]
+HistoryList = Sequence[Entry]
 
 
 def prune(history: HistoryList, limit: int) -> HistoryList:
@@ -34,6 +34,5 @@ def _coerce_limit(limit: int) -> int:
 def _preserve_root(history: HistoryList, overflow: int) -> HistoryList:
     """Retain the root entry while trimming ``overflow`` items."""
 
-    preserved = history[0]
     start = min(len(history), 1 + overflow)
-    return [preserved, *history[start:]]
+    return [*history[:1], *history[start:]]
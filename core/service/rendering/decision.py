@@ -6,6 +6,7 @@ from enum import Enum, auto
 from typing import Optional
 
 from .config import RenderingConfig
+from .fingerprint import fingerprint
 from .helpers import match
 from ...value.content import Payload, caption
 from .media_profile import identical_media, profile_media, requires_delete_send
@@ -77,6 +78,10 @@ def decide(old: Optional[object], new: Payload, config: RenderingConfig) -> Deci
     if not old:
         return Decision.RESEND
 
+    stored = fingerprint(old)
+    if stored is not None and stored == fingerprint(new):
+        return Decision.NO_CHANGE
+
     prior = view_of(old)
     fresh = view_of(new)
 
@@ -0,0 +1,90 @@
+"""Stable content fingerprints used to skip structural render comparisons."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import astuple
+from typing import Any, Optional
+
+from ...entity.markup import Markup
+from ...entity.media import MediaItem
+from ...value.content import Payload
+
+
+def _plain(value: Any) -> Any:
+    """Convert JSON-incompatible values or reject them as unstable."""
+
+    dump = getattr(value, "model_dump", None)
+    if callable(dump):
+        return dump(mode="json", exclude_none=True)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(type(value).__name__)
+
+
+def _media(item: MediaItem) -> Optional[list[Any]]:
+    if not isinstance(item.path, str):
+        return None
+    return [getattr(item.type, "value", None), item.path, item.caption]
+
+
+def _markup(markup: Optional[Markup]) -> Optional[list[Any]]:
+    if markup is None:
+        return None
+    return [markup.kind, markup.data]
+
+
+def _compute(payload: Payload) -> str:
+    if payload.group:
+        members = [_media(item) for item in payload.group]
+        if any(member is None for member in members):
+            return ""
+        content: list[Any] = ["group", members]
+    elif payload.media:
+        member = _media(payload.media)
+        if member is None:
+            return ""
+        content = ["media", member, payload.text]
+    else:
+        content = ["text", (payload.text or "").strip()]
+    record = [
+        content,
+        payload.extra or {},
+        astuple(payload.preview) if payload.preview else None,
+        _markup(payload.reply),
+    ]
+    try:
+        canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=_plain)
+    except (TypeError, ValueError):
+        return ""
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def fingerprint(source: object) -> Optional[str]:
+    """Return the content fingerprint of a payload or stored message.
+
+    Payload fingerprints are computed once and memoized on the instance.
+    Stored messages carry the fingerprint of the payload that rendered them.
+    ``None`` means the content cannot be fingerprinted reliably, for example
+    when it references in-memory files.
+    """
+
+    if isinstance(source, Payload):
+        cached = source._fingerprint
+        if cached is None:
+            cached = _compute(source)
+            object.__setattr__(source, "_fingerprint", cached)
+        return cached or None
+    return getattr(source, "fingerprint", None)
+
+
+def seed(payload: Payload, value: Optional[str]) -> Payload:
+    """Attach a known fingerprint to ``payload`` rebuilt from stored content."""
+
+    if value:
+        object.__setattr__(payload, "_fingerprint", value)
+    return payload
+
+
+__all__ = ["fingerprint", "seed"]
@@ -32,7 +32,7 @@ def _canonicalize(data: object) -> str | None:
 def match(first: Markup | None, second: Markup | None) -> bool:
     """Check whether markups share the same structural intent."""
 
-    if first is None and second is None:
+    if first is second:
         return True
     if (first is None) != (second is None):
         return False
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Dict, Iterable
 
 from ..entity.markup import Markup
@@ -34,6 +34,7 @@ class Payload:
     preview: Preview | None = None
     extra: Dict[str, Any] | None = None
     erase: bool = False
+    _fingerprint: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def morph(self, **kw: Any) -> Payload:
         """Return a copy of the payload updated with ``kw`` overrides."""
@@ -4,5 +4,6 @@ from .assemble import assemble
 from .middleware import NavigatorMiddleware
 from .router import router
 from .scope import outline
+from .shutdown import shutdown
 
-__all__ = ["assemble", "router", "outline", "NavigatorMiddleware"]
+__all__ = ["assemble", "router", "outline", "NavigatorMiddleware", "shutdown"]
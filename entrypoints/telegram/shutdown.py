@@ -0,0 +1,4 @@
+"""Telegram entrypoint shutdown helpers."""
+from navigator.presentation.telegram import shutdown
+
+__all__ = ["shutdown"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from pathlib import Path
-from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 from typing import Dict, Iterable, Mapping, Set
 
 _ENV_FILE = Path(".env")
@@ -23,6 +23,34 @@ _ALIASES: Dict[str, str] = {
     "groupmax": "NAV_ALBUM_CEILING",
     "mixcodes": "NAV_ALBUM_BLEND",
     "deletepausems": "NAV_DELETE_DELAY_MS",
+    "historycodec": "NAV_HISTORY_CODEC",
+    "historystore": "NAV_HISTORY_STORE",
+    "historyintern": "NAV_HISTORY_INTERN",
+    "historycompress": "NAV_HISTORY_COMPRESS",
+    "compressthreshold": "NAV_HISTORY_COMPRESS_THRESHOLD",
+    "redisurl": "NAV_REDIS_URL",
+    "historyttl": "NAV_HISTORY_TTL",
+    "concurrency": "NAV_CONCURRENCY",
+    "casattempts": "NAV_CAS_ATTEMPTS",
+    "lockidle": "NAV_LOCK_IDLE",
+    "lockstore": "NAV_LOCK_STORE",
+    "lockttl": "NAV_LOCK_TTL",
+    "lockwait": "NAV_LOCK_WAIT",
+    "redispool": "NAV_REDIS_POOL",
+    "execution": "NAV_EXECUTION",
+    "ratelimit": "NAV_RATE_LIMIT",
+    "rateglobal": "NAV_RATE_GLOBAL",
+    "ratechat": "NAV_RATE_CHAT",
+    "rategroup": "NAV_RATE_GROUP",
+    "rateburst": "NAV_RATE_BURST",
+    "floodstore": "NAV_FLOOD_STORE",
+    "deletion": "NAV_DELETION",
+    "purgeparallel": "NAV_PURGE_PARALLEL",
+    "mediacache": "NAV_MEDIA_CACHE",
+    "mediastore": "NAV_MEDIA_STORE",
+    "renderfanout": "NAV_RENDER_FANOUT",
+    "albumfanout": "NAV_ALBUM_FANOUT",
+    "markupcache": "NAV_MARKUP_CACHE",
 }
 
 
@@ -63,6 +91,104 @@ class Settings(BaseModel):
         ge=0,
         validation_alias=_alias("deletepausems"),
     )
+    historycodec: str = Field(
+        "dict",
+        pattern="^(dict|compact)$",
+        validation_alias=_alias("historycodec"),
+    )
+    historystore: str = Field(
+        "fsm",
+        pattern="^(fsm|redis)$",
+        validation_alias=_alias("historystore"),
+    )
+    historyintern: bool = Field(
+        False,
+        validation_alias=_alias("historyintern"),
+    )
+    historycompress: bool = Field(
+        False,
+        validation_alias=_alias("historycompress"),
+    )
+    compressthreshold: int = Field(
+        4096,
+        ge=0,
+        validation_alias=_alias("compressthreshold"),
+    )
+    redisurl: str = Field(
+        "redis://localhost:6379/0",
+        validation_alias=_alias("redisurl"),
+    )
+    historyttl: int = Field(
+        30 * 24 * 3600,
+        ge=0,
+        validation_alias=_alias("historyttl"),
+    )
+
+    concurrency: str = Field(
+        "lock",
+        pattern="^(lock|optimistic)$",
+        validation_alias=_alias("concurrency"),
+    )
+    casattempts: int = Field(3, ge=1, validation_alias=_alias("casattempts"))
+    lockidle: int = Field(0, ge=0, validation_alias=_alias("lockidle"))
+    lockstore: str = Field(
+        "memory",
+        pattern="^(memory|redis)$",
+        validation_alias=_alias("lockstore"),
+    )
+    lockttl: float = Field(30.0, gt=0, validation_alias=_alias("lockttl"))
+    lockwait: float = Field(10.0, ge=0, validation_alias=_alias("lockwait"))
+    redispool: int = Field(32, ge=1, validation_alias=_alias("redispool"))
+    execution: str = Field(
+        "lock",
+        pattern="^(lock|mailbox)$",
+        validation_alias=_alias("execution"),
+    )
+    ratelimit: bool = Field(False, validation_alias=_alias("ratelimit"))
+    # Rates are calls per second (NAV_RATE_GLOBAL, NAV_RATE_CHAT, NAV_RATE_GROUP);
+    # Telegram allows about 20 messages a minute per group.
+    rateglobal: float = Field(30.0, gt=0, validation_alias=_alias("rateglobal"))
+    ratechat: float = Field(1.0, gt=0, validation_alias=_alias("ratechat"))
+    rategroup: float = Field(20.0 / 60.0, gt=0, validation_alias=_alias("rategroup"))
+    rateburst: float = Field(3.0, ge=1, validation_alias=_alias("rateburst"))
+    floodstore: str = Field(
+        "memory",
+        pattern="^(memory|redis)$",
+        validation_alias=_alias("floodstore"),
+    )
+    deletion: str = Field(
+        "inline",
+        pattern="^(inline|queue)$",
+        validation_alias=_alias("deletion"),
+    )
+    purgeparallel: int = Field(1, ge=1, validation_alias=_alias("purgeparallel"))
+    mediacache: int = Field(0, ge=0, validation_alias=_alias("mediacache"))
+    mediastore: str = Field("", validation_alias=_alias("mediastore"))
+    renderfanout: int = Field(1, ge=1, validation_alias=_alias("renderfanout"))
+    albumfanout: int = Field(1, ge=1, validation_alias=_alias("albumfanout"))
+    markupcache: int = Field(0, ge=0, validation_alias=_alias("markupcache"))
+
+    @model_validator(mode="after")
+    def _check_intern(self) -> Settings:
+        """Reject markup interning for stores that do not implement it."""
+
+        if self.historyintern and self.historystore != "fsm":
+            raise ValueError(
+                "NAV_HISTORY_INTERN is only supported with NAV_HISTORY_STORE=fsm"
+            )
+        return self
+
+    @property
+    def optimistic(self) -> bool:
+        """Return whether history writes use generation checks instead of scope locks."""
+
+        return self.concurrency == "optimistic"
+
+    @property
+    def pacing(self) -> str:
+        """Return the gateway throttling mode used to select the rate limiter."""
+
+        return "on" if self.ratelimit else "off"
 
     @property
     def mixset(self) -> Set[str]:
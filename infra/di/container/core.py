@@ -2,14 +2,20 @@ from __future__ import annotations
 
 from dependency_injector import containers, providers
 from navigator.adapters.storage.fsm.context import StateContext
+from navigator.adapters.storage.fsm.snapshot import StateSnapshot
+from navigator.adapters.storage.fsm.unit import NamespaceUnit
 from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import shared_mailbox
+from navigator.app.service.shutdown import drained, shutdown_hooks
 from navigator.core.port.factory import ViewLedger
 from navigator.core.service.rendering.config import RenderingConfig
 from navigator.core.telemetry import Telemetry
 from navigator.infra.clock.system import SystemClock
 from navigator.infra.config.settings import load as ingest
 from navigator.infra.limits.config import ConfigLimits
-from navigator.infra.locks.memory import MemoryLatch
+from navigator.infra.locks.memory import shared_latch
+from navigator.infra.locks.metrics import InstrumentedLatch, lock_monitor
+from navigator.infra.locks.redis import shared_redis_latch
 
 
 class CoreContainer(containers.DeclarativeContainer):
@@ -20,6 +26,7 @@ class CoreContainer(containers.DeclarativeContainer):
     telemetry = providers.Dependency(instance_of=Telemetry)
 
     settings = providers.Singleton(ingest)
+    hooks = providers.Callable(shutdown_hooks)
     clock = providers.Singleton(SystemClock)
     limits = providers.Singleton(
         ConfigLimits,
@@ -29,8 +36,46 @@ class CoreContainer(containers.DeclarativeContainer):
         maximum=settings.provided.groupmax,
         mix=settings.provided.mixset,
     )
-    locker = providers.Singleton(MemoryLatch)
-    guard = providers.Factory(Guardian, provider=locker)
+    snapshot = providers.Singleton(StateSnapshot, state=state)
+    unit = providers.Singleton(
+        NamespaceUnit,
+        state=snapshot,
+        verify=settings.provided.optimistic,
+    )
+    latches = providers.Selector(
+        settings.provided.lockstore,
+        memory=providers.Callable(shared_latch, capacity=settings.provided.lockidle),
+        redis=providers.Callable(
+            drained,
+            providers.Callable(
+                shared_redis_latch,
+                url=settings.provided.redisurl,
+                ttl=settings.provided.lockttl,
+                blocking=settings.provided.lockwait,
+                pool=settings.provided.redispool,
+            ),
+            hooks=hooks,
+        ),
+    )
+    locker = providers.Factory(
+        InstrumentedLatch,
+        provider=latches,
+        telemetry=telemetry,
+        monitor=providers.Callable(lock_monitor),
+    )
+    mailbox = providers.Selector(
+        settings.provided.execution,
+        lock=providers.Object(None),
+        mailbox=providers.Callable(shared_mailbox),
+    )
+    guard = providers.Factory(
+        Guardian,
+        provider=locker,
+        unit=unit,
+        optimistic=settings.provided.optimistic,
+        attempts=settings.provided.casattempts,
+        mailbox=mailbox,
+    )
     rendering = providers.Factory(RenderingConfig, thumbguard=settings.provided.thumbguard)
 
 
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from dependency_injector import containers, providers
-from navigator.adapters.storage.fsm import Chronicle, Latest, Status
+from navigator.adapters.storage.fsm import Chronicle, ChronicleConfig, Latest, Status
+from navigator.adapters.storage.fsm.chronicle_compact import create_serializer
+from navigator.adapters.storage.fsm.chronicle_compression import HistoryCompressor
+from navigator.adapters.storage.redis import (
+    RedisChronicle,
+    RedisHistoryConfig,
+    RedisKeyspace,
+    RedisLatest,
+    connect,
+    scope_key,
+)
 from navigator.app.map.entry import EntryMapper
 from navigator.core.util.entities import EntitySanitizer
 from navigator.core.telemetry import Telemetry
@@ -12,9 +22,56 @@ class StorageContainer(containers.DeclarativeContainer):
     telemetry = providers.Dependency(instance_of=Telemetry)
     entities = providers.Dependency(instance_of=EntitySanitizer)
 
-    chronicle = providers.Factory(Chronicle, state=core.state, telemetry=telemetry)
-    status = providers.Factory(Status, state=core.state, telemetry=telemetry)
-    latest = providers.Factory(Latest, state=core.state, telemetry=telemetry)
+    serializer = providers.Factory(
+        create_serializer,
+        codec=core.settings.provided.historycodec,
+        telemetry=telemetry,
+    )
+    compressor = providers.Factory(
+        HistoryCompressor,
+        threshold=core.settings.provided.compressthreshold,
+        enabled=core.settings.provided.historycompress,
+    )
+    redis = providers.Callable(connect, url=core.settings.provided.redisurl)
+    key = providers.Singleton(scope_key, state=core.state)
+    keyspace = providers.Singleton(RedisKeyspace, redis=redis, base=key, unit=core.unit)
+    chronicle = providers.Selector(
+        core.settings.provided.historystore,
+        fsm=providers.Factory(
+            Chronicle,
+            state=core.snapshot,
+            telemetry=telemetry,
+            config=providers.Factory(
+                ChronicleConfig,
+                unit=core.unit,
+                serializer=serializer,
+                compressor=compressor,
+                intern=core.settings.provided.historyintern,
+            ),
+        ),
+        redis=providers.Singleton(
+            RedisChronicle,
+            keyspace=keyspace,
+            telemetry=telemetry,
+            serializer=serializer,
+            config=providers.Factory(
+                RedisHistoryConfig,
+                verify=core.settings.provided.optimistic,
+                ttl=core.settings.provided.historyttl,
+            ),
+        ),
+    )
+    status = providers.Factory(Status, state=core.snapshot, telemetry=telemetry, unit=core.unit)
+    latest = providers.Selector(
+        core.settings.provided.historystore,
+        fsm=providers.Factory(Latest, state=core.snapshot, telemetry=telemetry, unit=core.unit),
+        redis=providers.Factory(
+            RedisLatest,
+            keyspace=keyspace,
+            telemetry=telemetry,
+            ttl=core.settings.provided.historyttl,
+        ),
+    )
     mapper = providers.Factory(
         EntryMapper,
         ledger=core.ledger,
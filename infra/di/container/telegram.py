@@ -3,15 +3,26 @@ from __future__ import annotations
 
 from dependency_injector import containers, providers
 
-from navigator.adapters.telegram.codec import AiogramCodec
+from navigator.adapters.telegram.codec import AiogramCodec, shared_markup_cache
 from navigator.adapters.telegram.entities import TELEGRAM_ENTITY_SANITIZER
-from navigator.adapters.telegram.gateway import create_gateway
-from navigator.adapters.telegram.media import TelegramMediaPolicy
+from navigator.adapters.telegram.gateway import (
+    create_gateway,
+    flood_gate,
+    shared_deletion_queue,
+    shared_limiter,
+)
+from navigator.adapters.telegram.media import (
+    TelegramMediaPolicy,
+    bind_identities,
+    shared_identities,
+)
 from navigator.adapters.telegram.serializer import (
     SignatureScreen,
     TelegramExtraSchema,
     TelegramLinkPreviewCodec,
 )
+from navigator.app.locks.fence import FencedGateway
+from navigator.app.service.shutdown import drained
 from navigator.app.service.view.album import AlbumService
 from navigator.app.service.view.executor import create_edit_executor
 from navigator.app.service.view.inline import InlineHandler, InlineEditor, InlineGuard, InlineRemapper
@@ -24,13 +35,60 @@ class TelegramInfrastructureContainer(containers.DeclarativeContainer):
     core = providers.DependenciesContainer()
     telemetry = providers.Dependency(instance_of=Telemetry)
 
-    codec = providers.Singleton(AiogramCodec, telemetry=telemetry)
+    markups = providers.Callable(
+        shared_markup_cache,
+        capacity=core.settings.provided.markupcache,
+    )
+    codec = providers.Singleton(AiogramCodec, telemetry=telemetry, cache=markups)
     schema = providers.Factory(TelegramExtraSchema)
     preview = providers.Factory(TelegramLinkPreviewCodec)
-    policy = providers.Factory(TelegramMediaPolicy, strict=core.settings.provided.strictpath)
+    uploads = providers.Callable(
+        drained,
+        providers.Callable(
+            shared_identities,
+            capacity=core.settings.provided.mediacache,
+            store=core.settings.provided.mediastore,
+        ),
+        hooks=core.hooks,
+    )
+    identities = providers.Callable(
+        bind_identities,
+        uploads=uploads,
+        bot=core.event.provided.bot,
+    )
+    policy = providers.Factory(
+        TelegramMediaPolicy,
+        strict=core.settings.provided.strictpath,
+        identities=identities,
+    )
     entities = providers.Object(TELEGRAM_ENTITY_SANITIZER)
     screen = providers.Factory(SignatureScreen, telemetry=telemetry)
-    gateway = providers.Factory(
+    limiter = providers.Selector(
+        core.settings.provided.pacing,
+        off=providers.Object(None),
+        on=providers.Callable(
+            shared_limiter,
+            rate=core.settings.provided.rateglobal,
+            chat=core.settings.provided.ratechat,
+            group=core.settings.provided.rategroup,
+            burst=core.settings.provided.rateburst,
+        ),
+    )
+    gate = providers.Selector(
+        core.settings.provided.floodstore,
+        memory=providers.Callable(flood_gate),
+        redis=providers.Callable(flood_gate, url=core.settings.provided.redisurl),
+    )
+    queue = providers.Selector(
+        core.settings.provided.deletion,
+        inline=providers.Object(None),
+        queue=providers.Callable(
+            drained,
+            providers.Callable(shared_deletion_queue),
+            hooks=core.hooks,
+        ),
+    )
+    transport = providers.Factory(
         create_gateway,
         bot=core.event.provided.bot,
         codec=codec,
@@ -42,8 +100,14 @@ class TelegramInfrastructureContainer(containers.DeclarativeContainer):
         chunk=core.settings.provided.chunk,
         truncate=core.settings.provided.truncate,
         deletepause=core.settings.provided.deletepause,
+        parallel=core.settings.provided.purgeparallel,
         telemetry=telemetry,
+        limiter=limiter,
+        gate=gate,
+        queue=queue,
+        identities=identities,
     )
+    gateway = providers.Factory(FencedGateway, gateway=transport)
 
 
 class TelegramViewServicesContainer(containers.DeclarativeContainer):
@@ -74,6 +138,7 @@ class TelegramViewServicesContainer(containers.DeclarativeContainer):
         limits=core.limits,
         thumbguard=core.settings.provided.thumbguard,
         telemetry=telemetry,
+        fanout=core.settings.provided.albumfanout,
     )
 
 
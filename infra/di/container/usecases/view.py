@@ -34,6 +34,7 @@ class ViewRenderPlanningContainer(containers.DeclarativeContainer):
         executor=executor,
         inline=inline,
         rendering=core.rendering,
+        fanout=core.settings.provided.renderfanout,
     )
     tail_operations = providers.Factory(
         TailOperations,
@@ -1,37 +1,107 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
 from navigator.core.port.locks import Lock, LockProvider
 from typing import Dict, Tuple
 
+_Key = Tuple[object, object | None]
+
+
+class _Slot:
+    __slots__ = ("lock", "users")
 
-class _LockWrapper(Lock):
     def __init__(self) -> None:
-        self._lock = asyncio.Lock()
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class _LockWrapper(Lock):
+    def __init__(self, registry: MemoryLatch, key: _Key) -> None:
+        self._registry = registry
+        self._key = key
+        self._slot: _Slot | None = None
+        self.contended = False
 
     async def acquire(self) -> bool:
-        await self._lock.acquire()
+        slot = self._registry._claim(self._key)
+        self.contended = slot.lock.locked()
+        try:
+            await slot.lock.acquire()
+        except BaseException:
+            self._registry._drop(self._key, slot)
+            raise
+        self._slot = slot
         return True
 
     def release(self) -> None:
-        self._lock.release()
+        slot, self._slot = self._slot, None
+        if slot is None:
+            return
+        slot.lock.release()
+        self._registry._drop(self._key, slot)
 
     async def untether(self) -> None:
-        if self._lock.locked():
-            self._lock.release()
+        self.release()
 
     def locked(self) -> bool:
-        return self._lock.locked()
+        return self._registry._busy(self._key)
 
 
 class MemoryLatch(LockProvider):
-    def __init__(self) -> None:
-        self._locks: Dict[Tuple[object, object | None], _LockWrapper] = {}
+    """Keep per-scope asyncio locks only while they are held or awaited.
+
+    Every acquisition registers a user on the key's slot and the slot is
+    evicted once the last user releases it. Up to ``capacity`` idle slots are
+    kept in LRU order so busy chats do not churn allocations.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._slots: Dict[_Key, _Slot] = {}
+        self._idle: OrderedDict[_Key, _Slot] = OrderedDict()
+        self._capacity = max(0, int(capacity))
 
     def latch(self, key: tuple[object, object | None]) -> Lock:
-        if key not in self._locks:
-            self._locks[key] = _LockWrapper()
-        return self._locks[key]
+        return _LockWrapper(self, key)
+
+    def live(self) -> int:
+        """Return the number of locks currently held or awaited."""
+
+        return len(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots) + len(self._idle)
+
+    def _claim(self, key: _Key) -> _Slot:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._idle.pop(key, None) or _Slot()
+            self._slots[key] = slot
+        slot.users += 1
+        return slot
+
+    def _drop(self, key: _Key, slot: _Slot) -> None:
+        slot.users -= 1
+        if slot.users > 0 or self._slots.get(key) is not slot:
+            return
+        del self._slots[key]
+        if not self._capacity:
+            return
+        self._idle[key] = slot
+        while len(self._idle) > self._capacity:
+            self._idle.popitem(last=False)
+
+    def _busy(self, key: _Key) -> bool:
+        slot = self._slots.get(key)
+        return slot is not None and slot.lock.locked()
+
+
+@lru_cache(maxsize=None)
+def shared_latch(capacity: int = 0) -> MemoryLatch:
+    """Return the process-wide registry so scope locks span updates."""
+
+    return MemoryLatch(capacity)
 
 
-__all__ = ["MemoryLatch"]
+__all__ = ["MemoryLatch", "shared_latch"]
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from navigator.core.error import LockTimeout
+from navigator.core.port.locks import Lock, LockProvider
+from navigator.core.telemetry import LogCode, Telemetry, TelemetryChannel
+
+_Key = Tuple[object, object | None]
+
+
+@dataclass(slots=True)
+class LockStats:
+    """Aggregate wait and hold figures observed for one scope key."""
+
+    acquired: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    hold_total: float = 0.0
+    hold_max: float = 0.0
+
+    @property
+    def wait_mean(self) -> float:
+        return self.wait_total / self.acquired if self.acquired else 0.0
+
+    @property
+    def hold_mean(self) -> float:
+        return self.hold_total / self.acquired if self.acquired else 0.0
+
+
+class LockMonitor:
+    """Keep in-process lock statistics for the most recently used keys."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = max(1, int(capacity))
+        self._stats: OrderedDict[_Key, LockStats] = OrderedDict()
+        self._total = LockStats()
+
+    def waited(self, key: _Key, seconds: float, *, contended: bool) -> None:
+        for stats in (self._entry(key), self._total):
+            stats.acquired += 1
+            stats.contended += int(contended)
+            stats.wait_total += seconds
+            stats.wait_max = max(stats.wait_max, seconds)
+
+    def held(self, key: _Key, seconds: float) -> None:
+        for stats in (self._entry(key), self._total):
+            stats.hold_total += seconds
+            stats.hold_max = max(stats.hold_max, seconds)
+
+    def expired(self, key: _Key) -> None:
+        for stats in (self._entry(key), self._total):
+            stats.timeouts += 1
+
+    def total(self) -> LockStats:
+        """Return statistics aggregated over every key."""
+
+        return self._total
+
+    def stats(self, key: _Key) -> LockStats | None:
+        return self._stats.get(key)
+
+    def top(self, count: int = 10, *, by: str = "wait_total") -> List[Tuple[_Key, LockStats]]:
+        """Return the ``count`` keys that serialise worst according to ``by``."""
+
+        ranked = sorted(self._stats.items(), key=lambda item: getattr(item[1], by), reverse=True)
+        return ranked[:count]
+
+    def _entry(self, key: _Key) -> LockStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = LockStats()
+            while len(self._stats) > self._capacity:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return stats
+
+
+def _describe(key: _Key) -> Dict[str, Any]:
+    return {"key": str(key[0]), "business": None if key[1] is None else str(key[1])}
+
+
+class _TimedLock(Lock):
+    def __init__(
+        self,
+        lock: Lock,
+        key: _Key,
+        monitor: LockMonitor,
+        channel: TelemetryChannel | None,
+    ) -> None:
+        self._lock = lock
+        self._key = key
+        self._monitor = monitor
+        self._channel = channel
+        self._since: float | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lock, name)
+
+    async def acquire(self) -> bool:
+        started = time.perf_counter()
+        try:
+            acquired = await self._lock.acquire()
+        except LockTimeout:
+            self._monitor.expired(self._key)
+            self._emit(
+                logging.WARNING,
+                LogCode.LOCK_TIMEOUT,
+                wait_ms=self._millis(time.perf_counter() - started),
+            )
+            raise
+        self._since = time.perf_counter()
+        waited = self._since - started
+        contended = bool(getattr(self._lock, "contended", False))
+        self._monitor.waited(self._key, waited, contended=contended)
+        self._emit(
+            logging.INFO if contended else logging.DEBUG,
+            LogCode.LOCK_CONTENDED if contended else LogCode.LOCK_ACQUIRE,
+            wait_ms=self._millis(waited),
+        )
+        return acquired
+
+    def release(self) -> None:
+        self._settle()
+        self._lock.release()
+
+    async def untether(self) -> None:
+        self._settle()
+        await self._lock.untether()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def _settle(self) -> None:
+        since, self._since = self._since, None
+        if since is None:
+            return
+        held = time.perf_counter() - since
+        self._monitor.held(self._key, held)
+        self._emit(logging.DEBUG, LogCode.LOCK_RELEASE, hold_ms=self._millis(held))
+
+    def _emit(self, level: int, code: LogCode, **fields: Any) -> None:
+        if self._channel is not None:
+            self._channel.emit(level, code, lock=_describe(self._key), **fields)
+
+    @staticmethod
+    def _millis(seconds: float) -> float:
+        return round(seconds * 1000, 3)
+
+
+class InstrumentedLatch(LockProvider):
+    """Measure acquire latency, hold time, contention and timeouts of a provider."""
+
+    def __init__(
+        self,
+        provider: LockProvider,
+        telemetry: Telemetry | None = None,
+        monitor: LockMonitor | None = None,
+    ) -> None:
+        self._provider = provider
+        self._monitor = monitor or lock_monitor()
+        self._channel: TelemetryChannel | None = (
+            telemetry.channel(__name__) if telemetry else None
+        )
+
+    @property
+    def monitor(self) -> LockMonitor:
+        return self._monitor
+
+    def latch(self, key: tuple[object, object | None]) -> Lock:
+        return _TimedLock(self._provider.latch(key), key, self._monitor, self._channel)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider, name)
+
+
+@lru_cache(maxsize=1)
+def lock_monitor() -> LockMonitor:
+    """Return the process-wide lock statistics aggregate."""
+
+    return LockMonitor()
+
+
+__all__ = ["InstrumentedLatch", "LockMonitor", "LockStats", "lock_monitor"]
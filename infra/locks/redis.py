@@ -2,66 +2,238 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import uuid
+from functools import cache
+from typing import Any, Set
 
-try:
-    from redis.asyncio import Redis
-except Exception:  # pragma: no cover - optional dependency
-    Redis = None
-
-from navigator.core.port.locks import Lock, LockProvider
+from navigator.core.error import LockTimeout
+from navigator.core.port.locks import Lease, Lock, LockProvider
 
 logger = logging.getLogger(__name__)
 
+_ACQUIRE = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return 0
+end
+local fence = redis.call('incr', KEYS[2])
+redis.call('pexpire', KEYS[2], ARGV[3])
+redis.call('set', KEYS[1], fence .. ':' .. ARGV[1], 'PX', ARGV[2])
+return fence
+"""
+
+_RELEASE = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_RENEW = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_POLL_FLOOR = 0.01
+_POLL_CEILING = 0.2
+_FENCE_RETENTION = 86400.0
+
 
 class _Latch(Lock):
-    def __init__(self, redis: Any, name: str, ttl: float, blocking: float) -> None:
-        self._redis = redis
+    """Token-guarded Redis lock with lease renewal and fencing.
+
+    A successful acquisition draws a monotonically increasing fence in the
+    same script that takes the key and stores ``<fence>:<nonce>`` under it,
+    so only the holder can renew or delete it. :attr:`lease` names the key
+    and fence of the last acquisition; the Redis chronicle watches that key
+    and refuses to write once it carries another value. The fence counter
+    expires after a day without acquisitions, long after any lease it was
+    issued to. When renewal finds the lease gone the hold is marked
+    :attr:`lost`, :meth:`locked` reports ``False`` and the task that
+    acquired the lock is cancelled so it cannot carry on as the holder.
+    """
+
+    def __init__(self, provider: RedisLatch, name: str) -> None:
+        self._provider = provider
         self._name = name
-        self._ttl = ttl
-        self._blocking = blocking
-        self._lock: Any | None = None
-        self._held = False
+        self._token: str | None = None
+        self._fence: int | None = None
+        self._renewal: asyncio.Task[None] | None = None
+        self._holder: asyncio.Task[object] | None = None
+        self.contended = False
+        self.lost = False
+
+    @property
+    def fence(self) -> int | None:
+        """Return the fencing token of the current hold."""
+
+        return self._fence
+
+    @property
+    def lease(self) -> Lease | None:
+        if self._fence is None:
+            return None
+        return Lease(self._name, self._fence)
 
     async def acquire(self) -> bool:
-        self._lock = self._redis.lock(
-            self._name,
-            timeout=self._ttl,
-            blocking_timeout=self._blocking,
-        )
-        await self._lock.acquire()
-        self._held = True
+        redis = self._provider.redis
+        nonce = uuid.uuid4().hex
+        ttl = int(self._provider.ttl * 1000)
+        retention = int(max(_FENCE_RETENTION, self._provider.ttl) * 1000)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._provider.blocking
+        pause = _POLL_FLOOR
+        self.contended = False
+        self.lost = False
+        while True:
+            fence = int(
+                await redis.eval(
+                    _ACQUIRE, 2, self._name, f"{self._name}:fence", nonce, ttl, retention
+                )
+            )
+            if fence:
+                break
+            self.contended = True
+            if loop.time() >= deadline:
+                raise LockTimeout(self._name)
+            await asyncio.sleep(min(pause, max(0.0, deadline - loop.time())))
+            pause = min(pause * 2, _POLL_CEILING)
+        token = f"{fence}:{nonce}"
+        self._token = token
+        self._fence = fence
+        self._holder = asyncio.current_task()
+        self._renewal = asyncio.create_task(self._renew(token))
+        self._provider.hold(self)
         return True
 
     def release(self) -> None:
-        if self._held and self._lock is not None:
-            asyncio.get_running_loop().create_task(self.untether())
+        if self._token is not None:
+            self._provider.track(self.untether())
 
     async def untether(self) -> None:
-        if not self._held or self._lock is None:
+        token, self._token = self._token, None
+        renewal, self._renewal = self._renewal, None
+        self._holder = None
+        self._provider.drop(self)
+        if renewal is not None:
+            renewal.cancel()
+            await asyncio.gather(renewal, return_exceptions=True)
+        if token is None:
             return
         try:
-            await self._lock.release()
+            await self._provider.redis.eval(_RELEASE, 1, self._name, token)
         except Exception as exc:  # pragma: no cover - log but ignore
             logger.warning("redis_lock_release_failed: %s", type(exc).__name__)
-        finally:
-            self._held = False
 
     def locked(self) -> bool:
-        return self._held
+        return self._token is not None
+
+    async def _renew(self, token: str) -> None:
+        ttl = int(self._provider.ttl * 1000)
+        interval = self._provider.ttl / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self._provider.redis.eval(_RENEW, 1, self._name, token, ttl)
+            except Exception as exc:  # pragma: no cover - transient failure
+                logger.warning("redis_lock_renew_failed: %s", type(exc).__name__)
+                continue
+            if not renewed:
+                logger.warning("redis_lock_lost: %s", self._name)
+                if self._token == token:
+                    self._token = None
+                    self.lost = True
+                    self._abandon()
+                return
+
+    def _abandon(self) -> None:
+        holder = self._holder
+        if holder is not None and not holder.done():
+            holder.cancel(f"redis_lock_lost:{self._name}")
 
 
 class RedisLatch(LockProvider):
-    def __init__(self, url: str, *, ttl: float, blocking: float) -> None:
-        if Redis is None:
-            raise RuntimeError("redis package not installed")
-        self._redis = Redis.from_url(url)
+    """Distributed scope locks backed by a bounded Redis connection pool.
+
+    Leases last ``ttl`` seconds and are renewed in the background while
+    held, waiting for a lock gives up after ``blocking`` seconds with
+    :class:`LockTimeout`, and synchronous releases run as tracked tasks.
+    :meth:`drain`, registered as a shutdown hook by the container, releases
+    every lease still held and awaits those tasks.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl: float,
+        blocking: float,
+        pool: int = 32,
+        redis: Any | None = None,
+    ) -> None:
+        if redis is None:
+            try:
+                from redis.asyncio import BlockingConnectionPool, Redis
+            except ImportError as error:  # pragma: no cover - optional dependency
+                raise RuntimeError("redis package not installed") from error
+            connections = BlockingConnectionPool.from_url(
+                url,
+                max_connections=max(1, int(pool)),
+                timeout=float(blocking) or None,
+            )
+            redis = Redis(connection_pool=connections)
+        self._redis = redis
         self._ttl = float(ttl)
         self._blocking = float(blocking)
+        self._pending: Set[asyncio.Task[None]] = set()
+        self._held: Set[_Latch] = set()
+
+    @property
+    def redis(self) -> Any:
+        return self._redis
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def blocking(self) -> float:
+        return self._blocking
 
     def latch(self, key: tuple[object, object | None]) -> Lock:
         name = f"nav:lock:{key[0]}:{key[1]}"
-        return _Latch(self._redis, name, self._ttl, self._blocking)
+        return _Latch(self, name)
+
+    def track(self, release: Any) -> None:
+        """Run ``release`` in the background while keeping a reference to it."""
+
+        task = asyncio.get_running_loop().create_task(release)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def hold(self, latch: _Latch) -> None:
+        self._held.add(latch)
+
+    def drop(self, latch: _Latch) -> None:
+        self._held.discard(latch)
+
+    async def drain(self) -> None:
+        """Release held leases and wait for background releases to finish."""
+
+        await asyncio.gather(
+            *(latch.untether() for latch in tuple(self._held)),
+            return_exceptions=True,
+        )
+        while self._pending:
+            await asyncio.gather(*tuple(self._pending), return_exceptions=True)
+
+
+@cache
+def shared_redis_latch(url: str, ttl: float, blocking: float, pool: int = 32) -> RedisLatch:
+    """Return the process-wide Redis lock provider for ``url``."""
+
+    return RedisLatch(url, ttl=ttl, blocking=blocking, pool=pool)
 
 
-__all__ = ["RedisLatch"]
+__all__ = ["RedisLatch", "shared_redis_latch"]
@@ -1,23 +1,39 @@
 """Manual scenarios and utilities for exploratory testing."""
 
 from .alarm import override, reliance
-from .gateway import commerce, fragments, translation, wording
+from .gateway import commerce, deluge, fragments, replica, translation, wording
 from .history import absence, surface
+from .locks import backlog, rival, tenure
 from .navigator import siren
+from .storage import bundle, ledger, straggler, stranger, vacancy
 from .tail import decline
-from .view import assent, rebuff, refuse, veto
+from .view import assent, cadence, gallery, mould, rebuff, refuse, sweep, veto
 
 __all__ = [
     "absence",
     "assent",
+    "backlog",
+    "bundle",
+    "cadence",
     "commerce",
     "decline",
+    "deluge",
     "fragments",
+    "gallery",
+    "ledger",
+    "mould",
     "rebuff",
     "refuse",
     "reliance",
+    "replica",
+    "rival",
     "siren",
+    "straggler",
+    "stranger",
     "surface",
+    "sweep",
+    "tenure",
+    "vacancy",
     "veto",
     "wording",
     "translation",
@@ -6,10 +6,13 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import navigator.adapters.telegram.gateway.purge as purger
+from navigator.adapters.telegram.codec import AiogramCodec, MarkupCache
 from navigator.adapters.telegram.errors import dismissible
 from navigator.adapters.telegram.gateway import create_gateway
+from navigator.adapters.telegram.gateway.flood import FloodGate, buckets
 from navigator.adapters.telegram.gateway.purge import PurgeTask
 from navigator.adapters.telegram.serializer.screen import SignatureScreen
+from navigator.core.entity.markup import Markup
 from navigator.core.value.message import Scope
 
 from .common import monitor
@@ -52,10 +55,10 @@ def wording() -> None:
             return set()
 
     class DummyPolicy:
-        def admissible(self, path, *, inline):
+        def admissible(self, path, *, inline, kind=None):
             return True
 
-        def adapt(self, path, *, native):
+        def adapt(self, path, *, native, kind=None):
             return path
 
     telemetry = monitor()
@@ -117,6 +120,69 @@ def commerce() -> None:
         assert kwargs["message_ids"]
 
 
+def deluge() -> None:
+    """Check flood waits pause the tier Telegram enforces them on."""
+
+    async def send_message(**kwargs):
+        return None
+
+    async def scenario() -> None:
+        gate = FloodGate()
+        private = buckets(send_message, {"chat_id": 5})
+        neighbour = buckets(send_message, {"chat_id": 6})
+        group = buckets(send_message, {"chat_id": -5})
+        sibling = buckets(send_message, {"chat_id": -6})
+
+        assert private.tiers[0] == group.tiers[0] == "bot"
+        assert private.tiers[1] != group.tiers[1]
+
+        await gate.hold(private.target, 0.05)
+        assert await gate.admit(group) == 0
+        assert await gate.admit(neighbour) > 0
+
+        await gate.hold(group.target, 0.05)
+        assert await gate.admit(sibling) == 0
+        assert await gate.admit(group) > 0
+
+        await gate.hold(buckets(send_message, {}).target, 0.05)
+        assert await gate.admit(sibling) > 0
+
+    asyncio.run(scenario())
+
+
+def replica() -> None:
+    """Verify decoded markup cache hits match fresh decodes and never mix keyboards."""
+
+    def keyboard(text: str, data: str) -> dict:
+        return {"inline_keyboard": [[{"text": text, "callback_data": data}]]}
+
+    codec = AiogramCodec(monitor(), MarkupCache(2))
+    plain = AiogramCodec(monitor())
+    stored = Markup(kind="InlineKeyboardMarkup", data=keyboard("a", "x"))
+    reordered = Markup(
+        kind="InlineKeyboardMarkup",
+        data={"inline_keyboard": [[{"callback_data": "x", "text": "a"}]]},
+    )
+    other = Markup(kind="InlineKeyboardMarkup", data=keyboard("b", "y"))
+
+    first = codec.decode(stored)
+    assert first == plain.decode(stored)
+    assert codec.decode(reordered) is first
+    assert codec.decode(other) is not first
+    assert codec.decode(other) == plain.decode(other)
+    assert plain.decode(stored) is not plain.decode(stored)
+
+    stored.data["inline_keyboard"][0][0]["text"] = "c"
+    changed = codec.decode(stored)
+    assert changed is not first
+    assert changed.inline_keyboard[0][0].text == "c"
+    assert first.inline_keyboard[0][0].text == "a"
+
+    reply = Markup(kind="ReplyKeyboardMarkup", data={"keyboard": [[{"text": "a"}]]})
+    assert type(codec.decode(reply)).__name__ == "ReplyKeyboardMarkup"
+    assert codec.decode(reordered) is not first
+
+
 def fragments() -> None:
     """List error fragments considered dismissible."""
 
@@ -145,4 +211,4 @@ def translation() -> None:
     assert "Предыдущий экран" in payload
 
 
-__all__ = ["commerce", "fragments", "translation", "wording"]
+__all__ = ["commerce", "deluge", "fragments", "replica", "translation", "wording"]
@@ -0,0 +1,174 @@
+"""Manual scenarios for scope guards, lock providers and the scope mailbox."""
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+from navigator.adapters.storage.fsm import FSM_NAMESPACE_KEY, NamespaceUnit
+from navigator.adapters.storage.redis import RedisChronicle, RedisKeyspace
+from navigator.app.locks.fence import FencedGateway
+from navigator.app.locks.guard import Guardian
+from navigator.app.locks.mailbox import Intent, ScopeMailbox
+from navigator.core.entity.history import Entry
+from navigator.core.error import LeaseLost
+from navigator.core.value.message import Scope
+from navigator.infra.locks.memory import MemoryLatch
+from navigator.infra.locks.redis import RedisLatch
+
+from .common import monitor
+
+_LOG = "log"
+_LEASE = 0.3
+
+
+class _State:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get_state(self) -> str | None:
+        return None
+
+    async def set_state(self, state: str | None) -> None:
+        return None
+
+    async def get_data(self) -> dict[str, Any]:
+        return dict(self.data)
+
+    async def update_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        self.data.update(data)
+        return dict(self.data)
+
+
+def _redis() -> Any:
+    try:
+        from fakeredis import FakeAsyncRedis
+    except ImportError:
+        from redis.asyncio import Redis
+
+        return Redis.from_url(os.environ.get("NAV_REDIS_URL", "redis://localhost:6379/0"))
+    return FakeAsyncRedis()
+
+
+def _entry(state: str) -> Entry:
+    return Entry(state=state, view=None, messages=[])
+
+
+def backlog() -> None:
+    """Check the mailbox runs a scope serially and coalesces queued bursts."""
+
+    async def scenario() -> None:
+        mailbox = ScopeMailbox()
+        guardian = Guardian(MemoryLatch(), mailbox=mailbox)
+        scope = Scope(chat=1)
+        ran: list[str] = []
+
+        def job(tag: str) -> Callable[[], Awaitable[None]]:
+            async def action() -> None:
+                await asyncio.sleep(0.01)
+                ran.append(tag)
+
+            return action
+
+        def back(count: int) -> Callable[[], Awaitable[None]]:
+            return job(f"pop{count}")
+
+        await asyncio.gather(
+            guardian.run(scope, job("first")),
+            guardian.run(scope, job("add1"), intent=Intent(kind="add")),
+            guardian.run(scope, job("add2"), intent=Intent(kind="add")),
+            guardian.run(scope, job("pop1"), intent=Intent(kind="pop", rebuild=back)),
+            guardian.run(scope, job("pop1"), intent=Intent(kind="pop", rebuild=back)),
+        )
+        assert ran == ["first", "add2", "pop2"]
+        assert mailbox.coalesced == 2
+        assert len(mailbox) == 0
+
+    asyncio.run(scenario())
+
+
+def rival() -> None:
+    """Ensure an optimistic update planned on stale reads re-plans before sending."""
+
+    async def scenario() -> None:
+        state = _State()
+        latch = MemoryLatch()
+        scope = Scope(chat=1)
+        gateway = SimpleNamespace(send=AsyncMock())
+        runs: list[str] = []
+
+        async def update(tag: str, delay: float) -> None:
+            unit = NamespaceUnit(state, verify=True)
+            guardian = Guardian(latch, unit, optimistic=True)
+            fenced = FencedGateway(gateway)
+
+            async def action() -> None:
+                runs.append(tag)
+                namespace = await unit.read()
+                await asyncio.sleep(delay)
+                await fenced.send(scope, tag)
+                await unit.write({**namespace, _LOG: [*namespace.get(_LOG, []), tag]})
+
+            await guardian.run(scope, action)
+
+        await asyncio.gather(update("a", 0.01), update("b", 0.02))
+        assert runs == ["a", "b", "b"]
+        assert [call.args[1] for call in gateway.send.await_args_list] == ["a", "b"]
+        assert state.data[FSM_NAMESPACE_KEY][_LOG] == ["a", "b"]
+
+    asyncio.run(scenario())
+
+
+def tenure() -> None:
+    """Verify fenced writes, lost leases and draining of the Redis lock provider."""
+
+    async def scenario() -> None:
+        redis = _redis()
+        chat = uuid.uuid4().int % 10**9
+        name = f"nav:lock:{chat}:None"
+        latch = RedisLatch("", ttl=_LEASE, blocking=1.0, redis=redis)
+        guardian = Guardian(latch)
+        scope = Scope(chat=chat)
+        chronicle = RedisChronicle(RedisKeyspace(redis, f"nav:manual:{chat}"), monitor())
+        history = f"nav:manual:{chat}:history"
+
+        async with guardian(scope):
+            await chronicle.archive([_entry("a")])
+        assert await redis.llen(history) == 1
+
+        try:
+            async with guardian(scope):
+                await redis.set(name, "0:intruder")
+                await chronicle.archive([_entry("a"), _entry("b")])
+        except LeaseLost:
+            pass
+        else:
+            raise AssertionError("LeaseLost was not raised for a stolen lease")
+        assert await redis.llen(history) == 1
+        await redis.delete(name)
+
+        try:
+            async with guardian(scope):
+                await redis.delete(name)
+                await asyncio.sleep(_LEASE * 3)
+                raise AssertionError("holder kept running after losing its lease")
+        except LeaseLost:
+            pass
+        else:
+            raise AssertionError("LeaseLost was not raised for an expired lease")
+
+        lock = latch.latch((chat, None))
+        await lock.acquire()
+        assert await redis.exists(name)
+        await latch.drain()
+        assert not await redis.exists(name)
+        assert not lock.locked()
+
+    asyncio.run(scenario())
+
+
+__all__ = ["backlog", "rival", "tenure"]
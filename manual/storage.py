@@ -0,0 +1,194 @@
+"""Manual scenarios for the Redis-native history repositories.
+
+Scenarios run against ``fakeredis`` when it is installed and otherwise
+against the server named by ``NAV_REDIS_URL``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from navigator.adapters.storage.fsm import Chronicle, ChronicleConfig, Latest
+from navigator.adapters.storage.fsm.unit import NamespaceUnit
+from navigator.adapters.storage.redis import (
+    RedisChronicle,
+    RedisHistoryConfig,
+    RedisKeyspace,
+    RedisLatest,
+)
+from navigator.app.locks.guard import Guardian
+from navigator.core.entity.history import Entry, Message
+from navigator.core.value.message import Scope
+from navigator.infra.locks.memory import MemoryLatch
+
+from .common import monitor
+
+_TTL = 60
+_MARKER = 7
+
+
+class _State:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.writes = 0
+
+    async def get_state(self) -> str | None:
+        return None
+
+    async def set_state(self, state: str | None) -> None:
+        return None
+
+    async def get_data(self) -> dict[str, Any]:
+        return dict(self.data)
+
+    async def update_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        self.writes += 1
+        self.data.update(data)
+        return dict(self.data)
+
+
+def _redis() -> Any:
+    try:
+        from fakeredis import FakeAsyncRedis
+    except ImportError:
+        from redis.asyncio import Redis
+
+        return Redis.from_url(os.environ.get("NAV_REDIS_URL", "redis://localhost:6379/0"))
+    return FakeAsyncRedis()
+
+
+def _key() -> str:
+    return f"nav:manual:{uuid.uuid4().hex}"
+
+
+def _entry(state: str) -> Entry:
+    message = Message(
+        id=len(state),
+        text=state,
+        media=None,
+        group=None,
+        markup=None,
+        preview=None,
+        extra=None,
+        extras=[],
+        inline=None,
+        automated=False,
+        ts=datetime.now(UTC),
+    )
+    return Entry(state=state, view=None, messages=[message])
+
+
+async def _states(redis: Any, key: str) -> list[str]:
+    raw = await redis.lrange(f"{key}:history", 0, -1)
+    return [json.loads(item)["state"] for item in raw]
+
+
+def ledger() -> None:
+    """Verify appends and pops only touch the changed end of the list."""
+
+    async def scenario() -> None:
+        redis = _redis()
+        key = _key()
+        chronicle = RedisChronicle(
+            RedisKeyspace(redis, key), monitor(), config=RedisHistoryConfig(ttl=_TTL)
+        )
+        await chronicle.archive([_entry("a"), _entry("b")])
+        history = await chronicle.recall()
+        await chronicle.archive([*history, _entry("c")])
+        assert await _states(redis, key) == ["a", "b", "c"]
+        history = await RedisChronicle(RedisKeyspace(redis, key), monitor()).recall()
+        await chronicle.archive(history[:-1])
+        assert await _states(redis, key) == ["a", "b"]
+        assert 0 < await redis.pttl(f"{key}:history") <= _TTL * 1000
+
+    asyncio.run(scenario())
+
+
+def straggler() -> None:
+    """Ensure a writer holding a stale snapshot rewrites the list consistently."""
+
+    async def scenario() -> None:
+        redis = _redis()
+        key = _key()
+        first = RedisChronicle(RedisKeyspace(redis, key), monitor())
+        second = RedisChronicle(RedisKeyspace(redis, key), monitor())
+        await first.archive([_entry("a"), _entry("b")])
+        early = await first.recall()
+        late = await second.recall()
+        await second.archive([*late, _entry("c")])
+        await first.archive(early[:-1])
+        assert await _states(redis, key) == ["a"]
+        assert len(await second.recall()) == 1
+
+    asyncio.run(scenario())
+
+
+def stranger() -> None:
+    """Check that archiving without a recall diffs against the stored list."""
+
+    async def scenario() -> None:
+        redis = _redis()
+        key = _key()
+        entries = [_entry("a"), _entry("b")]
+        await RedisChronicle(RedisKeyspace(redis, key), monitor()).archive(entries)
+        await redis.expire(f"{key}:history", _TTL)
+        await RedisChronicle(RedisKeyspace(redis, key), monitor()).archive([*entries, _entry("c")])
+        assert await _states(redis, key) == ["a", "b", "c"]
+        assert await redis.ttl(f"{key}:history") > 0
+
+    asyncio.run(scenario())
+
+
+def bundle() -> None:
+    """Check a guarded operation flushes history and marker in one update."""
+
+    async def scenario() -> None:
+        state = _State()
+        unit = NamespaceUnit(state)
+        chronicle = Chronicle(state, monitor(), config=ChronicleConfig(unit=unit))
+        latest = Latest(state, monitor(), unit=unit)
+        guardian = Guardian(MemoryLatch(), unit)
+        async with guardian(Scope(chat=1)):
+            await chronicle.archive([_entry("a")])
+            await latest.mark(_MARKER)
+            assert state.writes == 0
+        assert state.writes == 1
+        assert [entry.state for entry in await chronicle.recall()] == ["a"]
+        assert await latest.peek() == _MARKER
+        await latest.mark(None)
+        assert state.writes == 2
+
+    asyncio.run(scenario())
+
+
+def vacancy() -> None:
+    """Confirm clearing FSM data also drops the Redis keys of the scope."""
+
+    async def scenario() -> None:
+        redis = _redis()
+        key = _key()
+        state = _State()
+
+        def repositories() -> tuple[RedisChronicle, RedisLatest]:
+            keyspace = RedisKeyspace(redis, key, NamespaceUnit(state))
+            return RedisChronicle(keyspace, monitor()), RedisLatest(keyspace, monitor())
+
+        chronicle, latest = repositories()
+        await chronicle.archive([_entry("a")])
+        await latest.mark(_MARKER)
+        chronicle, latest = repositories()
+        assert len(await chronicle.recall()) == 1
+        assert await latest.peek() == _MARKER
+        state.data.clear()
+        chronicle, latest = repositories()
+        assert len(await chronicle.recall()) == 0
+        assert await latest.peek() is None
+
+    asyncio.run(scenario())
+
+
+__all__ = ["bundle", "ledger", "straggler", "stranger", "vacancy"]
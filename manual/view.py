@@ -2,13 +2,31 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
+
+from navigator.app.service.view.album import AlbumMutation, AlbumMutationExecutor
+from navigator.app.service.view.execution import Execution
+from navigator.app.service.view.execution.cleanup import EditCleanup, discard
+from navigator.app.service.view.execution.fallback import FallbackStrategy
+from navigator.app.service.view.forge import (
+    ForgeCache,
+    ForgeInvoker,
+    forge_cache,
+    forge_supplies,
+)
 from navigator.app.service.view.planner import RenderPreparer, ViewPlanner
+from navigator.app.service.view.planner.models import RenderState
+from navigator.app.service.view.planner.regular import RegularRenderPlanner
+from navigator.app.service.view.planner.synchronizer import RenderSynchronizer
+from navigator.app.service.view.planner.tails import TailOperations
 from navigator.app.service.view.policy import adapt
 from navigator.app.service.view.restorer import ViewRestorer
 from navigator.app.internal.policy import shield
-from navigator.core.entity.history import Entry
+from navigator.core.entity.history import Entry, Message
 from navigator.core.entity.media import MediaItem, MediaType
 from navigator.core.error import InlineUnsupported
+from navigator.core.service.rendering.config import RenderingConfig
+from navigator.core.service.rendering.decision import Decision
 from navigator.core.value.content import Payload
 from navigator.core.value.message import Scope
 
@@ -122,4 +140,189 @@ def refuse() -> None:
         raise AssertionError("InlineUnsupported was not raised")
 
 
-__all__ = ["assent", "rebuff", "refuse", "veto"]
+def cadence() -> None:
+    """Ensure concurrent edits that fall back to resends send in plan order."""
+
+    sent: list[str] = []
+
+    class Gateway:
+        async def send(self, scope, payload):
+            sent.append(payload.text)
+            return SimpleNamespace(id=100 + len(sent), extra=[])
+
+        async def delete(self, scope, identifiers):
+            return None
+
+    fallback = FallbackStrategy(Gateway())
+
+    class Executor:
+        async def execute(self, scope, verdict, payload, last):
+            position = last.id
+            await asyncio.sleep((8 - position) / 1000)
+            if position % 2:
+                return await fallback.resend(scope, payload, last)
+            return Execution(result=SimpleNamespace(id=position, extra=[]), stem=last)
+
+        def refine(self, execution, verdict, payload):
+            return None
+
+    ledger = [
+        Message(id=index, text=f"old{index}", media=None, group=None, markup=None)
+        for index in range(8)
+    ]
+    fresh = [Payload(text=f"new{index}") for index in range(8)]
+    synchronizer = RenderSynchronizer(Executor(), None, RenderingConfig(), fanout=4)
+    state = RenderState()
+
+    mutated = asyncio.run(
+        synchronizer.reconcile(
+            Scope(chat=3, lang="en"), fresh, ledger, state, start=0, inline_mode=False
+        )
+    )
+
+    assert mutated
+    assert sent == ["new1", "new3", "new5", "new7"]
+    assert state.ids == [0, 101, 2, 102, 4, 103, 6, 104]
+
+
+def sweep() -> None:
+    """Check one render deletes everything in a single call after its sends."""
+
+    calls: list[tuple[str, object]] = []
+
+    class Gateway:
+        async def send(self, scope, payload):
+            calls.append(("send", payload.text))
+            return SimpleNamespace(id=100 + len(calls), extra=[])
+
+        async def delete(self, scope, identifiers):
+            calls.append(("delete", list(identifiers)))
+
+    gateway = Gateway()
+    fallback = FallbackStrategy(gateway)
+    cleanup = EditCleanup(gateway)
+
+    class Executor:
+        async def execute(self, scope, verdict, payload, last):
+            return await fallback.resend(scope, payload, last)
+
+        def refine(self, execution, verdict, payload):
+            return None
+
+        async def delete(self, scope, identifiers):
+            await cleanup.delete(scope, identifiers)
+
+        def batch(self):
+            return cleanup.batch()
+
+    class Head:
+        async def align(self, scope, ledger, fresh, state):
+            await discard(gateway, scope, [90])
+            state.retain(ledger[0])
+            return 1, False
+
+    executor = Executor()
+    config = RenderingConfig()
+    planner = RegularRenderPlanner(
+        head=Head(),
+        synchronizer=RenderSynchronizer(executor, None, config),
+        tails=TailOperations(executor, config),
+    )
+    ledger = [
+        Message(id=0, text="head", media=None, group=None, markup=None),
+        Message(id=1, text="old1", media=None, group=None, markup=None, extras=[11]),
+        Message(id=2, text="old2", media=None, group=None, markup=None),
+    ]
+    fresh = [Payload(text="head"), Payload(text="new1"), Payload(text="new2")]
+
+    mutated = asyncio.run(planner.plan(Scope(chat=4, lang="en"), fresh, ledger, RenderState()))
+
+    assert mutated
+    assert calls == [
+        ("send", "new1"),
+        ("send", "new2"),
+        ("delete", [90, 1, 11, 2]),
+    ]
+
+
+def mould() -> None:
+    """Verify cached forge output is keyed on scope and supply values."""
+
+    now = [0.0]
+    calls: list[object] = []
+
+    @forge_cache(ttl=5)
+    @forge_supplies("filters")
+    async def forge(filters):
+        calls.append(filters)
+        return Payload(text=f"page {len(calls)}")
+
+    cache = ForgeCache(clock=lambda: now[0])
+    invoker = ForgeInvoker(monitor().channel(__name__), cache=cache)
+    first = Scope(chat=1, lang="en")
+    second = Scope(chat=2, lang="en")
+
+    async def render(scope, filters):
+        payload = await invoker.invoke("catalog", forge, {"filters": filters}, scope=scope)
+        return payload.text
+
+    async def scenario() -> None:
+        assert await render(first, {"tag": "a", "page": [1]}) == "page 1"
+        assert await render(first, {"page": [1], "tag": "a"}) == "page 1"
+        assert await render(first, {"tag": "b", "page": [1]}) == "page 2"
+        assert await render(second, {"tag": "a", "page": [1]}) == "page 3"
+        assert await render(first, bytearray(b"a")) == "page 4"
+        assert await render(first, bytearray(b"a")) == "page 5"
+        assert cache.invalidate("catalog", scope=first) == 2
+        assert await render(second, {"tag": "a", "page": [1]}) == "page 3"
+        assert await render(first, {"tag": "a", "page": [1]}) == "page 6"
+        now[0] = 6.0
+        assert await render(second, {"tag": "a", "page": [1]}) == "page 7"
+
+    asyncio.run(scenario())
+
+
+def gallery() -> None:
+    """Check album items are edited concurrently, in order per message."""
+
+    applied: list[tuple[int, Decision]] = []
+    running = [0, 0]
+
+    class Executor:
+        async def execute(self, scope, verdict, payload, last):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            if payload.text == "broken":
+                raise RuntimeError(f"edit_failed:{last.id}")
+            applied.append((last.id, verdict))
+            return Execution(result=SimpleNamespace(id=last.id, extra=[]), stem=last)
+
+    items = [
+        Message(id=index, text=None, media=None, group=None, markup=None)
+        for index in range(1, 5)
+    ]
+    plan = [
+        AlbumMutation(Decision.EDIT_MEDIA_CAPTION, Payload(text="head"), items[0]),
+        AlbumMutation(Decision.EDIT_MARKUP, Payload(text="head"), items[0]),
+        AlbumMutation(Decision.EDIT_MEDIA, Payload(text="broken"), items[1]),
+        AlbumMutation(Decision.EDIT_MEDIA, Payload(text="third"), items[2]),
+        AlbumMutation(Decision.EDIT_MEDIA, Payload(text="broken"), items[3]),
+    ]
+    mutations = AlbumMutationExecutor(Executor(), fanout=3, channel=monitor().channel(__name__))
+
+    try:
+        asyncio.run(mutations.apply(Scope(chat=6, lang="en"), plan))
+    except RuntimeError as error:
+        assert str(error) == "edit_failed:2"
+    else:
+        raise AssertionError("item failure was not re-raised")
+
+    assert running[1] == 3
+    heads = [verdict for identifier, verdict in applied if identifier == 1]
+    assert heads == [Decision.EDIT_MEDIA_CAPTION, Decision.EDIT_MARKUP]
+    assert (3, Decision.EDIT_MEDIA) in applied
+
+
+__all__ = ["assent", "cadence", "gallery", "mould", "rebuff", "refuse", "sweep", "veto"]
@@ -14,6 +14,7 @@ from .router import (
     configure_retreat,
     create_retreat_callback,
     router,
+    shutdown,
 )
 from .scope import outline
 
@@ -33,4 +34,5 @@ __all__ = [
     "instrument_for_router",
     "NavigatorMiddleware",
     "outline",
+    "shutdown",
 ]
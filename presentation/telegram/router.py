@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from aiogram import F, Router
 
+from navigator.app.service.shutdown import shutdown
 from navigator.presentation.telegram.back import NavigatorBack
 from navigator.presentation.telegram.back.callbacks import RetreatCallback
 from navigator.presentation.telegram.back.dependencies import RetreatDependencies
@@ -14,6 +15,7 @@ from navigator.presentation.telegram.back.setup import (
 )
 
 router = Router(name="navigator_handlers")
+router.shutdown.register(shutdown)
 
 BACK_CALLBACK_DATA = "back"
 
@@ -73,4 +75,5 @@ __all__ = [
     "configure_retreat",
     "create_retreat_callback",
     "retreat_configurator",
+    "shutdown",
 ]
@@ -7,14 +7,28 @@ from collections.abc import Callable
 from manual import (
     absence,
     assent,
+    backlog,
+    bundle,
+    cadence,
     commerce,
     decline,
+    deluge,
     fragments,
+    gallery,
+    ledger,
+    mould,
     rebuff,
     refuse,
     reliance,
+    replica,
+    rival,
     siren,
+    straggler,
+    stranger,
     surface,
+    sweep,
+    tenure,
+    vacancy,
     translation,
     veto,
     wording,
@@ -24,14 +38,28 @@ from manual import (
 _SCENARIOS: dict[str, Callable[[], None]] = {
     "absence": absence,
     "assent": assent,
+    "backlog": backlog,
+    "bundle": bundle,
+    "cadence": cadence,
     "commerce": commerce,
     "decline": decline,
+    "deluge": deluge,
     "fragments": fragments,
+    "gallery": gallery,
+    "ledger": ledger,
+    "mould": mould,
     "rebuff": rebuff,
     "refuse": refuse,
     "reliance": reliance,
+    "replica": replica,
+    "rival": rival,
     "siren": siren,
+    "straggler": straggler,
+    "stranger": stranger,
     "surface": surface,
+    "sweep": sweep,
+    "tenure": tenure,
+    "vacancy": vacancy,
     "translation": translation,
     "veto": veto,
     "wording": wording,